@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import requests
+from requests import Response
+
+from client.apple_tv.attributes import get_country, get_umc_id
+from client.apple_tv.content import (
+    get_background_url,
+    get_content,
+    get_logo_url,
+    get_poster_url,
+    parse_content_attributes,
+)
+from models.countries import get_language_code
+from utils.rate_governor import RateGovernor, default_governor
+
+if TYPE_CHECKING:
+    from client.apple_tv.attributes import Attributes
+
+logger = logging.getLogger(__name__)
+
+UTS_API_URL = "https://uts-api.itunes.apple.com/uts/v3"
+
+# Public parameters sent by the Apple TV web app. Its `utsk` key rotates with
+# the app releases, so it is given by the caller
+WEB_APP_PARAMS = {
+    "caller": "web",
+    "pfm": "web",
+    "v": "58",
+    "utscf": "OjAAAAAAAAA~",
+}
+
+STOREFRONT_IDS = {
+    "us": "143441",
+    "fr": "143442",
+    "de": "143443",
+    "gb": "143444",
+    "be": "143446",
+    "it": "143450",
+    "lu": "143451",
+    "es": "143454",
+    "ca": "143455",
+    "ch": "143459",
+    "au": "143460",
+    "nz": "143461",
+}
+
+
+class AppleTVAPIRequester:
+    """
+    Client for the JSON endpoints used by the Apple TV web app.
+    One content lookup by umc id replaces the page and person collections loads.
+    `utsk` is the key the web app currently sends with its requests.
+    """
+
+    def __init__(
+        self,
+        utsk: str,
+        api_url: str = UTS_API_URL,
+        timeout_s: float = 10.0,
+        governor: RateGovernor | None = None,
+    ) -> None:
+        self.params = {**WEB_APP_PARAMS, "utsk": utsk}
+        self.api_url = api_url.rstrip("/")
+        self.timeout_s = timeout_s
+        self.session = requests.Session()
+        self.governor = governor or default_governor
+
+    def get_artworks(
+        self, url: str
+    ) -> tuple[Attributes, str | None, str | None, str | None] | None:
+        """
+        Same output as `get_apple_tv_artworks` for an Apple TV movie URL, or None
+        when the content lookup or its attributes are not available so callers
+        can scrape the page.
+        """
+        umc_id = get_umc_id(url)
+        country = get_country(url)
+        if not umc_id or not country:
+            return None
+
+        content = self.get_movie_content(umc_id, country)
+        if content is None:
+            return None
+
+        attributes = parse_content_attributes(content)
+        if attributes is None:
+            return None
+
+        return (
+            attributes,
+            get_poster_url(content),
+            get_background_url(content),
+            get_logo_url(content),
+        )
+
+    def get_movie_content(self, umc_id: str, country: str) -> dict | None:
+        storefront_id = STOREFRONT_IDS.get(country)
+        if storefront_id is None:
+            return None
+
+        # Titles must be in the storefront language to be validated
+        locale = f"{get_language_code(country)}-{country.upper()}"
+        endpoint = f"movies/{umc_id}"
+        params = {**self.params, "sf": storefront_id, "locale": locale}
+        response = self.get(endpoint, params)
+        if response is None:
+            return None
+
+        try:
+            return get_content(response.json())
+        except ValueError:
+            logger.warning(f"Invalid JSON returned for {umc_id} ({country})")
+            return None
+
+    def get(self, endpoint: str, params: dict) -> Response | None:
+        url = f"{self.api_url}/{endpoint}"
+        try:
+            with self.governor.slot(url) as slot:
+                response = self.session.get(url, params=params, timeout=self.timeout_s)
+                slot.observe(response)
+            response.raise_for_status()
+            return response
+        except requests.exceptions.RequestException as e:
+            logger.error(f"{e}")
+            return None
@@ -1,12 +1,17 @@
+from __future__ import annotations
+
 import json
 import re
-from typing import TypedDict, cast
+from typing import TYPE_CHECKING, TypedDict, cast
 
 from bs4 import BeautifulSoup
 
 from utils.parsing import parse_html
 from utils.requests_utils import get_request
 
+if TYPE_CHECKING:
+    from client.apple_tv.pages import PageCache
+
 
 class Person(TypedDict):
     type: str
@@ -25,6 +30,7 @@ class Attributes(TypedDict):
 
 
 UMC_PATTERN = re.compile(r"(umc\.[A-Za-z0-9._-]+)")
+COUNTRY_PATTERN = re.compile(r"^https?://[^/]+/([a-z]{2,3})/")
 
 
 def get_umc_id(url: str) -> str | None:
@@ -42,12 +48,53 @@ def get_umc_id(url: str) -> str | None:
     return match.group(1)
 
 
-def get_attributes(url: str) -> Attributes | None:
+def get_country(url: str) -> str | None:
+    """
+    Extract the storefront country code from an Apple TV URL, or None if not found.
+
+    Example
+    -------
+    https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345
+    -> us
+    """
+    match = COUNTRY_PATTERN.match(url)
+    if not match:
+        return None
+    return match.group(1)
+
+
+def get_country_url(url: str, country: str) -> str | None:
+    """
+    Build the URL of the same Apple TV page in another storefront, or None if the
+    URL has no country prefix. The umc id is shared by all storefronts.
+
+    Example
+    -------
+    https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345, fr
+    -> https://tv.apple.com/fr/movie/the-matrix/umc.cmc.4xyz12345
+    """
+    match = COUNTRY_PATTERN.match(url)
+    if not match:
+        return None
+    return f"{url[: match.start(1)]}{country}{url[match.end(1):]}"
+
+
+def fetch_page(url: str) -> BeautifulSoup | None:
     response = get_request(url)
     if response is None:
         return None
+    return parse_html(response.text)
+
+
+def get_attributes(url: str, page_cache: PageCache | None = None) -> Attributes | None:
+    if page_cache is not None:
+        page = page_cache.get(url)
+        return page.attributes if page is not None else None
+
+    parsed_page = fetch_page(url)
+    if parsed_page is None:
+        return None
 
-    parsed_page = parse_html(response.text)
     return parse_attributes(parsed_page)
 
 
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from client.apple_tv.attributes import Attributes
+
+"""
+Subset of the content returned by the Apple TV web app for a movie:
+{
+    "id": "umc.cmc.4xyz12345",
+    "type": "Movie",
+    "title": "The Matrix",
+    "description": "...",
+    "releaseDate": 922838400000,
+    "rolesSummary": {"directors": ["Lana Wachowski", "Lilly Wachowski"], "cast": [...]},
+    "images": {
+        "coverArt": {
+            "url": "https://is1-ssl.mzstatic.com/image/thumb/.../{w}x{h}{c}.{f}",
+            "width": 2000,
+            "height": 3000,
+        },
+        "centeredFullScreenBackgroundImage": {...},
+        "fullColorContentLogo": {...},
+    },
+}
+"""
+
+POSTER_IMAGES = ("coverArt",)
+BACKGROUND_IMAGES = ("centeredFullScreenBackgroundImage", "previewFrame")
+LOGO_IMAGES = ("fullColorContentLogo", "singleColorContentLogo")
+
+
+def get_content(response_json: dict) -> dict | None:
+    content = (response_json.get("data") or {}).get("content")
+    return content if isinstance(content, dict) else None
+
+
+def get_poster_url(content: dict) -> str | None:
+    return get_image_url(content, POSTER_IMAGES, "jpg")
+
+
+def get_background_url(content: dict) -> str | None:
+    return get_image_url(content, BACKGROUND_IMAGES, "jpg")
+
+
+def get_logo_url(content: dict) -> str | None:
+    return get_image_url(content, LOGO_IMAGES, "png")
+
+
+def get_image_url(content: dict, names: tuple[str, ...], extension: str) -> str | None:
+    """Fill the template of the first available image at its native size."""
+    images = content.get("images") or {}
+    for name in names:
+        image = images.get(name)
+        if image and image.get("url"):
+            return fill_image_template(image, extension)
+    return None
+
+
+def fill_image_template(image: dict, extension: str) -> str | None:
+    width, height = image.get("width"), image.get("height")
+    if not width or not height:
+        return None
+
+    return (
+        image["url"]
+        .replace("{w}", str(width))
+        .replace("{h}", str(height))
+        .replace("{c}", "")
+        .replace("{f}", extension)
+    )
+
+
+def parse_content_attributes(content: dict) -> Attributes | None:
+    """Project the content on the JSON-LD attributes used to validate a page."""
+    title = content.get("title")
+    if not title:
+        return None
+
+    directors = (content.get("rolesSummary") or {}).get("directors") or []
+    attributes = {
+        "context": "",
+        "type": content.get("type", "Movie"),
+        "name": title,
+        "description": content.get("description", ""),
+        "actor": [],
+        "director": [{"type": "Person", "name": name} for name in directors],
+        "datePublished": parse_release_date(content.get("releaseDate")),
+        "image": get_poster_url(content) or "",
+    }
+    return cast("Attributes", attributes)
+
+
+def parse_release_date(timestamp_ms: int | None) -> str:
+    if not timestamp_ms:
+        return ""
+    release_date = datetime.fromtimestamp(timestamp_ms / 1000, tz=timezone.utc)
+    return release_date.strftime("%Y-%m-%d")
@@ -1,33 +1,119 @@
+from __future__ import annotations
+
 import re
-import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from urllib.parse import urlparse, urlsplit, urlunsplit
 
 from bs4 import BeautifulSoup
 
-from client.apple_tv.attributes import Attributes, get_umc_id, parse_attributes
+from client.apple_tv.attributes import (
+    Attributes,
+    fetch_page,
+    get_country,
+    get_umc_id,
+    parse_attributes,
+)
+from client.apple_tv.poster import PosterResolver, PosterStage, is_portrait_image_url
+from client.itunes.extract import get_itunes_artworks
 from utils.parsing import parse_html
 from utils.requests_utils import get_request
 
+if TYPE_CHECKING:
+    from client.apple_tv.pages import PageCache
+
+
+@dataclass(frozen=True, slots=True)
+class ApplePage:
+    """Fields read from an Apple TV page, so its parsed tree can be dropped."""
+
+    attributes: Attributes | None
+    background_url: str | None
+    logo_url: str | None
+    person_urls: list[str]
+
+
+def read_page(page: BeautifulSoup) -> ApplePage:
+    return ApplePage(
+        attributes=parse_attributes(page),
+        background_url=get_background_url(page),
+        logo_url=get_logo_url(page),
+        person_urls=get_person_urls(page),
+    )
+
+
+def load_page(url: str) -> ApplePage | None:
+    parsed_page = fetch_page(url)
+    if parsed_page is None:
+        return None
+    return read_page(parsed_page)
+
 
 def get_apple_tv_artworks(
     url: str,
+    poster_resolver: PosterResolver | None = None,
+    page_cache: PageCache | None = None,
 ) -> tuple[Attributes | None, str | None, str | None, str | None]:
-    response = get_request(url)
-    if response is None:
+    page = page_cache.get(url) if page_cache else load_page(url)
+    if page is None:
         return None, None, None, None
 
-    parsed_page = parse_html(response.text)
-
-    attributes = parse_attributes(parsed_page)
+    attributes = page.attributes
     if attributes is None:
         return None, None, None, None
 
-    time.sleep(0.5)  # Wait before next request needed for poster extraction
-    poster_url = get_poster_url(parsed_page, url)
-    background_url = get_background_url(parsed_page)
-    logo_url = get_logo_url(parsed_page)
+    poster_resolver = poster_resolver or build_poster_resolver()
+    poster_url = poster_resolver.resolve(page, url, attributes)
+
+    return attributes, poster_url, page.background_url, page.logo_url
 
-    return attributes, poster_url, background_url, logo_url
+
+def build_poster_resolver() -> PosterResolver:
+    """Poster chain: parsed page data (free) → iTunes lookup → person crawl."""
+    return PosterResolver(
+        [
+            PosterStage("page", cost=0, find=get_page_poster_url),
+            PosterStage("itunes", cost=1, find=get_itunes_poster_url),
+            PosterStage("person", cost=3, find=get_person_poster_url),
+        ]
+    )
+
+
+def get_page_poster_url(
+    page: ApplePage, url: str, attributes: Attributes
+) -> tuple[str | None, int]:
+    """Use the JSON-LD image when it is a portrait poster, no request needed."""
+    image_url = attributes.get("image")
+    if not image_url or not is_portrait_image_url(image_url):
+        return None, 0
+
+    return get_cover_art_url(attributes), 0
+
+
+def get_itunes_poster_url(
+    page: ApplePage, url: str, attributes: Attributes
+) -> tuple[str | None, int]:
+    """Match the page attributes against one iTunes search in the same storefront."""
+    country = get_country(url)
+    year = get_release_year(attributes)
+    title = attributes.get("name")
+    if not country or not year or not title:
+        return None, 0
+
+    directors = [person["name"] for person in attributes.get("director", [])]
+    _, poster_url, _ = get_itunes_artworks(title, directors, year, country)
+    return poster_url, 1
+
+
+def get_person_poster_url(
+    page: ApplePage, url: str, attributes: Attributes
+) -> tuple[str | None, int]:
+    return get_poster_url(page.person_urls, url)
+
+
+def get_release_year(attributes: Attributes) -> int | None:
+    match = re.match(r"^(\d{4})", attributes.get("datePublished") or "")
+    return int(match.group(1)) if match else None
 
 
 def get_cover_art_url(attributes: Attributes) -> str | None:
@@ -38,24 +124,31 @@ def get_cover_art_url(attributes: Attributes) -> str | None:
     return get_enlarged_image_url(image_url, "2000x0w.jpg")
 
 
-def get_poster_url(page: BeautifulSoup, url: str, max_persons: int = 3) -> str | None:
+def get_person_urls(page: BeautifulSoup) -> list[str]:
+    pattern = re.compile(r"^person-lockup")
+    return [person["href"] for person in page.find_all("a", class_=pattern, href=True)]
+
+
+def get_poster_url(
+    person_urls: list[str], url: str, max_persons: int = 3
+) -> tuple[str | None, int]:
+    """Crawl the movies collection of the first persons. Returns (url, requests)."""
     movie_umc_id = get_umc_id(url)
     if not movie_umc_id:
-        return None
+        return None, 0
 
-    pattern = re.compile(r"^person-lockup")
-    crew = page.find_all("a", class_=pattern, href=True)
-    if not crew:
-        return None
+    if not person_urls:
+        return None, 0
 
-    crew_to_test = crew[:max_persons]  # Limit to first max_persons persons only
-    for person in crew_to_test:
-        person_url = person["href"]
+    request_count = 0
+    # Limit to first max_persons persons only
+    for person_url in person_urls[:max_persons]:
+        request_count += 1
         poster_url = get_poster_from_person(person_url, movie_umc_id)
         if poster_url:
-            return poster_url
+            return poster_url, request_count
 
-        time.sleep(1.0)  # Be nice to Apple servers
+    return None, request_count
 
 
 def get_poster_from_person(person_url: str, movie_umc_id: str) -> str | None:
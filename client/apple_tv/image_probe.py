@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+import requests
+
+from client.apple_tv.extract import get_enlarged_image_url
+from utils.image_utils import read_image_format, read_image_header
+from utils.rate_governor import RateGovernor, default_governor
+
+logger = logging.getLogger(__name__)
+
+# Candidate sizes per artwork type, largest first
+ARTWORK_SIZES = {
+    "poster": ["2000x0w.jpg", "1500x0w.jpg", "1000x0w.jpg"],
+    "background": ["4320x3240.jpg", "2880x2160.jpg", "1920x1440.jpg"],
+    "logo": ["2400x900.png", "1600x600.png", "800x300.png"],
+}
+
+
+@dataclass(slots=True)
+class ImageInfo:
+    """
+    Probed image. Width and height are 0 when the dimensions lie beyond the
+    probed bytes: the image is served but its size is unknown.
+    """
+
+    url: str
+    format: str
+    width: int
+    height: int
+
+    @property
+    def area(self) -> int:
+        return self.width * self.height
+
+
+# Probe result when a variant could not be checked: network error, 429 or 5xx
+PROBE_FAILED = ImageInfo("", "", 0, 0)
+
+
+class ImageProber:
+    """
+    Checks image variants before they are sent to Plex by downloading only their
+    first bytes (HTTP Range), and keeps the largest variant actually served.
+    Meant for the Apple artworks kept for a movie, not every candidate.
+    """
+
+    def __init__(
+        self,
+        *,
+        session: requests.Session | None = None,
+        probe_bytes: int = 32768,
+        max_workers: int = 4,
+        timeout_s: float = 10.0,
+        governor: RateGovernor | None = None,
+    ) -> None:
+        self.session = session or requests.Session()
+        self.governor = governor or default_governor
+        self.probe_bytes = probe_bytes
+        self.max_workers = max_workers
+        self.timeout_s = timeout_s
+
+    def select_artwork(self, url: str | None, artwork_type: str) -> str | None:
+        """Return the largest valid variant of an Apple artwork URL, or None."""
+        if url is None:
+            return None
+
+        candidates = [
+            get_enlarged_image_url(url, size) for size in ARTWORK_SIZES[artwork_type]
+        ]
+        infos = self.probe_all(candidates)
+        if any(info is PROBE_FAILED for info in infos):
+            logger.debug(f"Could not check every {artwork_type} variant of {url}")
+            return url
+        # Sizes cannot be compared: keep the URL found on the page
+        if any(info is not None and not info.area for info in infos):
+            return url
+
+        best = self.get_largest(infos)
+        if best is None:
+            logger.warning(f"No valid {artwork_type} variant served for {url}")
+            return None
+        return best.url
+
+    def probe_all(self, urls: list[str]) -> list[ImageInfo | None]:
+        """Probe all URLs concurrently."""
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(self.probe, urls))
+
+    @staticmethod
+    def get_largest(infos: list[ImageInfo | None]) -> ImageInfo | None:
+        best: ImageInfo | None = None
+        for info in infos:
+            if info is not None and (best is None or info.area > best.area):
+                best = info
+        return best
+
+    def probe(self, url: str) -> ImageInfo | None:
+        """
+        Return the image served at `url`, None when the server rejects it
+        (4xx) or serves something else, or PROBE_FAILED when it cannot tell.
+        """
+        headers = {"Range": f"bytes=0-{self.probe_bytes - 1}"}
+        try:
+            with self.governor.slot(url) as slot, self.session.get(
+                url, headers=headers, stream=True, timeout=self.timeout_s
+            ) as response:
+                slot.observe(response)
+                status = response.status_code
+                if 400 <= status < 500 and status != 429:
+                    return None
+                if status not in (200, 206):
+                    return PROBE_FAILED
+                # Servers ignoring the Range header are cut after the first chunk
+                data = next(response.iter_content(self.probe_bytes), b"")
+        except requests.RequestException as e:
+            logger.debug(f"Image probe failed for {url}: {e}")
+            return PROBE_FAILED
+
+        header = read_image_header(data)
+        if header is None:
+            # A full window of image data: the dimensions come after it
+            image_format = read_image_format(data)
+            if (
+                len(data) < self.probe_bytes
+                or image_format is None
+                or not url.endswith(f".{image_format}")
+            ):
+                return None
+            return ImageInfo(url, image_format, 0, 0)
+
+        image_format, width, height = header
+        if not url.endswith(f".{image_format}") or not width or not height:
+            return None
+
+        return ImageInfo(url, image_format, width, height)
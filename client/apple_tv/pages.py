@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections import OrderedDict
+
+from client.apple_tv.extract import ApplePage, load_page
+
+logger = logging.getLogger(__name__)
+
+
+class _Fetch:
+    """A page being fetched, shared by the callers waiting for it."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.page: ApplePage | None = None
+
+
+class PageCache:
+    """
+    Per-run memo of Apple TV pages, keyed by URL.
+
+    Only the fields read from a page are kept, in an LRU of `max_size` pages.
+    Concurrent callers asking for the same URL wait for a single fetch instead
+    of downloading and parsing the page again. Failed fetches are not memoized,
+    so the next caller tries again.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self._pages: OrderedDict[str, ApplePage] = OrderedDict()
+        self._inflight: dict[str, _Fetch] = {}
+        self._lock = threading.Lock()
+        self.fetches = 0
+        self.reuses = 0
+
+    def get(self, url: str) -> ApplePage | None:
+        with self._lock:
+            page = self._pages.get(url)
+            if page is not None:
+                self._pages.move_to_end(url)
+                self.reuses += 1
+                return page
+
+            fetch = self._inflight.get(url)
+            is_leader = fetch is None
+            if is_leader:
+                fetch = _Fetch()
+                self._inflight[url] = fetch
+                self.fetches += 1
+            else:
+                self.reuses += 1
+
+        if not is_leader:
+            fetch.done.wait()
+            return fetch.page
+
+        try:
+            fetch.page = load_page(url)
+        finally:
+            with self._lock:
+                if fetch.page is not None:
+                    self._pages[url] = fetch.page
+                    if len(self._pages) > self.max_size:
+                        self._pages.popitem(last=False)
+                del self._inflight[url]
+            fetch.done.set()
+
+        return fetch.page
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pages.clear()
+
+    def log_stats(self) -> None:
+        """Log fetch/reuse counts and drop the memoized pages: the memo lives for one run."""
+        if self.fetches:
+            logger.info(f"Apple TV pages: {self.fetches} fetched, {self.reuses} reused")
+        self.fetches = 0
+        self.reuses = 0
+        self.clear()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import logging
+import re
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from client.apple_tv.attributes import Attributes
+    from client.apple_tv.extract import ApplePage
+
+logger = logging.getLogger(__name__)
+
+# (page, url, attributes) -> (poster_url, number of requests spent)
+PosterFinder = Callable[["ApplePage", str, "Attributes"], tuple[str | None, int]]
+
+SIZE_PATTERN = re.compile(r"/(\d+)x(\d+)[a-z]*\.\w+$")
+
+
+@dataclass(slots=True)
+class PosterStage:
+    name: str
+    cost: int  # expected number of requests
+    find: PosterFinder
+    attempts: int = 0
+    hits: int = 0
+    requests: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        return self.hits / self.attempts if self.attempts else 0.0
+
+    def reset(self) -> None:
+        self.attempts = 0
+        self.hits = 0
+        self.requests = 0
+
+
+class PosterResolver:
+    """
+    Resolves a movie poster through stages ordered from cheapest to most expensive.
+    Later stages are skipped as soon as one stage returns a poster.
+    """
+
+    def __init__(self, stages: list[PosterStage]) -> None:
+        self.stages = sorted(stages, key=lambda stage: stage.cost)
+
+    def resolve(self, page: ApplePage, url: str, attributes: Attributes) -> str | None:
+        for stage in self.stages:
+            stage.attempts += 1
+            poster_url, request_count = stage.find(page, url, attributes)
+            stage.requests += request_count
+            if poster_url:
+                stage.hits += 1
+                logger.debug(f"Poster resolved by '{stage.name}' stage for {url}")
+                return poster_url
+
+        return None
+
+    def log_stats(self) -> None:
+        """Log per-stage request cost and success rate, then reset counters."""
+        for stage in self.stages:
+            if stage.attempts:
+                logger.info(
+                    f"Poster stage '{stage.name}': {stage.hits}/{stage.attempts} found "
+                    f"({stage.success_rate:.0%}), {stage.requests} requests"
+                )
+            stage.reset()
+
+
+def is_portrait_image_url(url: str) -> bool:
+    """
+    Check from the size encoded in an Apple image URL that the image is portrait.
+
+    Example
+    -------
+    https://is1-ssl.mzstatic.com/image/thumb/.../1200x1800.jpg -> True
+    https://is1-ssl.mzstatic.com/image/thumb/.../1200x675.jpg -> False
+    """
+    match = SIZE_PATTERN.search(url)
+    if not match:
+        return False
+    width, height = int(match.group(1)), int(match.group(2))
+    return height > width
@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import gzip
+import re
+import xml.etree.ElementTree as ET
+from collections.abc import Iterator
+from pathlib import Path
+from typing import NamedTuple
+
+URL_PATTERN = (
+    r"^https?://tv\.apple\.com/([a-z]{2,3})/(movie|show)/"
+    r"([^/?#]+)/(umc\.cm[cp]\.[\w.]+)/?$"
+)
+
+
+class SitemapUrl(NamedTuple):
+    country: str
+    entity: str
+    slug: str
+    umc_id: str
+
+
+def parse_url(url: str) -> SitemapUrl | None:
+    match = re.match(URL_PATTERN, url.strip())
+    return SitemapUrl(*match.groups()) if match else None
+
+
+def iter_sitemap_urls(path: str | Path) -> Iterator[SitemapUrl]:
+    """
+    Stream the Apple TV title URLs of a sitemap file (.xml or .xml.gz).
+    Sitemap index entries and non-title URLs are skipped.
+    """
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rb") as file:
+        for _, element in ET.iterparse(file):
+            if element.tag.endswith("loc") and element.text:
+                if url := parse_url(element.text):
+                    yield url
+            element.clear()
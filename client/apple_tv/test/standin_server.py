@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+FIXTURES_PATH = Path(__file__).parent / "fixtures"
+
+
+class StandInServer:
+    """
+    Local stand-in for the Apple TV web app JSON endpoints.
+    Serves `movies/{umc_id}` from `fixtures/{umc_id}.json` and records requests.
+    """
+
+    def __init__(self, fixtures_path: Path = FIXTURES_PATH) -> None:
+        self.fixtures_path = fixtures_path
+        self.requests: list[tuple[str, dict[str, list[str]]]] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._build_handler())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def api_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/uts/v3"
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def _build_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                server.requests.append((parts.path, parse_qs(parts.query)))
+
+                umc_id = parts.path.rsplit("/", 1)[-1]
+                fixture = server.fixtures_path / f"{umc_id}.json"
+                if not parts.path.startswith("/uts/v3/movies/") or not fixture.exists():
+                    self.send_error(404)
+                    return
+
+                body = fixture.read_bytes()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                return None
+
+        return Handler
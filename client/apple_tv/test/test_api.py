@@ -0,0 +1,75 @@
+import unittest
+
+from client.apple_tv.api import AppleTVAPIRequester
+from client.apple_tv.test.standin_server import StandInServer
+from utils.rate_governor import HostPolicy, RateGovernor
+
+FR_URL = "https://tv.apple.com/fr/movie/the-matrix/umc.cmc.4xyz12345"
+IMAGE_BASE = "https://is1-ssl.mzstatic.com/image/thumb/Video/v4/aa/bb/cc"
+
+
+class TestAppleTVAPIRequester(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = StandInServer()
+        cls.server.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+
+    def setUp(self):
+        self.server.requests.clear()
+        unlimited = HostPolicy(rate=float("inf"), max_rate=float("inf"))
+        self.requester = AppleTVAPIRequester(
+            "test-key",
+            api_url=self.server.api_url,
+            governor=RateGovernor({}, unlimited),
+        )
+
+    def test_get_artworks(self):
+        attributes, poster_url, background_url, logo_url = self.requester.get_artworks(
+            FR_URL
+        ) or (None, None, None, None)
+
+        self.assertIsNotNone(attributes)
+        assert attributes is not None
+        self.assertEqual(attributes["name"], "The Matrix")
+        self.assertEqual(attributes["datePublished"], "1999-03-31")
+        self.assertEqual(
+            [person["name"] for person in attributes["director"]],
+            ["Lana Wachowski", "Lilly Wachowski"],
+        )
+        self.assertEqual(poster_url, f"{IMAGE_BASE}/poster.lsr/2000x3000.jpg")
+        self.assertEqual(background_url, f"{IMAGE_BASE}/background.lsr/4320x3240.jpg")
+        self.assertEqual(logo_url, f"{IMAGE_BASE}/logo.png/2400x900.png")
+
+    def test_storefront_and_locale_sent(self):
+        self.requester.get_artworks(FR_URL)
+
+        self.assertEqual(len(self.server.requests), 1)
+        path, params = self.server.requests[0]
+        self.assertEqual(path, "/uts/v3/movies/umc.cmc.4xyz12345")
+        self.assertEqual(params["sf"], ["143442"])
+        self.assertEqual(params["locale"], ["fr-FR"])
+        self.assertEqual(params["utsk"], ["test-key"])
+
+    def test_unknown_movie(self):
+        url = "https://tv.apple.com/fr/movie/unknown/umc.cmc.unknown"
+        self.assertIsNone(self.requester.get_artworks(url))
+
+    def test_response_without_data(self):
+        url = "https://tv.apple.com/fr/movie/null/umc.cmc.nulldata"
+        self.assertIsNone(self.requester.get_artworks(url))
+
+    def test_content_without_attributes_falls_back_to_page(self):
+        url = "https://tv.apple.com/fr/movie/untitled/umc.cmc.untitled"
+        self.assertIsNone(self.requester.get_artworks(url))
+
+    def test_url_without_umc_id(self):
+        self.assertIsNone(self.requester.get_artworks("https://tv.apple.com/fr/"))
+        self.assertEqual(self.server.requests, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,6 @@
 import unittest
 
-from client.apple_tv.attributes import get_umc_id
+from client.apple_tv.attributes import get_country, get_country_url, get_umc_id
 
 
 class TestAttributes(unittest.TestCase):
@@ -38,6 +38,23 @@ class TestAttributes(unittest.TestCase):
         self.assertIsNone(get_umc_id("not a url"))
         self.assertIsNone(get_umc_id("https://tv.apple.com/us/movie/the-matrix/umc."))
 
+    def test_get_country(self):
+        self.assertEqual(
+            get_country("https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345"),
+            "us",
+        )
+        self.assertIsNone(get_country("https://www.apple.com"))
+        self.assertIsNone(get_country(""))
+
+    def test_get_country_url(self):
+        self.assertEqual(
+            get_country_url(
+                "https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345", "fr"
+            ),
+            "https://tv.apple.com/fr/movie/the-matrix/umc.cmc.4xyz12345",
+        )
+        self.assertIsNone(get_country_url("not a url", "fr"))
+
 
 if __name__ == "__main__":
     unittest.main()
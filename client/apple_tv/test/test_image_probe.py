@@ -0,0 +1,132 @@
+import struct
+import unittest
+from unittest.mock import MagicMock
+
+import requests
+
+from client.apple_tv.image_probe import ImageProber
+from utils.image_utils import read_image_header
+from utils.rate_governor import HostPolicy, RateGovernor
+
+UNLIMITED = HostPolicy(rate=float("inf"), max_rate=float("inf"))
+
+BASE_URL = "https://is1-ssl.mzstatic.com/image/thumb/Video/v4/ab/cd/source"
+
+
+def png_header(width: int, height: int) -> bytes:
+    ihdr = struct.pack(">II", width, height) + b"\x08\x06\x00\x00\x00"
+    return b"\x89PNG\r\n\x1a\n" + struct.pack(">I", 13) + b"IHDR" + ihdr
+
+
+def jpeg_header(width: int, height: int) -> bytes:
+    app0 = b"\xff\xe0" + struct.pack(">H", 16) + b"JFIF\x00" + b"\x00" * 9
+    sof0 = b"\xff\xc0" + struct.pack(">HBHH", 17, 8, height, width) + b"\x00" * 10
+    return b"\xff\xd8" + app0 + sof0
+
+
+def fake_response(status_code: int, data: bytes) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.iter_content.return_value = iter([data])
+    response.__enter__.return_value = response
+    return response
+
+
+class TestReadImageHeader(unittest.TestCase):
+    def test_png(self):
+        self.assertEqual(read_image_header(png_header(2400, 900)), ("png", 2400, 900))
+
+    def test_jpeg(self):
+        self.assertEqual(
+            read_image_header(jpeg_header(2000, 3000)), ("jpg", 2000, 3000)
+        )
+
+    def test_unknown_or_truncated(self):
+        self.assertIsNone(read_image_header(b"<html>Not found</html>"))
+        self.assertIsNone(read_image_header(jpeg_header(2000, 3000)[:20]))
+        self.assertIsNone(read_image_header(b""))
+
+
+class TestImageProber(unittest.TestCase):
+    def test_select_largest_valid_variant(self):
+        responses = {
+            f"{BASE_URL}/2000x0w.jpg": fake_response(404, b""),
+            f"{BASE_URL}/1500x0w.jpg": fake_response(206, jpeg_header(1500, 2250)),
+            f"{BASE_URL}/1000x0w.jpg": fake_response(206, jpeg_header(1000, 1500)),
+        }
+        session = MagicMock()
+        session.get.side_effect = lambda url, **_: responses[url]
+        prober = ImageProber(session=session, governor=RateGovernor({}, UNLIMITED))
+
+        url = prober.select_artwork(f"{BASE_URL}/2000x0w.jpg", "poster")
+
+        self.assertEqual(url, f"{BASE_URL}/1500x0w.jpg")
+        for call in session.get.call_args_list:
+            self.assertEqual(call.kwargs["headers"], {"Range": "bytes=0-32767"})
+
+    def test_no_valid_variant(self):
+        session = MagicMock()
+        session.get.side_effect = lambda url, **_: fake_response(200, b"<html>")
+        prober = ImageProber(session=session, governor=RateGovernor({}, UNLIMITED))
+
+        self.assertIsNone(prober.select_artwork(f"{BASE_URL}/2400x900.png", "logo"))
+        self.assertIsNone(prober.select_artwork(None, "logo"))
+
+    def test_format_must_match_extension(self):
+        session = MagicMock()
+        session.get.side_effect = lambda url, **_: fake_response(
+            206, jpeg_header(2400, 900)
+        )
+        prober = ImageProber(session=session, governor=RateGovernor({}, UNLIMITED))
+
+        self.assertIsNone(prober.select_artwork(f"{BASE_URL}/2400x900.png", "logo"))
+
+    def test_header_beyond_probed_bytes_keeps_original_url(self):
+        # Metadata segment filling the whole window, the frame header comes later
+        app1 = b"\xff\xe1" + (65000).to_bytes(2, "big") + b"\x00" * 40000
+        responses = {
+            f"{BASE_URL}/2000x0w.jpg": fake_response(206, (b"\xff\xd8" + app1)[:32768]),
+            f"{BASE_URL}/1500x0w.jpg": fake_response(206, jpeg_header(1500, 2250)),
+            f"{BASE_URL}/1000x0w.jpg": fake_response(206, jpeg_header(1000, 1500)),
+        }
+        session = MagicMock()
+        session.get.side_effect = lambda url, **_: responses[url]
+        prober = ImageProber(session=session, governor=RateGovernor({}, UNLIMITED))
+
+        url = prober.select_artwork(f"{BASE_URL}/2000x0w.jpg", "poster")
+
+        self.assertEqual(url, f"{BASE_URL}/2000x0w.jpg")
+
+    def test_probe_failure_keeps_original_url(self):
+        responses = {
+            f"{BASE_URL}/2000x0w.jpg": fake_response(503, b""),
+            f"{BASE_URL}/1500x0w.jpg": fake_response(206, jpeg_header(1500, 2250)),
+            f"{BASE_URL}/1000x0w.jpg": requests.ConnectionError(),
+        }
+
+        def get(url, **_):
+            response = responses[url]
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        session = MagicMock()
+        session.get.side_effect = get
+        prober = ImageProber(session=session, governor=RateGovernor({}, UNLIMITED))
+
+        url = prober.select_artwork(f"{BASE_URL}/2000x0w.jpg", "poster")
+
+        self.assertEqual(url, f"{BASE_URL}/2000x0w.jpg")
+
+    def test_truncated_image_is_invalid(self):
+        session = MagicMock()
+        session.get.side_effect = lambda url, **_: fake_response(
+            206, jpeg_header(2000, 3000)[:20]
+        )
+        prober = ImageProber(session=session, governor=RateGovernor({}, UNLIMITED))
+
+        self.assertIsNone(prober.select_artwork(f"{BASE_URL}/2000x0w.jpg", "poster"))
+
+
+if __name__ == "__main__":
+    unittest.main()
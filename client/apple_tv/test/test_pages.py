@@ -0,0 +1,110 @@
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from client.apple_tv.extract import read_page
+from client.apple_tv.pages import PageCache
+from utils.parsing import parse_html
+
+URL = "https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345"
+
+PAGE_HTML = """
+<script id="schema:movie" type="application/ld+json">
+{"@type": "Movie", "name": "The Matrix", "datePublished": "1999-03-31"}
+</script>
+<picture class="svelte-1"><source srcset="https://is1.mzstatic.com/a/1x1.jpg 1w"></picture>
+<picture class="picture-1"><source srcset="https://is1.mzstatic.com/b/1x1.png 1w"></picture>
+<a class="person-lockup" href="https://tv.apple.com/us/person/lana/umc.cpc.1">Lana</a>
+"""
+
+
+class TestReadPage(unittest.TestCase):
+    def test_fields_are_read_from_page(self):
+        page = read_page(parse_html(PAGE_HTML))
+
+        self.assertEqual(page.attributes["name"], "The Matrix")
+        self.assertEqual(
+            page.background_url, "https://is1.mzstatic.com/a/4320x3240.jpg"
+        )
+        self.assertEqual(page.logo_url, "https://is1.mzstatic.com/b/2400x900.png")
+        self.assertEqual(
+            page.person_urls, ["https://tv.apple.com/us/person/lana/umc.cpc.1"]
+        )
+
+
+class TestPageCache(unittest.TestCase):
+    @patch("client.apple_tv.pages.load_page")
+    def test_page_fetched_once(self, mock_load_page):
+        mock_load_page.return_value = "page"
+        cache = PageCache()
+
+        self.assertEqual(cache.get(URL), "page")
+        self.assertEqual(cache.get(URL), "page")
+
+        mock_load_page.assert_called_once_with(URL)
+        self.assertEqual((cache.fetches, cache.reuses), (1, 1))
+
+    @patch("client.apple_tv.pages.load_page")
+    def test_failed_fetch_is_retried(self, mock_load_page):
+        mock_load_page.side_effect = [None, "page"]
+        cache = PageCache()
+
+        self.assertIsNone(cache.get(URL))
+        self.assertEqual(cache.get(URL), "page")
+
+        self.assertEqual(mock_load_page.call_count, 2)
+
+    @patch("client.apple_tv.pages.load_page")
+    def test_least_recently_used_page_is_evicted(self, mock_load_page):
+        mock_load_page.side_effect = lambda url: f"page {url}"
+        cache = PageCache(max_size=2)
+
+        cache.get("a")
+        cache.get("b")
+        cache.get("a")
+        cache.get("c")
+        cache.get("a")
+        cache.get("b")
+
+        self.assertEqual(
+            [call.args[0] for call in mock_load_page.call_args_list],
+            ["a", "b", "c", "b"],
+        )
+
+    @patch("client.apple_tv.pages.load_page")
+    def test_concurrent_callers_share_one_fetch(self, mock_load_page):
+        def slow_load(url):
+            time.sleep(0.05)
+            return "page"
+
+        mock_load_page.side_effect = slow_load
+        cache = PageCache()
+        results = []
+
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get(URL)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ["page"] * 5)
+        mock_load_page.assert_called_once_with(URL)
+
+    @patch("client.apple_tv.pages.load_page")
+    def test_log_stats_clears_pages(self, mock_load_page):
+        mock_load_page.return_value = "page"
+        cache = PageCache()
+        cache.get(URL)
+
+        cache.log_stats()
+        cache.get(URL)
+
+        self.assertEqual(mock_load_page.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
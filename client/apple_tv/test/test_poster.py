@@ -0,0 +1,56 @@
+import unittest
+from unittest.mock import MagicMock
+
+from client.apple_tv.poster import PosterResolver, PosterStage, is_portrait_image_url
+
+
+class TestPosterResolver(unittest.TestCase):
+    def test_stops_at_first_stage_with_poster(self):
+        page_stage = PosterStage("page", 0, MagicMock(return_value=(None, 0)))
+        itunes_stage = PosterStage("itunes", 1, MagicMock(return_value=("itunes", 1)))
+        person_stage = PosterStage("person", 3, MagicMock(return_value=("person", 2)))
+        # Declared out of order on purpose, the resolver sorts by cost
+        resolver = PosterResolver([person_stage, itunes_stage, page_stage])
+
+        poster_url = resolver.resolve(MagicMock(), "url", {})
+
+        self.assertEqual(poster_url, "itunes")
+        person_stage.find.assert_not_called()
+        self.assertEqual((page_stage.attempts, page_stage.hits), (1, 0))
+        self.assertEqual((itunes_stage.attempts, itunes_stage.hits), (1, 1))
+        self.assertEqual(itunes_stage.requests, 1)
+        self.assertEqual(person_stage.attempts, 0)
+
+    def test_no_stage_finds_poster(self):
+        stages = [
+            PosterStage("page", 0, MagicMock(return_value=(None, 0))),
+            PosterStage("person", 3, MagicMock(return_value=(None, 3))),
+        ]
+        resolver = PosterResolver(stages)
+
+        self.assertIsNone(resolver.resolve(MagicMock(), "url", {}))
+        self.assertEqual(stages[1].requests, 3)
+        self.assertEqual(stages[1].success_rate, 0.0)
+
+    def test_log_stats_resets_counters(self):
+        stage = PosterStage("page", 0, MagicMock(return_value=("page", 0)))
+        resolver = PosterResolver([stage])
+        resolver.resolve(MagicMock(), "url", {})
+
+        resolver.log_stats()
+
+        self.assertEqual((stage.attempts, stage.hits, stage.requests), (0, 0, 0))
+
+
+class TestIsPortraitImageUrl(unittest.TestCase):
+    def test_is_portrait_image_url(self):
+        base = "https://is1-ssl.mzstatic.com/image/thumb/Video/v4/ab/cd/source"
+        self.assertTrue(is_portrait_image_url(f"{base}/1200x1800.jpg"))
+        self.assertTrue(is_portrait_image_url(f"{base}/600x900bb.jpg"))
+        self.assertFalse(is_portrait_image_url(f"{base}/1200x675.jpg"))
+        self.assertFalse(is_portrait_image_url(f"{base}/2000x0w.jpg"))
+        self.assertFalse(is_portrait_image_url(f"{base}/image.jpg"))
+
+
+if __name__ == "__main__":
+    unittest.main()
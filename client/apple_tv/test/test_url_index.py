@@ -0,0 +1,97 @@
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+
+from client.apple_tv.sitemap import SitemapUrl, iter_sitemap_urls, parse_url
+from client.apple_tv.url_index import UrlIndex, slugify
+from client.google.scoring import Scorer
+from models.target import Target
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345</loc></url>
+  <url><loc>https://tv.apple.com/us/movie/the-matrix-reloaded/umc.cmc.5abc</loc></url>
+  <url><loc>https://tv.apple.com/us/movie/heat/umc.cmc.1heat</loc></url>
+  <url><loc>https://tv.apple.com/us/movie/heat/umc.cmc.2heat</loc></url>
+  <url><loc>https://tv.apple.com/fr/movie/amelie/umc.cmc.6ame</loc></url>
+  <url><loc>https://tv.apple.com/us/person/michael-mann/umc.cpc.7mann</loc></url>
+</urlset>
+"""
+
+
+class TestSitemap(unittest.TestCase):
+    def test_parse_url(self):
+        self.assertEqual(
+            parse_url("https://tv.apple.com/us/movie/heat/umc.cmc.1heat"),
+            SitemapUrl("us", "movie", "heat", "umc.cmc.1heat"),
+        )
+        self.assertIsNone(parse_url("https://tv.apple.com/us/person/x/umc.cpc.1"))
+
+    def test_iter_gzipped_sitemap(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "sitemap.xml.gz"
+            path.write_bytes(gzip.compress(SITEMAP))
+
+            urls = list(iter_sitemap_urls(path))
+
+        self.assertEqual(len(urls), 5)
+        self.assertEqual(urls[-1], SitemapUrl("fr", "movie", "amelie", "umc.cmc.6ame"))
+
+
+class TestUrlIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        path = Path(self.tmp_dir.name) / "sitemap.xml"
+        path.write_bytes(SITEMAP)
+
+        self.url_index = UrlIndex(self.tmp_dir.name, "apple_tv_urls")
+        self.url_index.add_urls(iter_sitemap_urls(path))
+        self.scorer = Scorer()
+
+    def test_slugify(self):
+        self.assertEqual(slugify("Amélie"), "amelie")
+        self.assertEqual(slugify("Mission: Impossible"), "mission-impossible")
+
+    def test_resolve_exact_slug(self):
+        target = Target("The Matrix", [], 1999, "us", "movie")
+
+        urls = self.url_index.resolve(target, self.scorer)
+
+        self.assertEqual(
+            urls, ["https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345"]
+        )
+
+    def test_resolve_keeps_every_umc_id_of_a_slug(self):
+        target = Target("Heat", [], 1995, "us", "movie")
+
+        urls = self.url_index.resolve(target, self.scorer)
+
+        self.assertEqual(len(urls), 2)
+
+    def test_resolve_close_slug_through_trigrams(self):
+        target = Target("Amélie Poulin", [], 2001, "fr", "movie")
+        self.url_index.data["fr"]["movie"]["amelie-poulain"] = ["umc.cmc.8ame"]
+
+        urls = self.url_index.resolve(target, self.scorer)
+
+        # "amelie" shares trigrams too but its title score is too low
+        self.assertEqual(
+            urls, ["https://tv.apple.com/fr/movie/amelie-poulain/umc.cmc.8ame"]
+        )
+
+    def test_resolve_misses_other_country(self):
+        target = Target("The Matrix", [], 1999, "fr", "movie")
+        self.assertEqual(self.url_index.resolve(target, self.scorer), [])
+
+    def test_save_and_load(self):
+        self.url_index.save()
+
+        reloaded = UrlIndex(self.tmp_dir.name, "apple_tv_urls")
+
+        self.assertEqual(len(reloaded), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Iterable
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from client.google.parser import ItemView
+from client.google.scoring import REQUIRED_SCORE
+from client.google.utils import norm_text
+from utils.file_utils import load_json_file, save_json_file
+
+if TYPE_CHECKING:
+    from client.apple_tv.sitemap import SitemapUrl
+    from client.google.scoring import Scorer
+    from models.target import Target
+
+MIN_SLUG_SIMILARITY = 0.5
+
+
+def slugify(title: str) -> str:
+    return norm_text(title).replace("_", " ").replace(" ", "-")
+
+
+def get_trigrams(slug: str) -> set[str]:
+    padded = f"-{slug}-"
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class UrlIndex:
+    """
+    Apple TV title URLs collected from sitemap dumps, stored compactly as
+    {country: {entity: {slug: [umc ids]}}}. A slug trigram index is built in
+    memory per country/entity the first time it is searched.
+    """
+
+    def __init__(self, path: str, filename: str, max_candidates: int = 5) -> None:
+        self.filepath = str(Path(path) / f"{filename}.json")
+        self.max_candidates = max_candidates
+        self.data: dict[str, dict[str, dict[str, list[str]]]] = {}
+        self.trigrams: dict[tuple[str, str], dict[str, set[str]]] = {}
+        self.load()
+
+    def add_urls(self, urls: Iterable[SitemapUrl]) -> int:
+        """Add sitemap URLs, returning how many were new."""
+        added = 0
+        for url in urls:
+            slugs = self.data.setdefault(url.country, {}).setdefault(url.entity, {})
+            umc_ids = slugs.setdefault(url.slug, [])
+            if url.umc_id not in umc_ids:
+                umc_ids.append(url.umc_id)
+                added += 1
+        self.trigrams = {}
+        return added
+
+    def get_candidates(self, target: Target) -> list[tuple[str, str]]:
+        """(slug, url) pairs whose slug is closest to the target title."""
+        slugs = self.data.get(target.country, {}).get(target.entity, {})
+        if not slugs:
+            return []
+
+        slug = slugify(target.title)
+        if slug in slugs:
+            matches = [slug]
+        else:
+            matches = self._get_similar_slugs(target.country, target.entity, slug)
+
+        return [
+            (
+                match,
+                f"https://tv.apple.com/{target.country}/{target.entity}/{match}/{umc_id}",
+            )
+            for match in matches
+            for umc_id in slugs[match]
+        ]
+
+    def resolve(self, target: Target, scorer: Scorer) -> list[str]:
+        """
+        Candidate URLs scored with the CSE scorer, best first. Slugs only carry
+        the title, so a candidate must match it closely (REQUIRED_SCORE) and the
+        page still has to pass validation before being used.
+        """
+        scored = []
+        prepared = scorer.prepare(target)
+        for slug, url in self.get_candidates(target):
+            item = ItemView(url, slug.replace("-", " "), None, None)
+            score = scorer.compute_prepared(item, prepared)
+            if score is not None and score >= REQUIRED_SCORE:
+                scored.append((score, url))
+
+        scored.sort(key=lambda candidate: -candidate[0])
+        return [url for _, url in scored[: self.max_candidates]]
+
+    def _get_similar_slugs(self, country: str, entity: str, slug: str) -> list[str]:
+        index = self._get_trigram_index(country, entity)
+        trigrams = get_trigrams(slug)
+
+        overlaps: Counter[str] = Counter()
+        for trigram in trigrams:
+            overlaps.update(index.get(trigram, ()))
+
+        similar = []
+        for candidate, overlap in overlaps.items():
+            dice = 2 * overlap / (len(trigrams) + len(get_trigrams(candidate)))
+            if dice >= MIN_SLUG_SIMILARITY:
+                similar.append((dice, candidate))
+
+        similar.sort(reverse=True)
+        return [candidate for _, candidate in similar[: self.max_candidates]]
+
+    def _get_trigram_index(self, country: str, entity: str) -> dict[str, set[str]]:
+        key = (country, entity)
+        if key not in self.trigrams:
+            index: dict[str, set[str]] = {}
+            for slug in self.data.get(country, {}).get(entity, {}):
+                for trigram in get_trigrams(slug):
+                    index.setdefault(trigram, set()).add(slug)
+            self.trigrams[key] = index
+        return self.trigrams[key]
+
+    def load(self) -> None:
+        self.data = (
+            load_json_file(self.filepath) if Path(self.filepath).exists() else {}
+        )
+        self.trigrams = {}
+
+    def save(self) -> None:
+        # No indentation: sitemap dumps hold hundreds of thousands of titles
+        save_json_file(self.filepath, self.data, compact=True)
+
+    def __len__(self) -> int:
+        return sum(
+            len(umc_ids)
+            for entities in self.data.values()
+            for slugs in entities.values()
+            for umc_ids in slugs.values()
+        )
@@ -11,6 +11,12 @@ from client.google.utils import first_int4, normalize_url
 if TYPE_CHECKING:
     from client.apple_tv.attributes import Attributes
 
+# The only metatags parse_item_from_cse reads
+METATAG_KEYS = ("apple:title", "og:video:director", "og:video:release_date")
+
+# Partial response selector: drops snippets, thumbnails and the rest of pagemap
+CSE_FIELDS = f"items(link,title,pagemap/metatags({','.join(METATAG_KEYS)}))"
+
 
 @dataclass(slots=True)
 class ItemView:
@@ -21,17 +27,33 @@ class ItemView:
     lang: str | None = None
 
 
-def parse_item_from_cse(raw: dict) -> ItemView:
-    raw_url = raw.get("link") or ""
-    url = normalize_url(raw_url)
+def get_cse_url(raw: dict) -> str:
+    """Normalized item URL, cheap enough to gate items before parsing them."""
+    return normalize_url(raw.get("link") or "")
+
+
+def slim_cse_item(raw: dict) -> dict:
+    """Keep only what parse_item_from_cse reads, for items sent without `fields=`."""
+    item = {key: raw[key] for key in ("link", "title") if key in raw}
+    metatags = get_metatags(raw)
+    if metatags:
+        slim = {key: metatags[key] for key in METATAG_KEYS if key in metatags}
+        item["pagemap"] = {"metatags": [slim]}
+    return item
 
-    metatags = {}
+
+def get_metatags(raw: dict) -> dict:
     try:
         meta_list = raw.get("pagemap", {}).get("metatags", [])
-        if meta_list:
-            metatags = dict(meta_list[0])
+        return meta_list[0] if meta_list else {}
     except Exception:
-        pass
+        return {}
+
+
+def parse_item_from_cse(raw: dict) -> ItemView:
+    raw_url = raw.get("link") or ""
+    url = normalize_url(raw_url)
+    metatags = get_metatags(raw)
 
     apple_title = metatags.get("apple:title")
     page_title = raw.get("title")
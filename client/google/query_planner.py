@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from utils.file_utils import load_json_file, save_json_file
+
+if TYPE_CHECKING:
+    from models.target import Target
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class FormStats:
+    attempts: int = 0
+    hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        # Laplace smoothing so unseen forms are neither favored nor skipped
+        return (self.hits + 1) / (self.attempts + 2)
+
+
+class QueryPlanner:
+    """
+    Orders CSE query forms (e.g. "director", "bare") from the hit rates observed
+    for similar targets: same country, with or without directors, similar title
+    length. Forms that almost never produce the accepted URL are skipped, except
+    on periodic exploration rounds so their stats can recover.
+    """
+
+    def __init__(
+        self,
+        path: str | None = None,
+        filename: str = "query_stats",
+        *,
+        min_attempts: int = 20,
+        skip_below: float = 0.05,
+        explore_every: int = 10,
+    ) -> None:
+        self.filepath = str(Path(path) / f"{filename}.json") if path else None
+        self.min_attempts = min_attempts
+        self.skip_below = skip_below
+        self.explore_every = explore_every
+
+        self.stats: dict[str, dict[str, FormStats]] = {}
+        self.plan_counts: dict[str, int] = {}
+        self.resolved_count = 0
+        self.resolved_calls = 0
+        self.unresolved_calls = 0
+        self.load()
+
+    @staticmethod
+    def get_bucket(target: Target) -> str:
+        words = len(target.title.split())
+        length = "short" if words == 1 else "medium" if words <= 3 else "long"
+        directors = "directors" if target.directors else "no_directors"
+        return f"{target.country}|{directors}|{length}"
+
+    def plan(self, bucket: str, forms: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        """Return (form, query) pairs to try, best expected hit rate first."""
+        plan_count = self.plan_counts.get(bucket, 0) + 1
+        self.plan_counts[bucket] = plan_count
+        bucket_stats = self.stats.get(bucket, {})
+
+        ordered = sorted(
+            forms,
+            key=lambda form: -bucket_stats.get(form[0], FormStats()).hit_rate,
+        )
+        if plan_count % self.explore_every == 0:
+            return ordered
+
+        kept = [
+            form
+            for form in ordered
+            if not self.is_skippable(bucket_stats.get(form[0], FormStats()))
+        ]
+        return kept or ordered[:1]
+
+    def is_skippable(self, form_stats: FormStats) -> bool:
+        return (
+            form_stats.attempts >= self.min_attempts
+            and form_stats.hits / form_stats.attempts < self.skip_below
+        )
+
+    def record(
+        self, bucket: str, tried: list[str], accepted: str | None, call_count: int
+    ) -> None:
+        bucket_stats = self.stats.setdefault(bucket, {})
+        for form in tried:
+            form_stats = bucket_stats.setdefault(form, FormStats())
+            form_stats.attempts += 1
+            if form == accepted:
+                form_stats.hits += 1
+
+        if accepted:
+            self.resolved_count += 1
+            self.resolved_calls += call_count
+        else:
+            self.unresolved_calls += call_count
+
+    def log_stats(self) -> None:
+        """
+        Dump the hit rates per bucket and the run's CSE calls per resolved movie,
+        then save the stats learned during the run.
+        """
+        if self.resolved_count:
+            logger.info(
+                f"Query planner: {self.resolved_count} resolved with "
+                f"{self.resolved_calls / self.resolved_count:.2f} CSE calls on average, "
+                f"{self.unresolved_calls} calls spent on unresolved targets"
+            )
+        for bucket, bucket_stats in sorted(self.stats.items()):
+            forms = ", ".join(
+                f"{form} {stats.hits}/{stats.attempts}"
+                for form, stats in bucket_stats.items()
+            )
+            logger.debug(f"Query forms [{bucket}]: {forms}")
+
+        self.resolved_count = 0
+        self.resolved_calls = 0
+        self.unresolved_calls = 0
+        self.save()
+
+    def load(self) -> None:
+        if not self.filepath or not Path(self.filepath).exists():
+            return
+
+        self.stats = {
+            bucket: {
+                form: FormStats(attempts, hits)
+                for form, (attempts, hits) in bucket_stats.items()
+            }
+            for bucket, bucket_stats in load_json_file(self.filepath).items()
+        }
+
+    def save(self) -> None:
+        if not self.filepath:
+            return
+
+        data = {
+            bucket: {
+                form: [stats.attempts, stats.hits]
+                for form, stats in bucket_stats.items()
+            }
+            for bucket, bucket_stats in self.stats.items()
+        }
+        save_json_file(self.filepath, data)
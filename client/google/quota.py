@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from utils.file_utils import load_json_file, save_json_file
+
+logger = logging.getLogger(__name__)
+
+# The Custom Search JSON API daily quota resets at midnight Pacific Time
+QUOTA_TIMEZONE = "America/Los_Angeles"
+
+RECENTLY_ADDED = "recently_added"
+MISSING_RECENT = "missing_recent"
+BACKLOG = "backlog"
+
+DEFAULT_PRIORITIES = [RECENTLY_ADDED, MISSING_RECENT, BACKLOG]
+
+
+class QuotaExhaustedError(Exception):
+    """A CSE call was refused by the ledger: the movie must be retried later."""
+
+
+def quota_scope(ledger: QuotaLedger | None, consumer: str) -> AbstractContextManager:
+    """Charge the CSE calls made inside this block to `consumer`, if there is a ledger."""
+    if ledger is None:
+        return nullcontext()
+    return ledger.use(consumer)
+
+
+class QuotaLedger:
+    """
+    Persistent daily Google CSE quota shared by all tasks.
+
+    Consumers are ranked by priority (highest first). Budget reserved for a
+    consumer and not yet used is held back from every lower-priority consumer,
+    so the backlog can never eat the calls kept for recently added movies.
+    Calls are counted in memory; `save()` persists them once per run.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        filename: str,
+        daily_limit: int = 100,
+        reserved: dict[str, int] | None = None,
+        priorities: list[str] | None = None,
+        tz: str = QUOTA_TIMEZONE,
+    ) -> None:
+        self.filepath = str(Path(path) / f"{filename}.json")
+        self.daily_limit = daily_limit
+        self.reserved = reserved or {}
+        self.priorities = priorities or DEFAULT_PRIORITIES
+        self.tz = ZoneInfo(tz)
+
+        self.consumer: str | None = None
+        self._lock = threading.Lock()
+        self.day = ""
+        self.used: dict[str, int] = {}
+        self.load()
+
+    @contextmanager
+    def use(self, consumer: str) -> Iterator[None]:
+        """Charge the CSE calls made inside this block to `consumer`."""
+        previous, self.consumer = self.consumer, consumer
+        try:
+            yield
+        finally:
+            self.consumer = previous
+
+    def remaining(self, consumer: str | None = None) -> int:
+        """Calls `consumer` may still make today."""
+        with self._lock:
+            self._roll_day()
+            return self._remaining(consumer)
+
+    def acquire(self) -> bool:
+        """Record one call for the current consumer, or refuse it if out of budget."""
+        with self._lock:
+            self._roll_day()
+            consumer = self.consumer or ""
+            if self._remaining(consumer) <= 0:
+                return False
+
+            self.used[consumer] = self.used.get(consumer, 0) + 1
+            return True
+
+    def total_used(self) -> int:
+        return sum(self.used.values())
+
+    def _remaining(self, consumer: str | None) -> int:
+        rank = self._rank(consumer)
+        held = sum(
+            max(0, self.reserved.get(other, 0) - self.used.get(other, 0))
+            for other in self.priorities[:rank]
+        )
+        return self.daily_limit - self.total_used() - held
+
+    def _rank(self, consumer: str | None) -> int:
+        try:
+            return self.priorities.index(consumer or "")
+        except ValueError:
+            return len(self.priorities)
+
+    def _roll_day(self) -> None:
+        today = datetime.fromtimestamp(time.time(), tz=self.tz).strftime("%Y-%m-%d")
+        if today == self.day:
+            return
+
+        if self.day:
+            logger.info(
+                f"CSE quota day {self.day} closed with {self.total_used()}"
+                f"/{self.daily_limit} calls used"
+            )
+        self.day = today
+        self.used = {}
+
+    def load(self) -> None:
+        if Path(self.filepath).exists():
+            data = load_json_file(self.filepath)
+            self.day = data.get("day", "")
+            self.used = data.get("used", {})
+        else:
+            self.day = ""
+            self.used = {}
+
+    def save(self) -> None:
+        with self._lock:
+            data = {"day": self.day, "used": dict(self.used)}
+        save_json_file(self.filepath, data)
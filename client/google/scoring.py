@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 from client.apple_tv.attributes import Attributes, get_attributes
 from client.google.parser import parse_item_from_apple_tv_attributes
-from client.google.utils import extract_path, norm_text, similarity
+from client.google.utils import extract_path, norm_text, normalized_similarity
 
 if TYPE_CHECKING:
+    from client.apple_tv.pages import PageCache
     from client.google.parser import ItemView
     from models.target import Target
 
@@ -32,6 +35,30 @@ DISALLOWED_RE = re.compile(
 CANONICAL_RE = re.compile(r"^/([a-z]{2,3})/(show|movie)/.+/umc\.cm[cp]\.[\w.]+/?$")
 
 
+@dataclass(frozen=True, slots=True)
+class PreparedTarget:
+    """Target features normalized once, then reused for every CSE item scored."""
+
+    target: Target
+    title: str
+    directors: tuple[str, ...]
+    combined_directors: str
+    country_path: str
+    entity_path: str
+
+    @classmethod
+    def from_target(cls, target: Target) -> PreparedTarget:
+        directors = tuple(map(norm_text, target.directors))
+        return cls(
+            target=target,
+            title=norm_text(target.title),
+            directors=directors,
+            combined_directors="".join(directors),
+            country_path=f"/{target.country}/",
+            entity_path=f"/{target.entity}/",
+        )
+
+
 class Scorer:
     """
     Computes a score for a Google CSE item projected to ItemView against a TargetSpec.
@@ -41,27 +68,53 @@ class Scorer:
         self,
         *,
         title_threshold: float = 0.75,
+        page_cache: PageCache | None = None,
     ) -> None:
         self.title_threshold = title_threshold
+        self.page_cache = page_cache
 
     def is_candidate_url(self, url: str) -> bool:
         if not (url and url.startswith("https://tv.apple.com/")):
             return False
         return not DISALLOWED_RE.search(extract_path(url))
 
+    @staticmethod
+    def prepare(target: Target) -> PreparedTarget:
+        return PreparedTarget.from_target(target)
+
     def compute(self, item: ItemView, target: Target) -> float | None:
+        return self.compute_prepared(item, self.prepare(target))
+
+    def score_items(
+        self, items: Iterable[ItemView], prepared: PreparedTarget
+    ) -> Iterator[tuple[ItemView, float | None]]:
+        """
+        Score items against one prepared target. Items are scored lazily, in
+        order, so callers can stop at a strong match before a page is fetched.
+        """
+        for item in items:
+            yield item, self.compute_prepared(item, prepared)
+
+    def compute_prepared(
+        self, item: ItemView, prepared: PreparedTarget
+    ) -> float | None:
         path = extract_path(item.url)
         if not CANONICAL_RE.match(path):
             return None
 
-        if not f"/{target.entity}/" in path:
+        if not prepared.entity_path in path:
             return None
 
-        if not f"/{target.country}/" in path:
+        if not prepared.country_path in path:
             return None
 
-        title_score = get_title_score(target.title, item.title, self.title_threshold)
-        director_score = get_director_score(target.directors, item.director)
+        target = prepared.target
+        title_score = get_prepared_title_score(
+            prepared.title, item.title, self.title_threshold
+        )
+        director_score = get_prepared_director_score(
+            prepared.directors, prepared.combined_directors, item.director
+        )
         year_score = get_year_score(target.year, item.release_year)
 
         if (
@@ -70,8 +123,8 @@ class Scorer:
             and director_score == 1.0
             and year_score == 1.0
         ):
-            attributes = get_attributes(item.url)
-            return self.score_attributes(item.url, attributes, target)
+            attributes = get_attributes(item.url, self.page_cache)
+            return self.score_attributes(item.url, attributes, prepared)
 
         if title_score < 0.0 or director_score < 0.0 or year_score < 0.0:
             return None
@@ -82,20 +135,28 @@ class Scorer:
         self,
         url: str,
         attributes: Attributes | None,
-        target: Target,
+        target: Target | PreparedTarget,
     ) -> float | None:
         if not attributes:
             return None
 
+        if not isinstance(target, PreparedTarget):
+            target = self.prepare(target)
         item = parse_item_from_apple_tv_attributes(url, attributes)
-        return self.compute(item, target)
+        return self.compute_prepared(item, target)
 
 
 def get_title_score(target_title: str, title: str | None, threshold: float) -> float:
+    return get_prepared_title_score(norm_text(target_title), title, threshold)
+
+
+def get_prepared_title_score(
+    target_title_norm: str, title: str | None, threshold: float
+) -> float:
     if not title:
         return 0.0
 
-    similarity_score = similarity(target_title, title)
+    similarity_score = normalized_similarity(target_title_norm, norm_text(title))
     if similarity_score < 0.5:
         return -1.0
     if similarity_score < threshold:
@@ -122,7 +183,19 @@ def get_director_score(target_directors: list[str], director: str | None) -> flo
         0.0  → uncertain or no information
        -1.0  → strong mismatch (different people, avoid false positives)
     """
-    if not target_directors or not director or director == "Unknown":
+    directors_norm = tuple(map(norm_text, target_directors))
+    return get_prepared_director_score(
+        directors_norm, "".join(directors_norm), director
+    )
+
+
+def get_prepared_director_score(
+    target_directors_norm: tuple[str, ...],
+    target_combined: str,
+    director: str | None,
+) -> float:
+    """get_director_score() with the target directors already normalized."""
+    if not target_directors_norm or not director or director == "Unknown":
         return 0.0
 
     # Normalize and flatten
@@ -131,15 +204,13 @@ def get_director_score(target_directors: list[str], director: str | None) -> flo
         return 0.0
 
     # Strong match if any target is included in candidate string
-    for target_director in target_directors:
-        target_norm = norm_text(target_director)
+    for target_norm in target_directors_norm:
         if not target_norm:
             continue
-        if similarity(target_norm, director_norm) >= 0.9:
+        if normalized_similarity(target_norm, director_norm) >= 0.9:
             return 1.0
 
     # Otherwise aggregate all targets into one string
-    target_combined = "".join(norm_text(d) for d in target_directors)
-    sim = similarity(target_combined, director_norm)
+    sim = normalized_similarity(target_combined, director_norm)
 
     return -1.0 if sim < 0.5 else 0.0
@@ -1,22 +1,44 @@
 from __future__ import annotations
 
 import logging
-import time
+from collections.abc import Iterator
 from typing import TYPE_CHECKING
 
 import requests
 
-from client.google.parser import parse_item_from_cse
-from client.google.scoring import REQUIRED_SCORE, STRONG_SCORE, VALIDATION_SCORE, Scorer
+from client.google.parser import (
+    CSE_FIELDS,
+    get_cse_url,
+    parse_item_from_cse,
+    slim_cse_item,
+)
+from client.google.query_planner import QueryPlanner
+from client.google.quota import QuotaExhaustedError
+from client.google.scoring import (
+    REQUIRED_SCORE,
+    STRONG_SCORE,
+    VALIDATION_SCORE,
+    PreparedTarget,
+    Scorer,
+)
 from client.google.utils import quote
+from utils.rate_governor import RateGovernor, default_governor, get_host
 
 if TYPE_CHECKING:
     from client.apple_tv.attributes import Attributes
+    from client.google.parser import ItemView
+    from client.google.quota import QuotaLedger
     from models.target import Target
+    from storage.search_archive import SearchArchive
+    from storage.search_cache import SearchCache
 
 logger = logging.getLogger(__name__)
 
 GOOGLE_ENDPOINT = "https://www.googleapis.com/customsearch/v1"
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+
+# Stop before the next query form once the best score clears REQUIRED_SCORE by this
+EARLY_STOP_MARGIN = 1.0
 
 
 class SearchEngine:
@@ -32,9 +54,14 @@ class SearchEngine:
         cse_id: str,
         *,
         session: requests.Session | None = None,
-        min_interval_s: float = 0.5,
+        min_interval_s: float | None = None,
         timeout_s: float = 20.0,
         scorer: Scorer | None = None,
+        cache: SearchCache | None = None,
+        quota: QuotaLedger | None = None,
+        planner: QueryPlanner | None = None,
+        archive: SearchArchive | None = None,
+        governor: RateGovernor | None = None,
     ) -> None:
         self.api_key = api_key
         self.cse_id = cse_id
@@ -42,11 +69,34 @@ class SearchEngine:
             raise ValueError("Google API key and CSE ID are required (args or env).")
 
         self.session = session or requests.Session()
-        self.min_interval_s = float(min_interval_s)
         self.timeout_s = float(timeout_s)
-        self._last_call_ts = 0.0
+
+        # Calls are paced by the shared governor's googleapis policy. An explicit
+        # min_interval_s paces this engine alone, on a governor of its own
+        if min_interval_s is not None and governor is None:
+            governor = RateGovernor({})
+        self.governor = governor or default_governor
+        if min_interval_s is not None:
+            rate = 1.0 / min_interval_s if min_interval_s > 0 else float("inf")
+            self.governor.configure(
+                get_host(GOOGLE_ENDPOINT),
+                rate=rate,
+                max_rate=rate,
+                min_rate=min(rate, 0.1),
+            )
 
         self.scorer = scorer or Scorer()
+        self.cache = cache
+        self.quota = quota
+        self.planner = planner or QueryPlanner()
+        self.archive = archive
+        # Cleared once a call rejected with the CSE_FIELDS mask succeeds without
+        # it, items are slimmed anyway
+        self.partial_response = True
+
+        # CSE calls actually sent, and queries answered from the cache
+        self.call_count = 0
+        self.cached_count = 0
 
     # --- public API ---
 
@@ -56,95 +106,189 @@ class SearchEngine:
         entity = self._normalize_entity(target.entity)
         country = self._normalize_country(target.country)
 
-        queries = self._build_queries(title, directors, country, entity)
+        bucket = self.planner.get_bucket(target)
+        queries = self.planner.plan(
+            bucket, self._build_queries(title, directors, country, entity)
+        )
 
-        best_score, best_url = 0.0, None
+        prepared = self.scorer.prepare(target)
+        best_score, best_url, best_form = 0.0, None, None
         seen: set[tuple[str, str | None]] = set()
-        query_count = 0
-
-        for q in queries:
-            query_count += 1
-            for raw in self._google_search(q):
-                item = parse_item_from_cse(raw)
-                if (item.url, item.title) in seen:
-                    continue
-                seen.add((item.url, item.title))
+        calls_before = self.call_count
+        tried: list[str] = []
 
-                if not self.scorer.is_candidate_url(item.url):
-                    continue
+        for form, q in queries:
+            items = self._google_search(q)
+            # A failed call says nothing about how well the form works
+            if items is None:
+                continue
 
-                score = self.scorer.compute(item, target)
-                logger.debug("Score: %s, Item: %s", score, item)
-                if score is None:
-                    continue
+            tried.append(form)
+            score, url = self._best_result(items, prepared, seen)
+            if score > best_score:
+                best_score, best_url, best_form = score, url, form
 
-                if score > best_score:
-                    best_score, best_url = score, item.url
-                    if best_score >= STRONG_SCORE:
-                        return best_url, query_count
+            if best_score >= REQUIRED_SCORE + EARLY_STOP_MARGIN:
+                break
 
-        return (best_url if best_score >= REQUIRED_SCORE else None), query_count
+        query_count = self.call_count - calls_before
+        accepted = best_url if best_score >= REQUIRED_SCORE else None
+        self.planner.record(bucket, tried, best_form if accepted else None, query_count)
+        if self.archive is not None:
+            self.archive.add_outcome(target, accepted)
+        return accepted, query_count
 
     def validate(self, url: str, attributes: Attributes | None, target: Target) -> bool:
         score = self.scorer.score_attributes(url, attributes, target)
         return score is not None and score >= VALIDATION_SCORE
 
+    def log_stats(self) -> None:
+        """Log CSE calls sent and quota saved by the cache, then reset counters."""
+        if self.call_count or self.cached_count:
+            logger.info(
+                f"Google CSE: {self.call_count} calls sent, "
+                f"{self.cached_count} served from cache (quota saved)"
+            )
+        self.call_count = 0
+        self.cached_count = 0
+        self.planner.log_stats()
+
+    def save(self) -> None:
+        """Persist the CSE results cached and the quota spent during the run."""
+        if self.cache is not None:
+            self.cache.save()
+        if self.quota is not None:
+            self.quota.save()
+
     # --- internals ---
 
+    def _best_result(
+        self,
+        raw_items: list[dict],
+        prepared: PreparedTarget,
+        seen: set[tuple[str, str | None]],
+    ) -> tuple[float, str | None]:
+        best_score, best_url = 0.0, None
+        candidates = self._new_candidates(raw_items, seen)
+        for item, score in self.scorer.score_items(candidates, prepared):
+            logger.debug("Score: %s, Item: %s", score, item)
+            if score is None:
+                continue
+
+            if score > best_score:
+                best_score, best_url = score, item.url
+                if best_score >= STRONG_SCORE:
+                    break
+
+        return best_score, best_url
+
+    def _new_candidates(
+        self, raw_items: list[dict], seen: set[tuple[str, str | None]]
+    ) -> Iterator[ItemView]:
+        for raw in raw_items:
+            # Gate on the URL before touching the metatags
+            if not self.scorer.is_candidate_url(get_cse_url(raw)):
+                continue
+
+            item = parse_item_from_cse(raw)
+            if (item.url, item.title) in seen:
+                continue
+            seen.add((item.url, item.title))
+            yield item
+
     def _build_queries(
         self,
         title: str,
         directors: list[str],
         country: str,
         entity: str,
-    ) -> list[str]:
+    ) -> list[tuple[str, str]]:
+        """Return (form, query) pairs in the default order."""
         base = f"site:tv.apple.com/{country}/{entity} {title}"
-        queries: list[str] = []
+        queries: list[tuple[str, str]] = []
         if directors:
-            queries.append(f"{base} {quote(directors[0])}")
-        queries.append(base)
+            queries.append(("director", f"{base} {quote(directors[0])}"))
+        queries.append(("bare", base))
         return queries
 
-    def _google_search(self, query: str, num: int = 10) -> list[dict]:
-        self._respect_min_interval()
+    def _google_search(self, query: str, num: int = 10) -> list[dict] | None:
+        """Items of a query, from the cache or CSE. None when the call failed."""
+        if self.cache is not None:
+            cached_items = self.cache.get(query)
+            if cached_items is not None:
+                self.cached_count += 1
+                return cached_items
 
-        params = {
-            "key": self.api_key,
-            "cx": self.cse_id,
-            "q": query,
-            "num": min(max(num, 1), 10),
-            "safe": "off",
-        }
+        items = self._fetch(query, num)
+        if items is None:
+            return None
+        if self.archive is not None:
+            self.archive.add_response(query, items)
+        items = [slim_cse_item(item) for item in items]
+
+        if self.cache is not None:
+            self.cache.add(query, items)
+        return items
+
+    def _fetch(self, query: str, num: int = 10) -> list[dict] | None:
+        """
+        Send one CSE call. Returns None on failure so it is never cached.
+
+        Raises QuotaExhaustedError when the ledger refuses the call, so a refusal
+        is never mistaken for a query without results. Every request sent,
+        retries included, is charged to the quota.
+        """
+        params = self._build_params(query, num)
+        attempt = 0
+        while True:
+            if self.quota is not None and not self.quota.acquire():
+                logger.warning("Google CSE daily quota exhausted, refusing %r", query)
+                raise QuotaExhaustedError(query)
+            self.call_count += 1
 
-        backoff = 0.6
-        for attempt in range(4):
             try:
-                r = self.session.get(
-                    GOOGLE_ENDPOINT, params=params, timeout=self.timeout_s
-                )
-                if r.status_code in (429, 500, 502, 503, 504):
+                # Transient errors slow the governor down, spacing the retries
+                with self.governor.slot(GOOGLE_ENDPOINT) as slot:
+                    r = self.session.get(
+                        GOOGLE_ENDPOINT, params=params, timeout=self.timeout_s
+                    )
+                    slot.observe(r)
+                if r.status_code == 400 and "fields" in params:
+                    # Retry once without the mask, the query may be at fault
+                    params = {k: v for k, v in params.items() if k != "fields"}
+                    continue
+                if r.status_code in TRANSIENT_STATUSES:
                     raise _TransientHTTPError(r.status_code, r.text)
                 r.raise_for_status()
+                if self.partial_response and "fields" not in params:
+                    logger.warning(
+                        "Google CSE rejected the fields mask, "
+                        "requesting full responses from now on"
+                    )
+                    self.partial_response = False
                 return r.json().get("items") or []
             except _TransientHTTPError as e:
-                if attempt == 3:
+                attempt += 1
+                if attempt == 4:
                     logger.warning(
                         "Google CSE transient %s (final) for %r", e.status, query
                     )
-                    return []
-                time.sleep(backoff)
-                backoff *= 1.6
+                    return None
             except requests.RequestException as e:
                 logger.warning("Google CSE request failed: %s", e)
-                return []
-            finally:
-                self._last_call_ts = time.monotonic()
-        return []
-
-    def _respect_min_interval(self) -> None:
-        delta = time.monotonic() - self._last_call_ts
-        if delta < self.min_interval_s:
-            time.sleep(self.min_interval_s - delta)
+                return None
+
+    def _build_params(self, query: str, num: int) -> dict:
+        params = {
+            "key": self.api_key,
+            "cx": self.cse_id,
+            "q": query,
+            "num": min(max(num, 1), 10),
+            "safe": "off",
+        }
+        if self.partial_response:
+            params["fields"] = CSE_FIELDS
+        return params
 
     @staticmethod
     def _normalize_entity(entity: str) -> str:
@@ -0,0 +1,54 @@
+import json
+import unittest
+from pathlib import Path
+
+from client.google.parser import (
+    CSE_FIELDS,
+    get_cse_url,
+    parse_item_from_cse,
+    slim_cse_item,
+)
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+class TestCseParser(unittest.TestCase):
+    def setUp(self):
+        responses = json.loads(
+            (FIXTURES / "cse_responses_full.json").read_text(encoding="utf-8")
+        )
+        self.items = [
+            item for entry in responses for item in entry["response"]["items"]
+        ]
+
+    def test_fields_selector(self):
+        self.assertEqual(
+            CSE_FIELDS,
+            "items(link,title,pagemap/metatags("
+            "apple:title,og:video:director,og:video:release_date))",
+        )
+
+    def test_slim_item_parses_like_full_item(self):
+        for item in self.items:
+            self.assertEqual(
+                parse_item_from_cse(slim_cse_item(item)), parse_item_from_cse(item)
+            )
+
+    def test_slim_item_keeps_only_read_fields(self):
+        slim = slim_cse_item(self.items[0])
+
+        self.assertEqual(set(slim), {"link", "title", "pagemap"})
+        self.assertEqual(
+            set(slim["pagemap"]["metatags"][0]),
+            {"apple:title", "og:video:director", "og:video:release_date"},
+        )
+
+    def test_get_cse_url(self):
+        raw = {"link": "https://tv.apple.com/us/movie/heat/umc.cmc.1?l=es#x"}
+        self.assertEqual(
+            get_cse_url(raw), "https://tv.apple.com/us/movie/heat/umc.cmc.1"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import tempfile
+import unittest
+
+from client.google.query_planner import QueryPlanner
+from models.target import Target
+
+BUCKET = "us|directors|medium"
+FORMS = [("director", "q director"), ("bare", "q")]
+
+
+class TestQueryPlanner(unittest.TestCase):
+    def test_get_bucket(self):
+        target = Target("The Matrix", ["Lana Wachowski"], 1999, "us", "movie")
+        self.assertEqual(QueryPlanner.get_bucket(target), "us|directors|medium")
+
+        target = Target("Heat", [], 1995, "fr", "movie")
+        self.assertEqual(QueryPlanner.get_bucket(target), "fr|no_directors|short")
+
+    def test_plan_keeps_default_order_without_stats(self):
+        planner = QueryPlanner()
+        self.assertEqual(planner.plan(BUCKET, FORMS), FORMS)
+
+    def test_plan_orders_forms_by_hit_rate(self):
+        planner = QueryPlanner()
+        for _ in range(5):
+            planner.record(BUCKET, ["director", "bare"], "bare", 2)
+
+        self.assertEqual(
+            [form for form, _ in planner.plan(BUCKET, FORMS)], ["bare", "director"]
+        )
+
+    def test_plan_skips_low_hit_forms_except_when_exploring(self):
+        planner = QueryPlanner(min_attempts=4, explore_every=3)
+        for _ in range(4):
+            planner.record(BUCKET, ["director", "bare"], "bare", 2)
+
+        plans = [[form for form, _ in planner.plan(BUCKET, FORMS)] for _ in range(3)]
+
+        self.assertEqual(plans, [["bare"], ["bare"], ["bare", "director"]])
+
+    def test_stats_persist(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            planner = QueryPlanner(tmp_dir, "query_stats")
+            planner.record(BUCKET, ["director"], "director", 1)
+            planner.log_stats()
+
+            reloaded = QueryPlanner(tmp_dir, "query_stats")
+
+        stats = reloaded.stats[BUCKET]["director"]
+        self.assertEqual((stats.attempts, stats.hits), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import tempfile
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+from client.google.quota import BACKLOG, MISSING_RECENT, RECENTLY_ADDED, QuotaLedger
+
+PACIFIC = ZoneInfo("America/Los_Angeles")
+MORNING = datetime(2025, 10, 6, 9, 0, tzinfo=PACIFIC).timestamp()
+NEXT_DAY = datetime(2025, 10, 7, 0, 1, tzinfo=PACIFIC).timestamp()
+
+
+class TestQuotaLedger(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+        time_patcher = patch("client.google.quota.time.time", return_value=MORNING)
+        self.mock_time = time_patcher.start()
+        self.addCleanup(time_patcher.stop)
+
+    def make_ledger(self, **kwargs) -> QuotaLedger:
+        return QuotaLedger(self.tmp_dir.name, "search_quota", **kwargs)
+
+    def spend(self, ledger: QuotaLedger, consumer: str, count: int) -> int:
+        with ledger.use(consumer):
+            return sum(ledger.acquire() for _ in range(count))
+
+    def test_refuses_calls_once_exhausted(self):
+        ledger = self.make_ledger(daily_limit=3)
+
+        self.assertEqual(self.spend(ledger, BACKLOG, 5), 3)
+        self.assertEqual(ledger.remaining(BACKLOG), 0)
+
+    def test_reserved_budget_held_back_from_lower_priorities(self):
+        ledger = self.make_ledger(daily_limit=10, reserved={RECENTLY_ADDED: 4})
+
+        self.assertEqual(ledger.remaining(BACKLOG), 6)
+        self.assertEqual(ledger.remaining(MISSING_RECENT), 6)
+        self.assertEqual(ledger.remaining(RECENTLY_ADDED), 10)
+
+        self.assertEqual(self.spend(ledger, BACKLOG, 10), 6)
+        self.assertEqual(self.spend(ledger, RECENTLY_ADDED, 10), 4)
+
+    def test_used_reservation_is_released(self):
+        ledger = self.make_ledger(daily_limit=10, reserved={RECENTLY_ADDED: 4})
+
+        self.spend(ledger, RECENTLY_ADDED, 3)
+
+        self.assertEqual(ledger.remaining(BACKLOG), 6)
+
+    def test_persisted_across_restarts(self):
+        ledger = self.make_ledger(daily_limit=10)
+        self.spend(ledger, BACKLOG, 4)
+        ledger.save()
+
+        self.assertEqual(self.make_ledger(daily_limit=10).remaining(BACKLOG), 6)
+
+    def test_resets_at_pacific_midnight(self):
+        ledger = self.make_ledger(daily_limit=10)
+        self.spend(ledger, BACKLOG, 10)
+
+        self.mock_time.return_value = NEXT_DAY
+
+        self.assertEqual(ledger.remaining(BACKLOG), 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from pathlib import Path
+
+from client.google.parser import ItemView
+from client.google.scoring import (
+    PreparedTarget,
+    Scorer,
+    get_director_score,
+    get_prepared_director_score,
+)
+from models.target import Target
+from tools.benchmark_scoring import load_result_sets
+
+FIXTURES = Path(__file__).parent / "fixtures"
+TARGET = Target("Amélie", ["Jean-Pierre Jeunet"], 2001, "fr", "movie")
+URL = "https://tv.apple.com/fr/movie/amelie/umc.cmc.5abc67890"
+
+
+class TestScorer(unittest.TestCase):
+    def setUp(self):
+        self.scorer = Scorer()
+
+    def test_prepared_target_normalizes_once(self):
+        prepared = PreparedTarget.from_target(TARGET)
+
+        self.assertEqual(prepared.title, "amelie")
+        self.assertEqual(prepared.directors, ("jean pierre jeunet",))
+        self.assertEqual(prepared.combined_directors, "jean pierre jeunet")
+
+    def test_score_items_matches_compute(self):
+        for target, items in load_result_sets(FIXTURES / "cse_results.json"):
+            prepared = self.scorer.prepare(target)
+            candidates = [i for i in items if self.scorer.is_candidate_url(i.url)]
+
+            scores = [
+                score for _, score in self.scorer.score_items(candidates, prepared)
+            ]
+
+            self.assertEqual(
+                scores, [self.scorer.compute(item, target) for item in candidates]
+            )
+
+    def test_score_items_is_lazy(self):
+        items = [ItemView(URL, "Amélie", "Jean-Pierre Jeunet", 2001), None]
+        prepared = self.scorer.prepare(TARGET)
+
+        item, score = next(self.scorer.score_items(iter(items), prepared))
+
+        self.assertEqual(item.url, URL)
+        self.assertAlmostEqual(score, 4.0)
+
+    def test_prepared_director_score_matches_unprepared(self):
+        directors = ["Lana Wachowski", "Lilly Wachowski"]
+        prepared = PreparedTarget.from_target(
+            Target("The Matrix", directors, 1999, "us", "movie")
+        )
+        for director in ["Lilly Wachowski", "Michael Mann", "Unknown", None, "?"]:
+            self.assertEqual(
+                get_prepared_director_score(
+                    prepared.directors, prepared.combined_directors, director
+                ),
+                get_director_score(directors, director),
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
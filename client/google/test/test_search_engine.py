@@ -0,0 +1,200 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from client.google.parser import CSE_FIELDS, parse_item_from_cse
+from client.google.quota import QuotaExhaustedError
+from client.google.search_engine import SearchEngine
+from models.target import Target
+from utils.rate_governor import DEFAULT_POLICIES, default_governor
+
+TARGET = Target("The Matrix", ["Lana Wachowski"], 1999, "us", "movie")
+URL = "https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345"
+
+
+def cse_item(
+    url: str = URL, title: str = "The Matrix", release_date: str = "1999-03-31"
+) -> dict:
+    return {
+        "link": url,
+        "title": f"{title} - Apple TV",
+        "pagemap": {
+            "metatags": [
+                {
+                    "apple:title": title,
+                    "og:video:director": "Lana Wachowski",
+                    "og:video:release_date": release_date,
+                }
+            ]
+        },
+    }
+
+
+def cse_response(items: list[dict]) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = {"items": items}
+    return response
+
+
+class TestSearchEngine(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.cache = MagicMock()
+        self.cache.get.return_value = None
+        self.engine = SearchEngine(
+            "key", "cx", session=self.session, min_interval_s=0.0, cache=self.cache
+        )
+
+    def test_explicit_interval_leaves_shared_governor_alone(self):
+        self.assertIsNot(self.engine.governor, default_governor)
+        self.assertEqual(
+            default_governor.policies["www.googleapis.com"].rate,
+            DEFAULT_POLICIES["www.googleapis.com"].rate,
+        )
+
+    def test_query_strong_match_stops_early(self):
+        self.session.get.return_value = cse_response([cse_item()])
+
+        url, query_count = self.engine.query(TARGET)
+
+        self.assertEqual(url, URL)
+        self.assertEqual(query_count, 1)
+        self.cache.add.assert_called_once()
+
+    def test_query_confident_match_skips_remaining_forms(self):
+        # Title and director match but the year does not: below STRONG_SCORE
+        self.session.get.return_value = cse_response(
+            [cse_item(release_date="1997-06-01")]
+        )
+
+        url, query_count = self.engine.query(TARGET)
+
+        self.assertEqual(url, URL)
+        self.assertEqual(query_count, 1)
+
+    def test_query_records_accepted_form(self):
+        self.session.get.return_value = cse_response([cse_item()])
+
+        self.engine.query(TARGET)
+
+        bucket = self.engine.planner.get_bucket(TARGET)
+        director_stats = self.engine.planner.stats[bucket]["director"]
+        self.assertEqual((director_stats.attempts, director_stats.hits), (1, 1))
+
+    def test_requests_partial_response_and_caches_lean_items(self):
+        item = cse_item()
+        item["snippet"] = "Watch The Matrix on Apple TV"
+        self.session.get.return_value = cse_response([item])
+
+        self.engine.query(TARGET)
+
+        params = self.session.get.call_args.kwargs["params"]
+        self.assertEqual(params["fields"], CSE_FIELDS)
+        cached_items = self.cache.add.call_args.args[1]
+        self.assertNotIn("snippet", cached_items[0])
+
+    def test_rejected_fields_mask_is_dropped(self):
+        rejected = MagicMock()
+        rejected.status_code = 400
+        rejected.text = "Invalid field selection"
+        responses = [rejected]
+        self.session.get.side_effect = lambda *args, **kwargs: (
+            responses.pop() if responses else cse_response([cse_item()])
+        )
+
+        with self.assertLogs("client.google.search_engine", "WARNING") as logs:
+            url, query_count = self.engine.query(TARGET)
+            self.engine.query(TARGET)
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertFalse(self.engine.partial_response)
+        # The rejected request was sent too
+        self.assertEqual((url, query_count), (URL, 2))
+        sent_params = [
+            call.kwargs["params"] for call in self.session.get.call_args_list
+        ]
+        self.assertEqual(len(sent_params), 3)
+        self.assertEqual(sent_params[0]["fields"], CSE_FIELDS)
+        self.assertNotIn("fields", sent_params[1])
+        self.assertNotIn("fields", sent_params[2])
+
+    def test_mask_kept_when_the_query_itself_is_rejected(self):
+        rejected = MagicMock()
+        rejected.status_code = 400
+        rejected.raise_for_status.side_effect = requests.HTTPError("400")
+        self.session.get.return_value = rejected
+
+        self.assertIsNone(self.engine._fetch("query"))
+
+        self.assertEqual(self.session.get.call_count, 2)
+        self.assertTrue(self.engine.partial_response)
+
+    def test_non_candidate_urls_are_not_parsed(self):
+        event_url = "https://tv.apple.com/us/sporting-event/final/umc.cse.1"
+        self.session.get.return_value = cse_response([cse_item(event_url), cse_item()])
+
+        with patch(
+            "client.google.search_engine.parse_item_from_cse",
+            wraps=parse_item_from_cse,
+        ) as parse:
+            self.engine.query(TARGET)
+
+        parse.assert_called_once()
+
+    def test_cached_results_do_not_count_as_queries(self):
+        self.cache.get.return_value = [cse_item()]
+
+        url, query_count = self.engine.query(TARGET)
+
+        self.assertEqual(url, URL)
+        self.assertEqual(query_count, 0)
+        self.session.get.assert_not_called()
+        self.assertEqual(self.engine.cached_count, 1)
+
+    def test_failed_calls_are_not_cached(self):
+        self.session.get.side_effect = requests.RequestException()
+
+        url, query_count = self.engine.query(TARGET)
+
+        self.assertIsNone(url)
+        self.assertEqual(query_count, 2)
+        self.cache.add.assert_not_called()
+
+    def test_failed_calls_are_not_recorded_as_attempts(self):
+        self.session.get.side_effect = requests.RequestException()
+
+        self.engine.query(TARGET)
+
+        self.assertFalse(any(self.engine.planner.stats.values()))
+
+    def test_transient_retries_are_charged(self):
+        unavailable = MagicMock(status_code=503, text="")
+        self.session.get.side_effect = [unavailable, unavailable, cse_response([])]
+        quota = MagicMock()
+        quota.acquire.return_value = True
+        self.engine.quota = quota
+
+        self.assertEqual(self.engine._fetch("query"), [])
+
+        self.assertEqual(quota.acquire.call_count, 3)
+        self.assertEqual(self.engine.call_count, 3)
+
+    def test_call_refused_by_quota_is_not_a_miss(self):
+        quota = MagicMock()
+        quota.acquire.return_value = False
+        self.engine.quota = quota
+        self.engine.planner = MagicMock(wraps=self.engine.planner)
+
+        with self.assertRaises(QuotaExhaustedError):
+            self.engine.query(TARGET)
+
+        self.session.get.assert_not_called()
+        self.cache.add.assert_not_called()
+        self.engine.planner.record.assert_not_called()
+        self.assertEqual(self.engine.call_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
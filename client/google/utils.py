@@ -1,35 +1,31 @@
 from __future__ import annotations
 
-import html
 import re
-import unicodedata
+
+from utils import normalization
+from utils.similarity import ratio
 
 # ---------- text normalization & similarity ----------
 
 
 def strip_accents(s: str) -> str:
-    return "".join(
-        ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch)
-    )
+    return normalization.strip_accents(s)
 
 
 def norm_text(s: str) -> str:
-    s = html.unescape((s or "").strip().lower())
-    s = strip_accents(s)
-    s = re.sub(r"[^\w\s]", " ", s, flags=re.UNICODE)
-    s = re.sub(r"\s+", " ", s).strip()
-    return s
+    return normalization.words(s or "")
 
 
 def similarity(a: str, b: str) -> float:
-    # Lightweight, deterministic similarity without external deps (SequenceMatcher).
-    # You can swap for rapidfuzz if you prefer.
-    from difflib import SequenceMatcher
+    # Engine is pluggable, see utils.similarity.set_similarity_engine
+    return normalized_similarity(norm_text(a), norm_text(b))
+
 
-    a_n, b_n = norm_text(a), norm_text(b)
+def normalized_similarity(a_n: str, b_n: str) -> float:
+    """similarity() for strings already passed through norm_text."""
     if not a_n or not b_n:
         return 0.0
-    return SequenceMatcher(None, a_n, b_n).ratio()
+    return ratio(a_n, b_n)
 
 
 def quote(s: str) -> str:
@@ -1,18 +1,52 @@
+from __future__ import annotations
+
+import logging
+
+import requests
+
+from client.apple_tv.sitemap import parse_url
 from client.itunes.match import get_matching_movie
 from client.itunes.parser import get_artworks
 from client.itunes.search import search_movies
+from utils.rate_governor import default_governor
+
+logger = logging.getLogger(__name__)
 
 
 def get_itunes_artworks(
     title: str, directors: list[str], year: int, country: str
 ) -> tuple[str | None, str | None, str | None]:
-    candidates = search_movies(country, title)
-    if not candidates:
-        return None, None, None
-
-    match = get_matching_movie(candidates, title, directors, year)
+    match = get_itunes_match(title, directors, year, country)
     if not match:
         return None, None, None
 
     itunes_url, poster_url, release_date = get_artworks(match)
     return itunes_url, poster_url, release_date
+
+
+def get_itunes_match(title: str, directors: list[str], year: int, country: str) -> dict:
+    """Confident iTunes match for the movie, or an empty dict."""
+    candidates = search_movies(country, title)
+    if not candidates:
+        return {}
+
+    return get_matching_movie(candidates, title, directors, year)
+
+
+def get_apple_tv_url(itunes_url: str, timeout_s: float = 10.0) -> str | None:
+    """
+    iTunes movie links redirect to the Apple TV title page of the same storefront,
+    which gives the umc id without any search.
+    """
+    try:
+        with default_governor.slot(itunes_url) as slot:
+            response = requests.head(
+                itunes_url, allow_redirects=True, timeout=timeout_s
+            )
+            slot.observe(response)
+    except requests.RequestException as e:
+        logger.warning(f"iTunes redirect failed for {itunes_url}: {e}")
+        return None
+
+    url = response.url.split("?", 1)[0]
+    return url if parse_url(url) else None
@@ -1,5 +1,33 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
 from client.itunes.parser import get_attributes
-from utils.string_utils import get_similarity, is_included
+from utils.similarity import ratio
+from utils.string_utils import normalize
+
+TITLE_WEIGHT = 1.0
+DIRECTOR_WEIGHT = 0.6
+YEAR_WEIGHT = 0.6
+
+
+@dataclass(frozen=True, slots=True)
+class MatchTarget:
+    """Target normalized once for a whole batch of iTunes candidates."""
+
+    title: str
+    directors: tuple[str, ...]
+    combined_directors: str
+    year: int
+
+    @classmethod
+    def from_values(cls, title: str, directors: list[str], year: int) -> MatchTarget:
+        return cls(
+            title=normalize(title),
+            directors=tuple(map(normalize, directors)),
+            combined_directors=normalize("".join(directors)),
+            year=year,
+        )
 
 
 def get_matching_movie(
@@ -8,82 +36,93 @@ def get_matching_movie(
     target_directors: list[str],
     target_year: int,
 ) -> dict:
-    best_match = {}
-    best_score = 0.0
+    if not candidates:
+        return {}
 
-    for candidate in candidates:
-        title, director, year = get_attributes(candidate)
+    target = MatchTarget.from_values(target_title, target_directors, target_year)
+    scores = compute_match_scores(candidates, target)
 
-        score = compute_match_score(
-            title, director, year, target_title, target_directors, target_year
-        )
+    # First candidate with the highest score, as long as it beats 1.0
+    best_index, best_score = -1, 0.0
+    for index, score in enumerate(scores):
         if score > best_score:
-            best_score = score
-            best_match = candidate
+            best_index, best_score = index, score
 
-    return best_match if best_score > 1.0 else {}
+    return candidates[best_index] if best_score > 1.0 else {}
 
 
-def compute_match_score(
-    title: str,
-    director: str,
-    year: int,
-    target_title: str,
-    target_directors: list[str],
-    target_year: int,
-) -> float:
-    TITLE_WEIGHT = 1.0
-    DIRECTOR_WEIGHT = 0.6
-    YEAR_WEIGHT = 0.6
-
-    score = 0.0
-    same_title = is_title_match(target_title, title)
-    director_score = get_director_score(target_directors, director)
-    year_score = get_year_score(target_year, year)
-
-    if same_title:
-        score += TITLE_WEIGHT
+def compute_match_scores(candidates: list[dict], target: MatchTarget) -> list[float]:
+    """
+    Score all candidates column by column: titles, directors and years are
+    extracted once, then each feature is scored for the whole batch. Director
+    scores are computed once per distinct director string.
+    """
+    titles, directors, years = zip(*map(get_attributes, candidates))
+    return score_attributes(target, titles, directors, years)
 
-    if director_score:
-        score += director_score * DIRECTOR_WEIGHT
 
-    if year_score:
-        score += year_score * YEAR_WEIGHT
+def score_attributes(
+    target: MatchTarget,
+    titles: tuple[str, ...],
+    directors: tuple[str, ...],
+    years: tuple[int, ...],
+) -> list[float]:
+    title_scores = [
+        TITLE_WEIGHT if ratio(target.title, normalize(title)) >= 0.9 else 0.0
+        for title in titles
+    ]
+    director_scores = get_director_scores(target, directors)
+    year_scores = get_year_scores(target.year, years)
 
-    return score
+    return [
+        title + director * DIRECTOR_WEIGHT + year * YEAR_WEIGHT
+        for title, director, year in zip(title_scores, director_scores, year_scores)
+    ]
 
 
-def is_title_match(
-    target_title: str,
-    title: str,
-) -> bool:
-    similarity = get_similarity(target_title, title)
-    return similarity >= 0.9
+def get_director_scores(target: MatchTarget, directors: tuple[str, ...]) -> list[float]:
+    scores: dict[str, float] = {}
+    for director in set(directors):
+        scores[director] = get_director_score(target, director)
+    return [scores[director] for director in directors]
 
 
-def get_director_score(target_directors: list[str], director: str) -> float:
+def get_director_score(target: MatchTarget, director: str) -> float:
     """
-    directors = ["Jason Hand", " Dana Ledoux Miller", "David G. Derrick, Jr."]
-    candidate_director = "Jason Hand, Dana Ledoux Miller & David G. Derrick, Jr."
+    1.0 when a target director is included in the candidate one, e.g.
+    "Jason Hand, Dana Ledoux Miller & David G. Derrick, Jr.", -1.0 when the
+    directors differ, 0.0 when unknown.
     """
-    if not target_directors or director in ("", "Unknown"):
+    if not target.directors or director in ("", "Unknown"):
         return 0.0
 
-    for target_director in target_directors:
-        if is_included(target_director, director):
-            return 1.0
+    director_norm = normalize(director)
+    if any(target_director in director_norm for target_director in target.directors):
+        return 1.0
 
-    target_director = "".join(target_directors)
-    similarity = get_similarity(target_director, director)
+    similarity = ratio(target.combined_directors, director_norm)
     return -1.0 if similarity < 0.5 else 0.0
 
 
-def get_year_score(
-    target_year: int,
+def get_year_scores(target_year: int, years: tuple[int, ...]) -> list[float]:
+    return [
+        (
+            1.0
+            if target_year <= year <= target_year + 1
+            else -1.0 if year < target_year - 2 or year > target_year + 2 else 0.0
+        )
+        for year in years
+    ]
+
+
+def compute_match_score(
+    title: str,
+    director: str,
     year: int,
+    target_title: str,
+    target_directors: list[str],
+    target_year: int,
 ) -> float:
-    if target_year <= year <= target_year + 1:
-        return 1.0
-    if year < target_year - 2 or year > target_year + 2:
-        return -1.0
-    return 0.0
+    """Score a single candidate, for callers outside a batch."""
+    target = MatchTarget.from_values(target_title, target_directors, target_year)
+    return score_attributes(target, (title,), (director,), (year,))[0]
@@ -1,6 +1,13 @@
 import unittest
 
-from client.itunes.match import get_matching_movie
+from client.itunes.match import (
+    MatchTarget,
+    compute_match_score,
+    compute_match_scores,
+    get_matching_movie,
+)
+from client.itunes.parser import get_attributes
+from utils.similarity import set_similarity_engine
 
 
 class TestGetMatchingMovie(unittest.TestCase):
@@ -744,5 +751,64 @@ class TestGetMatchingMovie(unittest.TestCase):
         self.assertEqual(result, expected_result)
 
 
+class TestGetMatchingMovieDifflib(TestGetMatchingMovie):
+    """Same corpus with the reference difflib engine: decisions must not change."""
+
+    def setUp(self):
+        set_similarity_engine("difflib")
+        self.addCleanup(set_similarity_engine, "indel")
+
+
+class TestComputeMatchScores(unittest.TestCase):
+
+    def test_same_scores_as_per_candidate_scoring(self):
+        candidates = [
+            {
+                "trackName": "Maria",
+                "artistName": "Pablo Larraín",
+                "releaseDate": "2024-12-18T08:00:00Z",
+            },
+            {
+                "trackName": "Maria",
+                "artistName": "Unknown",
+                "releaseDate": "2019-05-01T07:00:00Z",
+            },
+            {
+                "trackName": "Ave Maria",
+                "artistName": "Pablo Larrain",
+                "releaseDate": "2023-01-01T08:00:00Z",
+            },
+            {
+                "trackName": "Maria Chapdelaine",
+                "artistName": "Sébastien Pilote",
+                "releaseDate": "2021-09-24T07:00:00Z",
+            },
+            {
+                "trackName": "Maria",
+                "artistName": "",
+                "releaseDate": "2025-02-05T08:00:00Z",
+            },
+        ]
+        title, directors, year = "Maria", ["Pablo Larraín"], 2024
+
+        scores = compute_match_scores(
+            candidates, MatchTarget.from_values(title, directors, year)
+        )
+
+        self.assertEqual(
+            [round(score, 2) for score in scores], [2.2, 0.4, 0.6, -1.2, 1.6]
+        )
+        self.assertEqual(
+            [
+                compute_match_score(*get_attributes(c), title, directors, year)
+                for c in candidates
+            ],
+            scores,
+        )
+
+    def test_no_candidates(self):
+        self.assertEqual(get_matching_movie([], "Maria", ["Pablo Larraín"], 2024), {})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,9 @@ import logging
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
+
+from utils.rate_governor import RateGovernor, default_governor
 
 logger = logging.getLogger(__name__)
 
@@ -13,14 +16,27 @@ IMAGES_MAPPING = {
 
 
 class PlexAPIRequester:
-    def __init__(self, api_url: str, plex_token: str) -> None:
+    def __init__(
+        self,
+        api_url: str,
+        plex_token: str,
+        pool_size: int = 4,
+        governor: RateGovernor | None = None,
+    ) -> None:
         self.api_url = api_url.rstrip("/")
+        self.governor = governor or default_governor
         self.headers = {
             "X-Plex-Token": plex_token,
             "X-Plex-Product": "Plex poster manager",
             "X-Plex-Pms-Api-Version": "1.0",
         }
 
+        # Keep-alive connections to the server, shared by concurrent uploads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
     def get_all_movies(self) -> Response | None:
         """Get all movies."""
         endpoint = f"library/sections/6/all"
@@ -59,6 +75,17 @@ class PlexAPIRequester:
         response = self.get(endpoint, {})
         return response
 
+    def get_thumbnail(self, image_url: str, width: int, height: int) -> Response | None:
+        """Get an image resized by the Plex transcoder to fit width x height."""
+        params = {
+            "url": image_url,
+            "width": width,
+            "height": height,
+            "minSize": 0,
+            "upscale": 0,
+        }
+        return self.get("photo/:/transcode", params)
+
     def upload_image(self, id: int, image_type: str, image_url: str) -> bool:
         image_type = self.get_image_type(image_type)
         endpoint = f"library/metadata/{id}/{image_type}"
@@ -79,10 +106,13 @@ class PlexAPIRequester:
         return self.upload_image(id, "logo", logo_url)
 
     def upload_image_file(self, id: int, image_type: str, image_file_path: str) -> bool:
-        image_type = self.get_image_type(image_type)
-        endpoint = f"library/metadata/{id}/{image_type}"
         with open(image_file_path, "rb") as f:
             image_data = f.read()
+        return self.upload_image_data(id, image_type, image_data)
+
+    def upload_image_data(self, id: int, image_type: str, image_data: bytes) -> bool:
+        image_type = self.get_image_type(image_type)
+        endpoint = f"library/metadata/{id}/{image_type}"
 
         response = self.post(endpoint, data=image_data)
         if response is None:
@@ -104,7 +134,9 @@ class PlexAPIRequester:
     def get(self, endpoint: str, params: dict) -> Response | None:
         url = f"{self.api_url}/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            with self.governor.slot(url) as slot:
+                response = self.session.get(url, headers=self.headers, params=params)
+                slot.observe(response)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as e:
@@ -116,7 +148,11 @@ class PlexAPIRequester:
     ) -> Response | None:
         url = f"{self.api_url}/{endpoint}"
         try:
-            response = requests.post(url, headers=self.headers, params=params, **kwargs)
+            with self.governor.slot(url) as slot:
+                response = self.session.post(
+                    url, headers=self.headers, params=params, **kwargs
+                )
+                slot.observe(response)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as e:
@@ -126,7 +162,9 @@ class PlexAPIRequester:
     def put(self, endpoint: str, params: dict) -> Response | None:
         url = f"{self.api_url}/{endpoint}"
         try:
-            response = requests.put(url, headers=self.headers, params=params)
+            with self.governor.slot(url) as slot:
+                response = self.session.put(url, headers=self.headers, params=params)
+                slot.observe(response)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as e:
@@ -40,3 +40,17 @@ def is_from_agent(image: PlexImage) -> bool:
 
 def is_uploaded(image: PlexImage) -> bool:
     return "upload" in image["key"]
+
+
+def get_selected(images: list[PlexImage]) -> PlexImage | None:
+    return next((image for image in images if is_selected(image)), None)
+
+
+def get_upload_hash(image: PlexImage) -> str | None:
+    """
+    Hash Plex names an uploaded image after, e.g. 05dc99b9... in
+    /library/metadata/55579/file?url=upload://clearLogos/05dc99b9...
+    """
+    if not is_uploaded(image):
+        return None
+    return image["key"].rsplit("/", 1)[-1]
@@ -55,6 +55,9 @@ class PlexManager:
     def upload_image_file(self, id: int, image_type: str, image_file_path: str) -> bool:
         return self.api_requester.upload_image_file(id, image_type, image_file_path)
 
+    def upload_image_data(self, id: int, image_type: str, image_data: bytes) -> bool:
+        return self.api_requester.upload_image_data(id, image_type, image_data)
+
     def update_release_date(self, movie_id: int, release_date: str) -> bool:
         return self.api_requester.update_release_date(movie_id, release_date)
 
@@ -103,6 +106,13 @@ class PlexManager:
 
         return cast(list[PlexImage], parse_photos(api_response))
 
+    def get_thumbnail(self, key: str, size: int) -> bytes | None:
+        """Content of an image of the library, resized to fit size x size."""
+        api_response = self.api_requester.get_thumbnail(key, size, size)
+        if api_response is None:
+            return None
+        return api_response.content
+
     def get_movie_image_path(self, key: str) -> str:
         """
         Get the full path to an image based on its key.
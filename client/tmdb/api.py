@@ -4,13 +4,15 @@ import requests
 from requests.models import Response
 
 from client.tmdb.parser import get_country_release_date
+from utils.rate_governor import RateGovernor, default_governor
 
 logger = logging.getLogger(__name__)
 
 
 class TMDBAPIRequester:
-    def __init__(self, api_token: str) -> None:
+    def __init__(self, api_token: str, governor: RateGovernor | None = None) -> None:
         self.api_token = api_token
+        self.governor = governor or default_governor
         self.api_url = "https://api.themoviedb.org/3"
         self.headers = {"accept": "application/json"}
         self.image_base_url = "https://image.tmdb.org/t/p/original"
@@ -59,7 +61,9 @@ class TMDBAPIRequester:
     def get(self, endpoint: str, params: dict) -> Response | None:
         url = f"{self.api_url}/{endpoint}"
         try:
-            response = requests.get(url, headers=self.headers, params=params)
+            with self.governor.slot(url) as slot:
+                response = requests.get(url, headers=self.headers, params=params)
+                slot.observe(response)
             response.raise_for_status()
             return response
         except requests.exceptions.HTTPError as e:
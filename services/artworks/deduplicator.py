@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from client.apple_tv.extract import get_enlarged_image_url
+from services.artworks.uploader import ARTWORK_TYPES
+from utils import perceptual_hash
+from utils.requests_utils import get_request
+
+if TYPE_CHECKING:
+    from client.plex.image import PlexImage
+    from client.plex.manager import PlexManager
+    from models.artworks import Artworks, Image
+    from models.movie import Movie
+    from storage.thumbnail_cache import ThumbnailCache
+
+logger = logging.getLogger(__name__)
+
+# Smallest TMDB size available for each artwork type
+TMDB_THUMBNAIL_SIZES = {"poster": "w154", "background": "w300", "logo": "w154"}
+
+
+def get_thumbnail_url(url: str, artwork_type: str, size: int) -> str:
+    """
+    Small variant of an artwork URL, with the whole image kept:
+    https://is1-ssl.mzstatic.com/image/thumb/.../4320x3240.jpg -> .../64x64bb.jpg
+    https://image.tmdb.org/t/p/original/abc.png -> https://image.tmdb.org/t/p/w154/abc.png
+    Other URLs are returned unchanged.
+    """
+    parts = urlsplit(url)
+    if parts.netloc.endswith("mzstatic.com"):
+        extension = parts.path.rsplit(".", 1)[-1]
+        return get_enlarged_image_url(url, f"{size}x{size}bb.{extension}")
+    if parts.netloc == "image.tmdb.org":
+        return url.replace(
+            "/t/p/original/", f"/t/p/{TMDB_THUMBNAIL_SIZES[artwork_type]}/"
+        )
+    return url
+
+
+class ArtworksDeduplicator:
+    """
+    Drops the artworks that look the same as the image already selected in
+    Plex, before they are uploaded. Both images are compared on a perceptual
+    hash (dHash) of small thumbnails: the candidate's own small variant, and
+    the selected image resized by the Plex transcoder. They match when their
+    hashes differ by at most `max_distance` bits out of 64.
+
+    The images selected in Plex are given by the caller, from the lookup the
+    uploader reuses. Thumbnails and hashes are cached by URL, so only new
+    images are downloaded. Requires Pillow: without it, artworks are always kept.
+    """
+
+    def __init__(
+        self,
+        plex_manager: PlexManager,
+        cache: ThumbnailCache,
+        max_distance: int = 6,
+        thumbnail_size: int = 64,
+    ) -> None:
+        self.plex_manager = plex_manager
+        self.cache = cache
+        self.max_distance = max_distance
+        self.thumbnail_size = thumbnail_size
+
+        # Uploads dropped as duplicates, by artwork type
+        self.skipped_counts: dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+
+    def deduplicate(
+        self,
+        movie: Movie,
+        artworks: Artworks,
+        selected_images: dict[str, PlexImage | None],
+    ) -> Artworks:
+        """Copy of `artworks` without the images already selected in Plex."""
+        if not perceptual_hash.is_available():
+            return artworks
+
+        deduplicated = artworks.copy()
+        for artwork_type in ARTWORK_TYPES:
+            image = artworks[artwork_type]
+            selected = selected_images.get(artwork_type)
+            if image and self.is_duplicate(movie, artwork_type, image, selected):
+                deduplicated[artwork_type] = None
+        return deduplicated
+
+    def is_duplicate(
+        self,
+        movie: Movie,
+        artwork_type: str,
+        image: Image,
+        selected: PlexImage | None,
+    ) -> bool:
+        if selected is None:
+            return False
+
+        thumbnail_url = get_thumbnail_url(
+            image["url"], artwork_type, self.thumbnail_size
+        )
+        candidate_hash = self.get_hash(
+            thumbnail_url, lambda: self.download(thumbnail_url)
+        )
+        if candidate_hash is None:
+            return False
+
+        key = selected["key"]
+        selected_hash = self.get_hash(
+            key, lambda: self.plex_manager.get_thumbnail(key, self.thumbnail_size)
+        )
+        if selected_hash is None:
+            return False
+
+        distance = perceptual_hash.hamming_distance(candidate_hash, selected_hash)
+        if distance > self.max_distance:
+            return False
+
+        with self._stats_lock:
+            self.skipped_counts[artwork_type] = (
+                self.skipped_counts.get(artwork_type, 0) + 1
+            )
+        logger.info(
+            f"Skipped {artwork_type} upload for movie '{movie['title']}' "
+            f"(ID: {movie['plex_movie_id']}): same as the selected image "
+            f"(distance {distance})"
+        )
+        return True
+
+    def get_hash(self, url: str, fetch: Callable[[], bytes | None]) -> int | None:
+        """Hash of the thumbnail at `url`, from the cache or from `fetch()`."""
+        value = self.cache.get_hash(url)
+        if value is not None:
+            return value
+
+        thumbnail = self.cache.get_thumbnail(url)
+        if thumbnail is None:
+            thumbnail = fetch()
+            if thumbnail is None:
+                return None
+            self.cache.add_thumbnail(url, thumbnail)
+
+        value = perceptual_hash.image_dhash(thumbnail)
+        if value is not None:
+            self.cache.add_hash(url, value)
+        return value
+
+    @staticmethod
+    def download(url: str) -> bytes | None:
+        response = get_request(url)
+        return response.content if response is not None else None
+
+    def log_stats(self) -> None:
+        """Log the uploads dropped as duplicates since the last call, then reset them."""
+        with self._stats_lock:
+            for artwork_type in ARTWORK_TYPES:
+                count = self.skipped_counts.get(artwork_type)
+                if count:
+                    logger.info(
+                        f"Plex {artwork_type} uploads skipped as duplicates: {count}"
+                    )
+            self.skipped_counts = {}
+
+    def save(self) -> None:
+        """Persist the hashes computed during the run."""
+        self.cache.save()
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import AbstractContextManager, nullcontext
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from client.google.quota import QuotaExhaustedError
+
+if TYPE_CHECKING:
+    from models.artworks import Artworks
+    from models.movie import Movie
+    from services.artworks.updater import ArtworksUpdater
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+@dataclass
+class UpdateJob:
+    """
+    One movie to update. `scope` wraps its retrieval, e.g. to charge its CSE
+    calls to a quota consumer.
+    """
+
+    movie: Movie
+    current_artworks: Artworks | None = None
+    scope: Callable[[], AbstractContextManager] = field(default=nullcontext)
+
+
+@dataclass
+class UpdateResult:
+    """Same status, artworks and search count as ArtworksUpdater.update."""
+
+    job: UpdateJob
+    status: str
+    artworks: Artworks
+    search_count: int
+
+
+class ArtworksPipeline:
+    """
+    Runs ArtworksUpdater.update over many movies with retrieval and upload
+    overlapped: retrieval workers fetch and select the next movies while upload
+    workers send the previous ones to Plex.
+
+    - Retrieved movies wait in a bounded queue of `queue_size`, so retrieval
+      never runs more than that many movies ahead of the uploads
+    - Each stage has its own number of workers and pause after every movie
+    - Results come back in job order
+
+    Jobs are pulled lazily from the retriever side: a job generator sees the
+    up-to-date `search_count` of the run, e.g. to stop at a quota.
+
+    Retrieval runs on a single worker: providers and the quota ledger keep the
+    state of the movie being retrieved on their instance (resolved Apple TV
+    URL, iTunes prefetches, charged quota consumer), so two movies cannot be
+    retrieved at once.
+    """
+
+    def __init__(
+        self,
+        artworks_updater: ArtworksUpdater,
+        upload_workers: int = 1,
+        retrieve_interval: float = 0.0,
+        upload_interval: float = 0.0,
+        queue_size: int = 2,
+    ) -> None:
+        self.updater = artworks_updater
+        self.upload_workers = upload_workers
+        self.retrieve_interval = retrieve_interval
+        self.upload_interval = upload_interval
+        self.queue_size = queue_size
+
+        # CSE queries made by the retrievals of the current run
+        self.search_count = 0
+        self._jobs_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+
+    def run(self, jobs: Iterable[UpdateJob]) -> Iterator[UpdateResult]:
+        """Update every job and yield its result, in job order."""
+        self.search_count = 0
+        numbered_jobs = enumerate(jobs)
+        uploads: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        results: queue.Queue = queue.Queue()
+        stop = threading.Event()
+
+        def next_job() -> tuple[int, UpdateJob] | None:
+            # Generators are not thread-safe
+            with self._jobs_lock:
+                if stop.is_set():
+                    return None
+                return next(numbered_jobs, None)
+
+        def fail(index: int, error: BaseException) -> None:
+            results.put((index, error))
+            stop.set()
+
+        def retrieve() -> None:
+            while True:
+                try:
+                    item = next_job()
+                except BaseException as e:
+                    # The job generator failed: end the run with its error
+                    fail(-1, e)
+                    return
+                if item is None:
+                    return
+
+                index, job = item
+                try:
+                    result = self._retrieve(job)
+                except BaseException as e:
+                    fail(index, e)
+                    return
+
+                if isinstance(result, UpdateResult):
+                    results.put((index, result))
+                else:
+                    uploads.put((index, result))
+                time.sleep(self.retrieve_interval)
+
+        def upload() -> None:
+            while (item := uploads.get()) is not _DONE:
+                # Keep draining after a failure so the retriever never blocks
+                if stop.is_set():
+                    continue
+
+                index, (job, artworks, search_count) = item
+                try:
+                    results.put((index, self._upload(job, artworks, search_count)))
+                except BaseException as e:
+                    fail(index, e)
+                    continue
+                time.sleep(self.upload_interval)
+
+        def coordinate() -> None:
+            retriever.join()
+            for _ in uploaders:
+                uploads.put(_DONE)
+            for thread in uploaders:
+                thread.join()
+            results.put(_DONE)
+
+        retriever = threading.Thread(
+            target=retrieve, name="artworks-retrieve", daemon=True
+        )
+        uploaders = [
+            threading.Thread(target=upload, name=f"artworks-upload-{i}", daemon=True)
+            for i in range(self.upload_workers)
+        ]
+        for thread in [retriever, *uploaders]:
+            thread.start()
+        threading.Thread(target=coordinate, daemon=True).start()
+
+        pending: dict[int, UpdateResult] = {}
+        next_index = 0
+        try:
+            while (item := results.get()) is not _DONE:
+                index, result = item
+                if isinstance(result, BaseException):
+                    raise result
+
+                pending[index] = result
+                while next_index in pending:
+                    yield pending.pop(next_index)
+                    next_index += 1
+        finally:
+            stop.set()
+
+    def _retrieve(
+        self, job: UpdateJob
+    ) -> UpdateResult | tuple[UpdateJob, Artworks, int]:
+        """Fetch a job: its final result when no upload is needed, else the upload."""
+        try:
+            with job.scope():
+                artworks, search_count = self.updater.fetch(job.movie)
+        except QuotaExhaustedError:
+            return UpdateResult(job, *self.updater.quota_exhausted(job.movie))
+
+        with self._count_lock:
+            self.search_count += search_count
+
+        if not self.updater.are_better(artworks, job.current_artworks):
+            return UpdateResult(job, "unchanged_artworks", artworks, search_count)
+
+        return job, artworks, search_count
+
+    def _upload(
+        self, job: UpdateJob, artworks: Artworks, search_count: int
+    ) -> UpdateResult:
+        uploaded = self.updater.upload(job.movie, artworks)
+        status = self.updater.get_status(job.movie, artworks, uploaded)
+        return UpdateResult(job, status, artworks, search_count)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING
 
 from services.artworks.fallback_logo import FallbackLogoProvider
 from services.localizer.country_provider import CountryProvider
 
 if TYPE_CHECKING:
+    from client.apple_tv.image_probe import ImageProber
     from models.artworks import Artworks, Image
     from models.movie import Movie
     from services.localizer.localizer import Localizer
@@ -18,26 +21,47 @@ logger = logging.getLogger(__name__)
 
 
 class ArtworksRetriever:
-    """Fetches and assembles artworks from external metadata sources (Apple, TMDB)."""
+    """
+    Fetches and assembles artworks from external metadata sources (Apple, TMDB).
+
+    Countries are merged in priority order: a lower-priority country only fills
+    the artworks still missing. With `prefetch_workers`, the lookups of every
+    country that do not depend on the others (localized title, provider
+    prefetch such as iTunes) start concurrently when the movie starts; the
+    merge stays sequential, so the selection is the same, and prefetches still
+    pending are cancelled once the artworks are complete.
+
+    With an `image_prober`, an image is checked (and swapped for its largest
+    served variant) only when it is kept, so the images of lower-priority
+    countries that are discarded are never downloaded. An image without valid
+    variant leaves its slot to the next country.
+    """
 
     def __init__(
         self,
-        provider: Provider,
+        provider: Provider | list[Provider],
         localizer: Localizer,
         countries_priority: list[str],
-        retrieve_interval: float = 1.0,
+        retrieve_interval: float = 0.0,
         fallback_logo_provider: LogoProvider | None = None,
+        prefetch_workers: int = 0,
+        image_prober: ImageProber | None = None,
     ):
         if len(countries_priority) == 0:
             raise ValueError("At least one country must be specified")
 
-        self.provider = provider
+        # Provider chain: later providers only run when earlier ones find nothing
+        self.providers = provider if isinstance(provider, list) else [provider]
         self.localizer = localizer
+        self.image_prober = image_prober
         self.retrieve_interval = retrieve_interval
         self.countries_priority = countries_priority
 
         self.countries_providers = [
-            CountryProvider(provider, localizer, country)
+            [
+                CountryProvider(provider, localizer, country)
+                for provider in self.providers
+            ]
             for country in countries_priority
         ]
         self.fallback_logo_provider = (
@@ -46,6 +70,17 @@ class ArtworksRetriever:
             else None
         )
 
+        self.executor = (
+            ThreadPoolExecutor(prefetch_workers, thread_name_prefix="prefetch")
+            if prefetch_workers > 0
+            else None
+        )
+
+        self.movie_count = 0
+        self.found_count = 0
+        self.found_without_search_count = 0
+        self.prefetch_cancelled_count = 0
+
     def get_country_rank(self, country: str) -> int:
         try:
             return self.countries_priority.index(country)
@@ -59,29 +94,131 @@ class ArtworksRetriever:
             "logo": None,
         }
         search_count = 0
+        for provider in self.providers:
+            provider.begin_movie()
 
-        for country_provider in self.countries_providers:
-            logger.debug(
-                f"Fetching {country_provider.country.upper()} artworks for '{movie['title']}'"
-            )
-            poster, background, logo, count = country_provider.get_artworks(movie)
-            search_count += count
+        cancelled = threading.Event()
+        prefetches = self.start_prefetches(movie, cancelled)
+        try:
+            for rank, country_providers in enumerate(self.countries_providers):
+                logger.debug(
+                    f"Fetching {country_providers[0].country.upper()} artworks for '{movie['title']}'"
+                )
+                localized_title = prefetches[rank].result() if prefetches else None
+                poster, background, logo, count = self.get_country_artworks(
+                    country_providers, movie, localized_title
+                )
+                search_count += count
 
-            self.update_image(artworks, "poster", poster)
-            self.update_image(artworks, "background", background)
-            self.update_image(artworks, "logo", logo)
+                self.update_image(
+                    artworks, "poster", self.probe_image(artworks, "poster", poster)
+                )
+                self.update_image(
+                    artworks,
+                    "background",
+                    self.probe_image(artworks, "background", background),
+                )
+                self.update_image(
+                    artworks, "logo", self.probe_image(artworks, "logo", logo)
+                )
 
-            if self.is_complete(artworks):
-                break
+                if self.is_complete(artworks):
+                    break
 
-            time.sleep(self.retrieve_interval)
+                # Prefetched countries are already on their way
+                if not prefetches:
+                    time.sleep(self.retrieve_interval)
+        finally:
+            self.cancel_prefetches(prefetches, cancelled)
 
         if self.fallback_logo_provider:
             fallback_logo = self.fallback_logo_provider.get_logo(movie, artworks)
             self.update_image(artworks, "fallback_logo", fallback_logo)
 
+        self.movie_count += 1
+        if any(artworks.values()):
+            self.found_count += 1
+            if search_count == 0:
+                self.found_without_search_count += 1
+
         return artworks, search_count
 
+    def start_prefetches(
+        self, movie: Movie, cancelled: threading.Event
+    ) -> list[Future[str | None]]:
+        """One prefetch per country, submitted in priority order."""
+        if self.executor is None:
+            return []
+        return [
+            self.executor.submit(self.prefetch_country, providers, movie, cancelled)
+            for providers in self.countries_providers
+        ]
+
+    def prefetch_country(
+        self,
+        country_providers: list[CountryProvider],
+        movie: Movie,
+        cancelled: threading.Event,
+    ) -> str | None:
+        """Localized title of the country, with its provider chain prefetched."""
+        localized_title = country_providers[0].get_localized_title(movie)
+        if not localized_title:
+            return None
+
+        for country_provider in country_providers:
+            if cancelled.is_set():
+                break
+            try:
+                country_provider.prefetch(movie, localized_title)
+            except Exception as e:
+                # The provider will look it up again when its turn comes
+                logger.debug(f"Prefetch failed for {country_provider.country}: {e}")
+        return localized_title
+
+    def cancel_prefetches(
+        self, prefetches: list[Future[str | None]], cancelled: threading.Event
+    ) -> None:
+        cancelled.set()
+        for future in prefetches:
+            if future.cancel():
+                self.prefetch_cancelled_count += 1
+
+    def get_country_artworks(
+        self,
+        country_providers: list[CountryProvider],
+        movie: Movie,
+        localized_title: str | None = None,
+    ) -> tuple[Image | None, Image | None, Image | None, int]:
+        """Run the provider chain for one country, stopping at the first hit."""
+        search_count = 0
+        for country_provider in country_providers:
+            poster, background, logo, count = country_provider.get_artworks(
+                movie, localized_title
+            )
+            search_count += count
+            if poster or background or logo:
+                return poster, background, logo, search_count
+        return None, None, None, search_count
+
+    def probe_image(
+        self, artworks: Artworks, artwork_name: str, new_image: Image | None
+    ) -> Image | None:
+        """The image with its largest served variant, if it is about to be kept."""
+        if (
+            self.image_prober is None
+            or new_image is None
+            or artworks[artwork_name] is not None
+        ):
+            return new_image
+
+        url = self.image_prober.select_artwork(new_image["url"], artwork_name)
+        if url is None:
+            return None
+
+        probed_image = new_image.copy()
+        probed_image["url"] = url
+        return probed_image
+
     def update_image(
         self, artworks: Artworks, artwork_name: str, new_image: Image | None
     ) -> None:
@@ -97,3 +234,29 @@ class ArtworksRetriever:
 
     def is_complete(self, artworks: Artworks) -> bool:
         return all(artworks[key] for key in ["poster", "background", "logo"])
+
+    def log_stats(self) -> None:
+        if self.movie_count:
+            logger.info(
+                f"Artworks found for {self.found_count}/{self.movie_count} movie(s), "
+                f"{self.found_without_search_count} "
+                f"({self.found_without_search_count / self.movie_count:.0%}) "
+                "without spending CSE quota"
+            )
+        if self.prefetch_cancelled_count:
+            logger.info(
+                f"{self.prefetch_cancelled_count} country prefetch(es) cancelled "
+                "once artworks were complete"
+            )
+        self.movie_count = 0
+        self.found_count = 0
+        self.found_without_search_count = 0
+        self.prefetch_cancelled_count = 0
+
+        for provider in self.providers:
+            provider.log_stats()
+
+    def save(self) -> None:
+        """Persist the providers' caches at the end of a run."""
+        for provider in self.providers:
+            provider.save()
@@ -0,0 +1,128 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from services.artworks.deduplicator import ArtworksDeduplicator, get_thumbnail_url
+from storage.thumbnail_cache import ThumbnailCache
+
+APPLE_URL = (
+    "https://is1-ssl.mzstatic.com/image/thumb/Video/v4/ab/cd/source/4320x3240.jpg"
+)
+SELECTED_KEY = "/library/metadata/1/file?url=metadata://arts/tv.plex.agents.movie_abc"
+
+
+class TestGetThumbnailUrl(unittest.TestCase):
+    def test_apple(self):
+        self.assertEqual(
+            get_thumbnail_url(APPLE_URL, "background", 64),
+            "https://is1-ssl.mzstatic.com/image/thumb/Video/v4/ab/cd/source/64x64bb.jpg",
+        )
+
+    def test_tmdb(self):
+        self.assertEqual(
+            get_thumbnail_url("https://image.tmdb.org/t/p/original/a.png", "logo", 64),
+            "https://image.tmdb.org/t/p/w154/a.png",
+        )
+
+    def test_other(self):
+        url = "https://example.com/a.jpg"
+        self.assertEqual(get_thumbnail_url(url, "poster", 64), url)
+
+
+class TestArtworksDeduplicator(unittest.TestCase):
+    movie = {"plex_movie_id": 1, "title": "Test Movie"}
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_path = tmpdir.name
+        self.cache = ThumbnailCache(self.cache_path)
+
+        self.plex_manager = MagicMock()
+        self.selected_images = {"background": {"key": SELECTED_KEY, "selected": "1"}}
+        self.plex_manager.get_thumbnail.return_value = b"selected"
+        self.deduplicator = ArtworksDeduplicator(
+            self.plex_manager, self.cache, max_distance=2
+        )
+
+        self.hashes = {b"candidate": 0b0111, b"selected": 0b0100}
+        hash_patchers = [
+            patch("utils.perceptual_hash.is_available", return_value=True),
+            patch("utils.perceptual_hash.image_dhash", side_effect=self.hashes.get),
+        ]
+        for patcher in hash_patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        get_patcher = patch("services.artworks.deduplicator.get_request")
+        self.get_request = get_patcher.start()
+        self.addCleanup(get_patcher.stop)
+        self.get_request.return_value.content = b"candidate"
+
+        self.artworks = {
+            "poster": None,
+            "background": {
+                "url": APPLE_URL,
+                "country": "us",
+                "title": "T",
+                "source": "apple",
+            },
+            "logo": None,
+        }
+
+    def test_close_hashes_are_dropped(self):
+        deduplicated = self.deduplicator.deduplicate(
+            self.movie, self.artworks, self.selected_images
+        )
+
+        self.assertIsNone(deduplicated["background"])
+        self.assertIsNotNone(self.artworks["background"])
+        self.assertEqual(self.deduplicator.skipped_counts, {"background": 1})
+        self.plex_manager.get_thumbnail.assert_called_once_with(SELECTED_KEY, 64)
+
+    def test_distant_hashes_are_kept(self):
+        self.hashes[b"selected"] = 0b1000
+
+        deduplicated = self.deduplicator.deduplicate(
+            self.movie, self.artworks, self.selected_images
+        )
+
+        self.assertEqual(deduplicated, self.artworks)
+
+    def test_hashes_are_cached_per_url(self):
+        self.deduplicator.deduplicate(self.movie, self.artworks, self.selected_images)
+        self.deduplicator.deduplicate(self.movie, self.artworks, self.selected_images)
+
+        self.get_request.assert_called_once()
+        self.plex_manager.get_thumbnail.assert_called_once()
+        self.deduplicator.save()
+        reloaded = ThumbnailCache(self.cache_path)
+        self.assertEqual(reloaded.get_hash(SELECTED_KEY), 0b0100)
+        # Hashed thumbnails are not kept
+        self.assertEqual(list(self.cache.directory.iterdir()), [])
+
+    def test_nothing_selected_in_plex(self):
+        self.selected_images = {"background": None}
+
+        deduplicated = self.deduplicator.deduplicate(
+            self.movie, self.artworks, self.selected_images
+        )
+
+        self.assertEqual(deduplicated, self.artworks)
+        self.get_request.assert_not_called()
+
+    def test_failed_download_keeps_artwork(self):
+        self.get_request.return_value = None
+
+        deduplicated = self.deduplicator.deduplicate(
+            self.movie, self.artworks, self.selected_images
+        )
+
+        self.assertEqual(deduplicated, self.artworks)
+        self.assertIsNone(
+            self.cache.get_thumbnail(get_thumbnail_url(APPLE_URL, "background", 64))
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+import threading
+import unittest
+from unittest.mock import MagicMock
+
+from client.google.quota import QuotaExhaustedError
+from services.artworks.pipeline import ArtworksPipeline, UpdateJob
+from services.artworks.updater import ArtworksUpdater
+
+
+def make_artworks(title: str) -> dict:
+    return {
+        "poster": {"url": f"https://example.com/{title}.jpg", "country": "us"},
+        "background": None,
+        "logo": None,
+    }
+
+
+class TestArtworksPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.retriever = MagicMock()
+        self.retriever.get_country_rank.return_value = 0
+        self.selector = MagicMock()
+        self.uploader = MagicMock()
+        self.updater = ArtworksUpdater(self.retriever, self.selector, self.uploader)
+
+        self.selector.select.side_effect = lambda artworks, movie: artworks
+        self.selector.are_empty.return_value = False
+        self.selector.are_perfect.side_effect = lambda artworks, movie: movie["perfect"]
+
+    def test_same_statuses_as_update(self):
+        movies = [
+            {"title": "A", "perfect": True},
+            {"title": "B", "perfect": False},
+            {"title": "C", "perfect": True},
+            {"title": "D", "perfect": True},
+        ]
+        self.retriever.retrieve.side_effect = lambda movie: (
+            make_artworks(movie["title"]),
+            1,
+        )
+        self.uploader.upload.side_effect = lambda movie, artworks: movie["title"] != "D"
+        # C already has the artworks it would get
+        jobs = [UpdateJob(movie) for movie in movies]
+        jobs[2].current_artworks = make_artworks("C")
+
+        expected = [
+            self.updater.update(job.movie, job.current_artworks) for job in jobs
+        ]
+        pipeline = ArtworksPipeline(self.updater, upload_workers=2)
+        results = list(pipeline.run(jobs))
+
+        self.assertEqual(
+            [(r.status, r.artworks, r.search_count) for r in results], expected
+        )
+        self.assertEqual([r.job for r in results], jobs)
+        self.assertEqual(
+            [status for status, _, _ in expected],
+            ["success", "imperfect_artworks", "unchanged_artworks", "upload_failed"],
+        )
+        self.assertEqual(pipeline.search_count, 4)
+
+    def test_quota_refusal_is_a_result(self):
+        movies = [{"title": "A", "perfect": True}, {"title": "B", "perfect": True}]
+
+        def retrieve(movie):
+            if movie["title"] == "A":
+                raise QuotaExhaustedError("A")
+            return make_artworks(movie["title"]), 1
+
+        self.retriever.retrieve.side_effect = retrieve
+        self.uploader.upload.return_value = True
+
+        results = list(ArtworksPipeline(self.updater).run(map(UpdateJob, movies)))
+
+        self.assertEqual([r.status for r in results], ["quota_exhausted", "success"])
+        self.assertEqual(
+            self.updater.update(movies[0], None),
+            (results[0].status, results[0].artworks, results[0].search_count),
+        )
+        self.uploader.upload.assert_called_once()
+
+    def test_next_retrieval_runs_during_upload(self):
+        second_fetched = threading.Event()
+
+        def retrieve(movie):
+            if movie["title"] == "B":
+                second_fetched.set()
+            return make_artworks(movie["title"]), 0
+
+        def upload(movie, artworks):
+            if movie["title"] == "A":
+                # Blocks forever if retrieval waited for this upload
+                return second_fetched.wait(timeout=5)
+            return True
+
+        self.retriever.retrieve.side_effect = retrieve
+        self.uploader.upload.side_effect = upload
+
+        pipeline = ArtworksPipeline(self.updater)
+        jobs = [UpdateJob({"title": t, "perfect": True}) for t in "AB"]
+        statuses = [result.status for result in pipeline.run(jobs)]
+
+        self.assertEqual(statuses, ["success", "success"])
+
+    def test_stage_error_is_raised(self):
+        self.retriever.retrieve.side_effect = RuntimeError("boom")
+
+        pipeline = ArtworksPipeline(self.updater)
+        with self.assertRaises(RuntimeError):
+            list(pipeline.run([UpdateJob({"title": "A", "perfect": True})]))
+
+    def test_job_generator_error_is_raised(self):
+        self.retriever.retrieve.return_value = (make_artworks("A"), 0)
+
+        def jobs():
+            yield UpdateJob({"title": "A", "perfect": True})
+            raise ConnectionError("plex down")
+
+        pipeline = ArtworksPipeline(self.updater)
+        with self.assertRaises(ConnectionError):
+            list(pipeline.run(jobs()))
+
+    def test_scope_wraps_retrieval(self):
+        scope = MagicMock()
+        self.retriever.retrieve.return_value = (make_artworks("A"), 2)
+
+        pipeline = ArtworksPipeline(self.updater)
+        list(pipeline.run([UpdateJob({"title": "A", "perfect": True}, None, scope)]))
+
+        scope.assert_called_once_with()
+        scope.return_value.__enter__.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,3 +1,4 @@
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
@@ -570,6 +571,204 @@ class TestArtworksUpdater(unittest.TestCase):
         }
         self.assertEqual(artworks, expected_artworks)
 
+    def test_get_artworks_provider_chain(self):
+        """First provider finds FR, misses US: the next provider runs for US only"""
+
+        countries = ["fr", "us"]
+        first_provider = MagicMock()
+        first_provider.name = "apple"
+        first_provider.get_artworks.side_effect = [
+            ("poster_url_fr", None, None, 0),
+            (None, None, None, 0),
+        ]
+        self.provider.get_artworks.return_value = (None, "background_url_us", None, 1)
+        self.localizer.get_localized_title.return_value = "Captain America"
+
+        self.artworks_retriever = ArtworksRetriever(
+            [first_provider, self.provider], self.localizer, countries
+        )
+
+        movie: Movie = {
+            "plex_movie_id": 1111,
+            "title": "Captain America : Brave New World",
+            "year": 2025,
+            "added_date": 1700000000,
+            "release_date": "2025-02-12",
+            "director": ["Julius Onah"],
+            "metadata_country": "fr",
+            "guid": None,
+            "tmdb_id": None,
+        }
+
+        artworks, search_count = self.artworks_retriever.retrieve(movie)
+
+        self.assertEqual(artworks["poster"]["country"], "fr")
+        self.assertEqual(artworks["background"]["country"], "us")
+        self.assertEqual(search_count, 1)
+        self.provider.get_artworks.assert_called_once()
+        first_provider.begin_movie.assert_called_once()
+        self.provider.begin_movie.assert_called_once()
+
+    def test_only_kept_images_are_probed(self):
+        """FR poster has no valid variant: US fills it, FR background is not probed again"""
+
+        countries = ["fr", "us"]
+        self.provider.get_artworks.side_effect = [
+            ("poster_url_fr", "background_url_fr", None, 0),
+            ("poster_url_us", "background_url_us", "logo_url_us", 0),
+        ]
+        self.localizer.get_localized_title.return_value = "Captain America"
+        image_prober = MagicMock()
+        image_prober.select_artwork.side_effect = lambda url, _: (
+            None if url == "poster_url_fr" else f"{url}_largest"
+        )
+
+        self.artworks_retriever = ArtworksRetriever(
+            self.provider, self.localizer, countries, image_prober=image_prober
+        )
+
+        movie: Movie = {
+            "plex_movie_id": 1111,
+            "title": "Captain America : Brave New World",
+            "year": 2025,
+            "added_date": 1700000000,
+            "release_date": "2025-02-12",
+            "director": ["Julius Onah"],
+            "metadata_country": "fr",
+            "guid": None,
+            "tmdb_id": None,
+        }
+
+        artworks, _ = self.artworks_retriever.retrieve(movie)
+
+        self.assertEqual(artworks["poster"]["url"], "poster_url_us_largest")
+        self.assertEqual(artworks["background"]["url"], "background_url_fr_largest")
+        self.assertEqual(artworks["logo"]["url"], "logo_url_us_largest")
+        self.assertEqual(
+            [call.args for call in image_prober.select_artwork.call_args_list],
+            [
+                ("poster_url_fr", "poster"),
+                ("background_url_fr", "background"),
+                ("poster_url_us", "poster"),
+                ("logo_url_us", "logo"),
+            ],
+        )
+
+    def test_log_stats_counts_movies_found_without_search(self):
+        self.provider.get_artworks.side_effect = [
+            ("poster_url_fr", None, None, 0),
+            ("poster_url_fr", None, None, 2),
+            (None, None, None, 1),
+        ]
+        self.artworks_retriever = ArtworksRetriever(
+            self.provider, self.localizer, ["fr"]
+        )
+        movie: Movie = {
+            "plex_movie_id": 1111,
+            "title": "Captain America : Brave New World",
+            "year": 2025,
+            "added_date": 1700000000,
+            "release_date": "2025-02-12",
+            "director": ["Julius Onah"],
+            "metadata_country": "fr",
+            "guid": None,
+            "tmdb_id": None,
+        }
+
+        for _ in range(3):
+            self.artworks_retriever.retrieve(movie)
+
+        self.assertEqual(self.artworks_retriever.movie_count, 3)
+        self.assertEqual(self.artworks_retriever.found_count, 2)
+        self.assertEqual(self.artworks_retriever.found_without_search_count, 1)
+
+        with self.assertLogs("services.artworks.retriever") as logs:
+            self.artworks_retriever.log_stats()
+        self.assertIn("1 (33%) without spending CSE quota", logs.output[0])
+        self.assertEqual(self.artworks_retriever.movie_count, 0)
+
+
+class TestArtworksRetrieverPrefetch(unittest.TestCase):
+    movie: Movie = {
+        "plex_movie_id": 1111,
+        "title": "Captain America : Brave New World",
+        "year": 2025,
+        "added_date": 1700000000,
+        "release_date": "2025-02-12",
+        "director": ["Julius Onah"],
+        "metadata_country": "fr",
+        "guid": None,
+        "tmdb_id": 822119,
+    }
+
+    def setUp(self):
+        self.provider = MagicMock()
+        self.provider.name = "apple"
+        self.localizer = MagicMock()
+        self.localizer.get_localized_title.side_effect = (
+            lambda movie, country: f"title_{country}"
+        )
+
+        sleep_patcher = patch("time.sleep", return_value=None)
+        sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_same_selection_as_sequential(self):
+        images = {
+            "fr": ("poster_fr", None, None, 1),
+            "us": (None, "background_us", None, 2),
+            "gb": ("poster_gb", "background_gb", "logo_gb", 1),
+            "de": ("poster_de", "background_de", "logo_de", 1),
+        }
+        self.provider.get_artworks.side_effect = (
+            lambda title, directors, year, country, entity: images[country]
+        )
+        countries = list(images)
+
+        sequential = ArtworksRetriever(self.provider, self.localizer, countries)
+        concurrent = ArtworksRetriever(
+            self.provider, self.localizer, countries, prefetch_workers=4
+        )
+        self.addCleanup(concurrent.executor.shutdown)
+
+        expected = sequential.retrieve(self.movie)
+        self.assertEqual(concurrent.retrieve(self.movie), expected)
+        self.assertEqual(expected[0]["logo"]["country"], "gb")
+        self.assertEqual(expected[1], 4)
+
+        concurrent.executor.shutdown(wait=True)
+        prefetched = {c.args[3] for c in self.provider.prefetch.call_args_list}
+        self.assertLessEqual({"fr", "us", "gb"}, prefetched)
+
+    def test_pending_prefetches_cancelled_once_complete(self):
+        us_started, release = threading.Event(), threading.Event()
+
+        def get_localized_title(movie, country):
+            if country == "us":
+                us_started.set()
+                release.wait(timeout=5)
+            return f"title_{country}"
+
+        def get_artworks(title, directors, year, country, entity):
+            us_started.wait(timeout=5)
+            return "poster", "background", "logo", 0
+
+        self.localizer.get_localized_title.side_effect = get_localized_title
+        self.provider.get_artworks.side_effect = get_artworks
+
+        retriever = ArtworksRetriever(
+            self.provider, self.localizer, ["fr", "us", "gb"], prefetch_workers=1
+        )
+        artworks, _ = retriever.retrieve(self.movie)
+        release.set()
+        retriever.executor.shutdown(wait=True)
+
+        self.assertEqual(artworks["poster"]["country"], "fr")
+        # GB never started, US stopped before its provider prefetch
+        self.assertEqual(retriever.prefetch_cancelled_count, 1)
+        self.provider.prefetch.assert_called_once()
+        self.assertEqual(self.provider.prefetch.call_args.args[3], "fr")
+
 
 if __name__ == "__main__":
     unittest.main()
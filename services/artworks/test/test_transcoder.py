@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+
+from services.artworks.transcoder import ArtworksTranscoder
+
+
+class TestArtworksTranscoder(unittest.TestCase):
+    def setUp(self):
+        self.transcoder = ArtworksTranscoder({"poster": (10, 20)}, quality=70)
+
+        patchers = {
+            "available": patch("utils.image_transcode.is_available", return_value=True),
+            "transcode": patch("utils.image_transcode.transcode"),
+            "get_request": patch("services.artworks.transcoder.get_request"),
+        }
+        self.mocks = {name: p.start() for name, p in patchers.items()}
+        for p in patchers.values():
+            self.addCleanup(p.stop)
+        self.mocks["get_request"].return_value.content = b"x" * 100
+
+    def test_smaller_result_is_used(self):
+        self.mocks["transcode"].return_value = b"y" * 40
+
+        data = self.transcoder.transcode("https://example.com/p.jpg", "poster")
+
+        self.assertEqual(data, b"y" * 40)
+        self.mocks["transcode"].assert_called_once_with(b"x" * 100, 10, 20, 70)
+        self.assertEqual(self.transcoder.max_sizes["logo"], (800, 310))
+
+        with self.assertLogs("services.artworks.transcoder") as logs:
+            self.transcoder.log_stats()
+        self.assertIn("Transcoded artworks: 1", logs.output[0])
+        self.assertEqual(self.transcoder.original_bytes, 0)
+
+    def test_original_kept_when_not_smaller(self):
+        self.mocks["transcode"].return_value = b"y" * 200
+
+        data = self.transcoder.transcode("https://example.com/p.jpg", "poster")
+
+        self.assertEqual(data, b"x" * 100)
+        self.assertEqual(self.transcoder.uploaded_bytes, 100)
+
+    def test_failures_fall_back_to_url(self):
+        self.mocks["transcode"].return_value = None
+        with self.assertLogs("services.artworks.transcoder", "WARNING"):
+            self.assertIsNone(
+                self.transcoder.transcode("https://example.com/p.jpg", "poster")
+            )
+
+        self.mocks["get_request"].return_value = None
+        self.assertIsNone(
+            self.transcoder.transcode("https://example.com/p.jpg", "poster")
+        )
+        self.assertEqual(self.transcoder.count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
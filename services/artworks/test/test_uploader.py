@@ -0,0 +1,273 @@
+import hashlib
+import tempfile
+import threading
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from services.artworks.uploader import ArtworksUploader
+from storage.upload_fingerprints import UploadFingerprints
+
+
+def make_image(artwork_type: str) -> dict:
+    return {
+        "url": f"https://example.com/{artwork_type}.jpg",
+        "country": "us",
+        "title": "Test Movie",
+        "source": "apple",
+    }
+
+
+class TestArtworksUploader(unittest.TestCase):
+    movie = {"plex_movie_id": 1, "title": "Test Movie"}
+
+    def setUp(self):
+        self.plex_manager = MagicMock()
+        self.plex_manager.upload_image.return_value = True
+        self.uploader = ArtworksUploader(self.plex_manager, upload_interval=1.0)
+        self.addCleanup(self.uploader.executor.shutdown)
+
+        sleep_patcher = patch("services.artworks.uploader.time.sleep")
+        self.sleep = sleep_patcher.start()
+        self.addCleanup(sleep_patcher.stop)
+
+    def test_types_are_uploaded_concurrently(self):
+        # Each upload waits for the two others: only passes if all are in flight
+        barrier = threading.Barrier(3, timeout=5)
+        self.plex_manager.upload_image.side_effect = lambda *args: barrier.wait() >= 0
+
+        artworks = {t: make_image(t) for t in ["poster", "background", "logo"]}
+        self.assertTrue(self.uploader.upload(self.movie, artworks))
+
+        self.assertEqual(self.plex_manager.upload_image.call_count, 3)
+        self.sleep.assert_called_once_with(1.0)
+
+    def test_no_sleep_when_nothing_sent(self):
+        artworks = {"poster": None, "background": None, "logo": None}
+
+        self.assertTrue(self.uploader.upload(self.movie, artworks))
+
+        self.plex_manager.upload_image.assert_not_called()
+        self.sleep.assert_not_called()
+
+    def test_one_failed_upload_fails_the_movie(self):
+        self.plex_manager.upload_image.side_effect = (
+            lambda movie_id, artwork_type, url: artwork_type != "logo"
+        )
+        artworks = {t: make_image(t) for t in ["poster", "background", "logo"]}
+
+        self.assertFalse(self.uploader.upload(self.movie, artworks))
+        self.assertEqual(self.plex_manager.upload_image.call_count, 3)
+
+    def test_failed_upload_is_queued_in_outbox(self):
+        self.uploader.outbox = MagicMock()
+        self.plex_manager.upload_image.side_effect = (
+            lambda movie_id, artwork_type, url: artwork_type != "logo"
+        )
+        artworks = {t: make_image(t) for t in ["poster", "background", "logo"]}
+
+        self.assertTrue(self.uploader.upload(self.movie, artworks))
+
+        self.uploader.outbox.add.assert_called_once_with(
+            self.movie, "logo", artworks["logo"]
+        )
+        self.assertEqual(self.uploader.outbox.discard.call_count, 2)
+
+    def test_unreachable_plex_is_queued_in_outbox(self):
+        self.uploader.outbox = MagicMock()
+        self.plex_manager.upload_image.side_effect = requests.ConnectionError()
+        artworks = {"poster": make_image("poster"), "background": None, "logo": None}
+
+        self.assertTrue(self.uploader.upload(self.movie, artworks))
+
+        self.uploader.outbox.add.assert_called_once_with(
+            self.movie, "poster", artworks["poster"]
+        )
+
+    def test_latencies_recorded_and_logged(self):
+        artworks = {"poster": make_image("poster"), "background": None, "logo": None}
+        self.uploader.upload(self.movie, artworks)
+
+        self.assertEqual(list(self.uploader.latencies), ["poster"])
+        self.assertEqual(len(self.uploader.latencies["poster"]), 1)
+
+        with self.assertLogs("services.artworks.uploader") as logs:
+            self.uploader.log_stats()
+        self.assertIn("Plex poster uploads: 1", logs.output[0])
+        self.assertEqual(self.uploader.latencies, {})
+
+
+class TestArtworksUploaderFingerprints(unittest.TestCase):
+    movie = {"plex_movie_id": 1, "title": "Test Movie"}
+    content = b"poster bytes"
+    sha1 = hashlib.sha1(content).hexdigest()
+
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.fingerprints = UploadFingerprints(tmpdir.name)
+
+        self.plex_manager = MagicMock()
+        self.plex_manager.upload_image.return_value = True
+        self.plex_manager.upload_image_data.return_value = True
+        self.uploader = ArtworksUploader(
+            self.plex_manager, fingerprints=self.fingerprints
+        )
+        self.addCleanup(self.uploader.executor.shutdown)
+
+        get_patcher = patch("services.artworks.uploader.get_request")
+        self.get_request = get_patcher.start()
+        self.get_request.return_value.content = self.content
+        self.addCleanup(get_patcher.stop)
+
+        self.artworks = {
+            "poster": make_image("poster"),
+            "background": None,
+            "logo": None,
+        }
+
+    def select(self, key: str) -> None:
+        self.plex_manager.get_images.return_value = [
+            {
+                "key": "/library/metadata/1/file?url=metadata://posters/agent",
+                "selected": "0",
+            },
+            {"key": key, "selected": "1"},
+        ]
+
+    def upload_key(self, sha1: str) -> str:
+        return f"/library/metadata/1/file?url=upload://posters/{sha1}"
+
+    def test_upload_records_fingerprint(self):
+        self.select(self.upload_key("0" * 40))
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        # Downloaded to be compared, so sent as data
+        self.plex_manager.upload_image_data.assert_called_once_with(
+            1, "poster", self.content
+        )
+        self.plex_manager.upload_image.assert_not_called()
+        self.plex_manager.get_images.assert_called_once()
+        fingerprint = self.fingerprints.get(1, "poster")
+        self.assertEqual(fingerprint["url"], "https://example.com/poster.jpg")
+        self.assertEqual(fingerprint["sha1"], self.sha1)
+        self.assertEqual(fingerprint["size"], len(self.content))
+
+    def test_agent_image_selected_uploads_without_download(self):
+        self.plex_manager.get_images.return_value = [
+            {
+                "key": "/library/metadata/1/file?url=metadata://posters/agent",
+                "selected": "1",
+            }
+        ]
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image.assert_called_once()
+        self.get_request.assert_not_called()
+        self.assertIsNone(self.fingerprints.get(1, "poster"))
+
+    def test_recorded_content_is_recognized_after_upload(self):
+        self.select(self.upload_key("0" * 40))
+        self.uploader.upload(self.movie, self.artworks)
+        self.select(self.upload_key(self.sha1))
+        self.get_request.reset_mock()
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image_data.assert_called_once()
+        self.get_request.assert_not_called()
+        self.assertEqual(self.uploader.skipped_count, 1)
+
+    def test_selected_images_given_are_not_listed_again(self):
+        selected_images = {"poster": None}
+
+        self.assertTrue(
+            self.uploader.upload(self.movie, self.artworks, selected_images)
+        )
+
+        self.plex_manager.get_images.assert_not_called()
+        self.plex_manager.upload_image.assert_called_once()
+
+    def test_same_fingerprint_skips_upload(self):
+        key = self.upload_key(self.sha1)
+        self.select(key)
+        self.fingerprints.set(
+            1,
+            "poster",
+            {
+                "url": "https://example.com/poster.jpg",
+                "sha1": None,
+                "size": 100,
+                "key": key,
+            },
+        )
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image.assert_not_called()
+        self.get_request.assert_not_called()
+        self.assertEqual(self.uploader.skipped_count, 1)
+        self.assertEqual(self.uploader.saved_bytes, 100)
+
+    def test_same_content_skips_upload_without_fingerprint(self):
+        self.select(self.upload_key(self.sha1))
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image.assert_not_called()
+        self.assertEqual(self.uploader.saved_bytes, len(self.content))
+        self.assertEqual(self.fingerprints.get(1, "poster")["sha1"], self.sha1)
+
+        with self.assertLogs("services.artworks.uploader") as logs:
+            self.uploader.log_stats()
+        self.assertIn("Plex uploads skipped: 1", logs.output[0])
+        self.assertEqual(self.uploader.skipped_count, 0)
+
+    def test_transcoded_data_is_uploaded_and_fingerprinted(self):
+        self.uploader.transcoder = MagicMock()
+        self.uploader.transcoder.transcode.return_value = b"small"
+        self.plex_manager.upload_image_data.return_value = True
+        self.plex_manager.get_images.return_value = []
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image_data.assert_called_once_with(
+            1, "poster", b"small"
+        )
+        self.plex_manager.upload_image.assert_not_called()
+        self.get_request.assert_not_called()
+
+    def test_transcoded_data_already_selected_is_skipped(self):
+        self.uploader.transcoder = MagicMock()
+        self.uploader.transcoder.transcode.return_value = b"small"
+        self.select(self.upload_key(hashlib.sha1(b"small").hexdigest()))
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image_data.assert_not_called()
+        self.assertEqual(self.uploader.saved_bytes, len(b"small"))
+
+    def test_selection_changed_in_plex_uploads_again(self):
+        self.select("/library/metadata/1/file?url=metadata://posters/other")
+        self.fingerprints.set(
+            1,
+            "poster",
+            {
+                "url": "https://example.com/poster.jpg",
+                "sha1": None,
+                "size": None,
+                "key": self.upload_key(self.sha1),
+            },
+        )
+
+        self.assertTrue(self.uploader.upload(self.movie, self.artworks))
+
+        self.plex_manager.upload_image.assert_called_once()
+        self.assertEqual(self.uploader.skipped_count, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+import threading
+
+from utils import image_transcode
+from utils.requests_utils import get_request
+
+logger = logging.getLogger(__name__)
+
+# Largest width x height sent to Plex, by artwork type
+DEFAULT_MAX_SIZES = {
+    "poster": (1000, 1500),
+    "background": (1920, 1080),
+    "logo": (800, 310),
+}
+
+
+class ArtworksTranscoder:
+    """
+    Shrinks artworks before they are sent to Plex, which stores every upload
+    at full size: the image is downloaded, resized to fit the `max_sizes` of
+    its type and recompressed at `quality`, on the calling upload thread.
+    The original is kept when the result is not smaller.
+
+    Requires Pillow: without it, nothing is transcoded and artworks are
+    uploaded from their URL.
+    """
+
+    def __init__(
+        self,
+        max_sizes: dict[str, tuple[int, int]] | None = None,
+        quality: int = 85,
+    ) -> None:
+        self.max_sizes = {**DEFAULT_MAX_SIZES, **(max_sizes or {})}
+        self.quality = quality
+
+        # Bytes downloaded and bytes uploaded instead, for the current run
+        self.original_bytes = 0
+        self.uploaded_bytes = 0
+        self.count = 0
+        self._stats_lock = threading.Lock()
+
+    def transcode(self, url: str, artwork_type: str) -> bytes | None:
+        """Content to upload for the image at `url`, or None to upload the URL."""
+        if not image_transcode.is_available():
+            return None
+
+        response = get_request(url)
+        if response is None:
+            return None
+        content = response.content
+
+        max_width, max_height = self.max_sizes[artwork_type]
+        transcoded = image_transcode.transcode(
+            content, max_width, max_height, self.quality
+        )
+        if transcoded is None:
+            logger.warning(f"Could not transcode {artwork_type} {url}")
+            return None
+
+        data = transcoded if len(transcoded) < len(content) else content
+        with self._stats_lock:
+            self.count += 1
+            self.original_bytes += len(content)
+            self.uploaded_bytes += len(data)
+        return data
+
+    def log_stats(self) -> None:
+        """Log the bytes saved by transcoding since the last call, then reset them."""
+        with self._stats_lock:
+            if self.count:
+                saved = self.original_bytes - self.uploaded_bytes
+                logger.info(
+                    f"Transcoded artworks: {self.count}, "
+                    f"{self.original_bytes / 1_000_000:.1f} MB -> "
+                    f"{self.uploaded_bytes / 1_000_000:.1f} MB "
+                    f"({saved / 1_000_000:.1f} MB saved)"
+                )
+            self.count = 0
+            self.original_bytes = 0
+            self.uploaded_bytes = 0
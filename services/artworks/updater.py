@@ -3,12 +3,16 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from client.google.quota import QuotaExhaustedError
+
 if TYPE_CHECKING:
     from models.artworks import Artworks
     from models.movie import Movie
+    from services.artworks.deduplicator import ArtworksDeduplicator
     from services.artworks.retriever import ArtworksRetriever
     from services.artworks.selector import ArtworksSelector
     from services.artworks.uploader import ArtworksUploader
+    from utils.rate_governor import RateGovernor
 
 logger = logging.getLogger(__name__)
 
@@ -21,10 +25,14 @@ class ArtworksUpdater:
         artworks_retriever: ArtworksRetriever,
         artworks_selector: ArtworksSelector,
         artworks_uploader: ArtworksUploader,
+        governor: RateGovernor | None = None,
+        deduplicator: ArtworksDeduplicator | None = None,
     ) -> None:
         self.retriever = artworks_retriever
         self.selector = artworks_selector
         self.uploader = artworks_uploader
+        self.governor = governor
+        self.deduplicator = deduplicator
 
     def process(self, movie: Movie) -> tuple[Artworks, bool, int]:
         """
@@ -35,7 +43,7 @@ class ArtworksUpdater:
             successful, and the number of Google search queries consumed.
         """
         artworks, search_count = self.fetch(movie)
-        uploaded = self.uploader.upload(movie, artworks)
+        uploaded = self.upload(movie, artworks)
         return artworks, uploaded, search_count
 
     def fetch(self, movie: Movie) -> tuple[Artworks, int]:
@@ -50,24 +58,67 @@ class ArtworksUpdater:
         Update a single movie's artworks.
 
         Returns:
-            str: status among ["success", "imperfect_artworks", "identical_artworks", "upload_failed"]
+            str: status among ["success", "imperfect_artworks", "identical_artworks",
+            "upload_failed", "quota_exhausted"]
         """
-        new_artworks, search_count = self.fetch(movie)
+        try:
+            new_artworks, search_count = self.fetch(movie)
+        except QuotaExhaustedError:
+            return self.quota_exhausted(movie)
 
         if not self.are_better(new_artworks, current_artworks):
             return "unchanged_artworks", new_artworks, search_count
 
-        uploaded = self.uploader.upload(movie, new_artworks)
+        uploaded = self.upload(movie, new_artworks)
+        return (
+            self.get_status(movie, new_artworks, uploaded),
+            new_artworks,
+            search_count,
+        )
+
+    def quota_exhausted(self, movie: Movie) -> tuple[str, Artworks, int]:
+        """Result of a movie whose retrieval was cut short by the CSE quota."""
+        logger.debug(f"CSE quota refused a search for '{movie['title']}'")
+        return "quota_exhausted", {"poster": None, "background": None, "logo": None}, 0
+
+    def upload(self, movie: Movie, artworks: Artworks) -> bool:
+        """Upload the selected artworks, except those Plex already shows."""
+        if self.deduplicator is None:
+            return self.uploader.upload(movie, artworks)
+
+        # One lookup of the images selected in Plex, shared with the uploader
+        selected_images = self.uploader.get_selected_images(movie, artworks)
+        artworks = self.deduplicator.deduplicate(movie, artworks, selected_images)
+        return self.uploader.upload(movie, artworks, selected_images)
+
+    def get_status(self, movie: Movie, artworks: Artworks, uploaded: bool) -> str:
+        """Status of an update whose new artworks were sent to Plex."""
         if not uploaded:
-            return "upload_failed", new_artworks, search_count
-
-        if self.selector.are_empty(new_artworks):
-            return "empty_artworks", new_artworks, search_count
-
-        if not self.selector.are_perfect(new_artworks, movie):
-            return "imperfect_artworks", new_artworks, search_count
-
-        return "success", new_artworks, search_count
+            return "upload_failed"
+
+        if self.selector.are_empty(artworks):
+            return "empty_artworks"
+
+        if not self.selector.are_perfect(artworks, movie):
+            return "imperfect_artworks"
+
+        return "success"
+
+    def log_stats(self) -> None:
+        """Log retrieval and upload statistics accumulated during the current run."""
+        self.retriever.log_stats()
+        self.uploader.log_stats()
+        if self.deduplicator is not None:
+            self.deduplicator.log_stats()
+        if self.governor is not None:
+            self.governor.log_stats()
+
+    def save(self) -> None:
+        """Persist the caches filled while updating, once per run."""
+        self.retriever.save()
+        self.uploader.save()
+        if self.deduplicator is not None:
+            self.deduplicator.save()
 
     def are_better(
         self,
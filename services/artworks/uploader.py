@@ -1,52 +1,218 @@
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
 import time
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, TypeGuard
+
+import requests
+
+from client.plex.image import get_selected, get_upload_hash, is_uploaded
+from utils.requests_utils import get_request
 
 if TYPE_CHECKING:
+    from client.plex.image import PlexImage
     from client.plex.manager import PlexManager
     from models.artworks import Artworks, Image
     from models.movie import Movie
+    from services.artworks.transcoder import ArtworksTranscoder
+    from storage.upload_fingerprints import Fingerprint, UploadFingerprints
+    from storage.upload_outbox import UploadOutbox
 
 
 logger = logging.getLogger(__name__)
 
+ARTWORK_TYPES = ["poster", "background", "logo"]
+
 
 class ArtworksUploader:
-    """Handles uploading artworks to Plex."""
+    """
+    Handles uploading artworks to Plex.
+
+    The artwork types of a movie are uploaded concurrently. At most
+    `max_concurrent` uploads are in flight on the Plex server, whichever movie
+    they belong to. Requests are paced by the Plex client's rate governor; an
+    extra `upload_interval` can be paused once per movie when something was sent.
+
+    With `fingerprints`, an image already selected in Plex is not uploaded
+    again, e.g. after the movies cache was lost. It is recognized either by its
+    fingerprint from the last upload, or by its content: Plex names uploaded
+    files after the SHA-1 of their content, so a candidate is only downloaded
+    and hashed when the selected image is an upload, and then sent as data.
+    Only uploads whose content is known are fingerprinted.
+
+    With `transcoder`, images are downloaded and shrunk before being sent as
+    data, instead of letting Plex download them from their URL.
 
-    def __init__(self, plex_manager: PlexManager, upload_interval: float = 1.0):
+    With `outbox`, a failed upload is queued to be retried later and the movie
+    counts as uploaded, so its artworks are not searched again.
+    """
+
+    def __init__(
+        self,
+        plex_manager: PlexManager,
+        upload_interval: float = 0.0,
+        max_concurrent: int = 3,
+        fingerprints: UploadFingerprints | None = None,
+        transcoder: ArtworksTranscoder | None = None,
+        outbox: UploadOutbox | None = None,
+    ):
         self.plex_manager = plex_manager
         self.upload_interval = upload_interval
+        self.fingerprints = fingerprints
+        self.transcoder = transcoder
+        self.outbox = outbox
+        self.executor = ThreadPoolExecutor(
+            max_concurrent, thread_name_prefix="plex-upload"
+        )
+
+        # Seconds per upload, by artwork type
+        self.latencies: dict[str, list[float]] = {}
+        # Uploads skipped because Plex already had the image selected
+        self.skipped_count = 0
+        self.saved_bytes = 0
+        self._stats_lock = threading.Lock()
+
+    def get_selected_images(
+        self, movie: Movie, artworks: Artworks
+    ) -> dict[str, PlexImage | None]:
+        """Image selected in Plex for each artwork type to upload."""
+        return {
+            artwork_type: get_selected(
+                self.plex_manager.get_images(movie["plex_movie_id"], artwork_type)
+            )
+            for artwork_type in ARTWORK_TYPES
+            if artworks[artwork_type]
+        }
 
     def upload(
         self,
         movie: Movie,
         artworks: Artworks,
+        selected_images: dict[str, PlexImage | None] | None = None,
     ) -> bool:
-        uploaded = True
+        """
+        Upload the artworks of a movie. `selected_images` are the images
+        selected in Plex, when the caller already looked them up.
+        """
+        to_upload = [
+            (artwork_type, image)
+            for artwork_type in ARTWORK_TYPES
+            if (image := artworks[artwork_type])
+        ]
+        if not to_upload:
+            return True
 
-        for artwork_type in ["poster", "background", "logo"]:
-            image: Image | None = artworks[artwork_type]
-            uploaded &= self.upload_image(movie, artwork_type, image)
-            time.sleep(self.upload_interval)
+        futures = [
+            self.executor.submit(
+                self.upload_image, movie, artwork_type, image, selected_images
+            )
+            for artwork_type, image in to_upload
+        ]
+        results = [future.result() for future in futures]
+        uploaded = all(results)
+        if self.outbox is not None:
+            # Failures are retried from the outbox, the movie is done here
+            self.queue_failures(movie, to_upload, results)
+            uploaded = True
 
+        if self.upload_interval:
+            time.sleep(self.upload_interval)
         return uploaded
 
+    def queue_failures(
+        self,
+        movie: Movie,
+        to_upload: list[tuple[str, Image]],
+        results: list[bool],
+    ) -> None:
+        """Queue the failed uploads, and drop queued ones just replaced."""
+        assert self.outbox is not None
+        movie_id = movie["plex_movie_id"]
+        for (artwork_type, image), uploaded in zip(to_upload, results):
+            if uploaded:
+                self.outbox.discard(movie_id, artwork_type)
+            else:
+                self.outbox.add(movie, artwork_type, image)
+                logger.info(
+                    f"Queued {artwork_type} upload for movie '{movie['title']}' "
+                    f"(ID: {movie_id}) to retry later"
+                )
+
     def upload_image(
-        self, movie: Movie, artwork_type: str, image: Image | None
+        self,
+        movie: Movie,
+        artwork_type: str,
+        image: Image | None,
+        selected_images: dict[str, PlexImage | None] | None = None,
+    ) -> bool:
+        """Upload one artwork. Plex being unreachable counts as a failed upload."""
+        try:
+            return self.send_image(movie, artwork_type, image, selected_images)
+        except requests.RequestException as e:
+            logger.warning(
+                f"Failed to upload {artwork_type} for movie '{movie['title']}' "
+                f"(ID: {movie['plex_movie_id']}): {e}"
+            )
+            return False
+
+    def send_image(
+        self,
+        movie: Movie,
+        artwork_type: str,
+        image: Image | None,
+        selected_images: dict[str, PlexImage | None] | None,
     ) -> bool:
         if not image:
             return True
 
         movie_id = movie["plex_movie_id"]
         url = image["url"]
+        title = movie["title"]
 
-        success = False
-        success = self.plex_manager.upload_image(movie_id, artwork_type, url)
+        selected = None
+        fingerprint = None
+        if self.fingerprints is not None:
+            if selected_images is not None and artwork_type in selected_images:
+                selected = selected_images[artwork_type]
+            else:
+                selected = get_selected(
+                    self.plex_manager.get_images(movie_id, artwork_type)
+                )
+            fingerprint = self.fingerprints.get(movie_id, artwork_type)
+            if fingerprint is not None and fingerprint["url"] != url:
+                fingerprint = None
+            if self.is_selected(fingerprint, selected):
+                return self.skip(movie, artwork_type, fingerprint)
+
+        data = None
+        if self.transcoder is not None:
+            data = self.transcoder.transcode(url, artwork_type)
+
+        if self.fingerprints is not None:
+            if data is None and self.may_match(fingerprint, selected):
+                # Sent as data below, so Plex does not download it again
+                data = self.download(url)
+            if data is not None:
+                fingerprint = self.get_fingerprint(url, selected, data)
+                if self.is_selected(fingerprint, selected):
+                    return self.skip(movie, artwork_type, fingerprint)
+
+        start = time.perf_counter()
+        if data is not None:
+            success = self.plex_manager.upload_image_data(movie_id, artwork_type, data)
+        else:
+            success = self.plex_manager.upload_image(movie_id, artwork_type, url)
+        with self._stats_lock:
+            self.latencies.setdefault(artwork_type, []).append(
+                time.perf_counter() - start
+            )
+
+        if success and self.fingerprints is not None:
+            self.record(movie_id, artwork_type, fingerprint)
 
-        title = movie["title"]
         if success:
             logger.info(
                 f"Successfully uploaded {artwork_type} for movie '{title}' (ID: {movie_id})"
@@ -57,3 +223,99 @@ class ArtworksUploader:
             )
 
         return success
+
+    @staticmethod
+    def is_selected(
+        fingerprint: Fingerprint | None, selected: PlexImage | None
+    ) -> TypeGuard[Fingerprint]:
+        """Whether `selected` is the upload `fingerprint` was taken from."""
+        if fingerprint is None or selected is None:
+            return False
+        if fingerprint["key"] == selected["key"]:
+            return True
+        return fingerprint["sha1"] is not None and (
+            fingerprint["sha1"] == get_upload_hash(selected)
+        )
+
+    @staticmethod
+    def may_match(fingerprint: Fingerprint | None, selected: PlexImage | None) -> bool:
+        """Whether the content must be hashed to compare it with `selected`."""
+        return (
+            (fingerprint is None or fingerprint["sha1"] is None)
+            and selected is not None
+            and is_uploaded(selected)
+        )
+
+    @staticmethod
+    def download(url: str) -> bytes | None:
+        response = get_request(url)
+        return response.content if response is not None else None
+
+    @staticmethod
+    def get_fingerprint(
+        url: str, selected: PlexImage | None, data: bytes
+    ) -> Fingerprint:
+        """
+        Fingerprint of `data`, to be uploaded from `url`. Its key is the
+        selected key when the content matches, "" otherwise.
+        """
+        sha1 = hashlib.sha1(data).hexdigest()
+        upload_hash = get_upload_hash(selected) if selected else None
+        key = selected["key"] if selected and sha1 == upload_hash else ""
+        return {"url": url, "sha1": sha1, "size": len(data), "key": key}
+
+    def skip(self, movie: Movie, artwork_type: str, fingerprint: Fingerprint) -> bool:
+        assert self.fingerprints is not None
+        movie_id = movie["plex_movie_id"]
+        if self.fingerprints.get(movie_id, artwork_type) != fingerprint:
+            self.fingerprints.set(movie_id, artwork_type, fingerprint)
+        with self._stats_lock:
+            self.skipped_count += 1
+            self.saved_bytes += fingerprint["size"] or 0
+
+        logger.info(
+            f"Skipped {artwork_type} upload for movie '{movie['title']}' "
+            f"(ID: {movie_id}): already selected in Plex"
+        )
+        return True
+
+    def record(
+        self, movie_id: int, artwork_type: str, fingerprint: Fingerprint | None
+    ) -> None:
+        """
+        Store the fingerprint of an upload whose content is known. Plex names
+        the upload after its SHA-1, so the selection is not listed again.
+        """
+        assert self.fingerprints is not None
+        if fingerprint is None or fingerprint["sha1"] is None:
+            return
+        self.fingerprints.set(movie_id, artwork_type, {**fingerprint, "key": ""})
+
+    def log_stats(self) -> None:
+        """Log upload latencies and skipped uploads since the last call, then reset them."""
+        with self._stats_lock:
+            for artwork_type in ARTWORK_TYPES:
+                latencies = self.latencies.get(artwork_type)
+                if latencies:
+                    logger.info(
+                        f"Plex {artwork_type} uploads: {len(latencies)}, "
+                        f"avg {sum(latencies) / len(latencies):.2f}s, "
+                        f"max {max(latencies):.2f}s"
+                    )
+            self.latencies = {}
+
+            if self.skipped_count:
+                logger.info(
+                    f"Plex uploads skipped: {self.skipped_count} already selected, "
+                    f"{self.saved_bytes / 1_000_000:.1f} MB saved"
+                )
+            self.skipped_count = 0
+            self.saved_bytes = 0
+
+        if self.transcoder is not None:
+            self.transcoder.log_stats()
+
+    def save(self) -> None:
+        """Persist the fingerprints of the run's uploads."""
+        if self.fingerprints is not None:
+            self.fingerprints.save()
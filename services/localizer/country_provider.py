@@ -25,24 +25,19 @@ class CountryProvider:
         }
 
     def get_artworks(
-        self, movie: Movie
+        self, movie: Movie, localized_title: str | None = None
     ) -> tuple[Image | None, Image | None, Image | None, int]:
-
-        localized_title = self.localizer.get_localized_title(movie, self.country)
+        """Artworks for this country; `localized_title` skips the title lookup."""
+        localized_title = localized_title or self.localizer.get_localized_title(
+            movie, self.country
+        )
         if not localized_title:
             return None, None, None, 0
 
         base_image = {"title": localized_title, **self.base_image}
 
-        search_args = (
-            localized_title,
-            movie["director"],
-            movie["year"],
-            self.country,
-            "movie",
-        )
         poster_url, background_url, logo_url, search_count = self.provider.get_artworks(
-            *search_args
+            *self.get_search_args(movie, localized_title)
         )
 
         poster = build_image(poster_url, **base_image)
@@ -51,5 +46,13 @@ class CountryProvider:
 
         return poster, background, logo, search_count
 
+    def prefetch(self, movie: Movie, localized_title: str) -> None:
+        self.provider.prefetch(*self.get_search_args(movie, localized_title))
+
+    def get_search_args(
+        self, movie: Movie, localized_title: str
+    ) -> tuple[str, list[str], int, str, str]:
+        return localized_title, movie["director"], movie["year"], self.country, "movie"
+
     def get_localized_title(self, movie: Movie) -> str | None:
         return self.localizer.get_localized_title(movie, self.country)
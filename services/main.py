@@ -1,25 +1,47 @@
 import argparse
+import logging
 from typing import NotRequired, TypedDict, cast
 
+from client.apple_tv.api import AppleTVAPIRequester
+from client.apple_tv.image_probe import ImageProber
+from client.apple_tv.pages import PageCache
+from client.apple_tv.url_index import UrlIndex
+from client.google.query_planner import QueryPlanner
+from client.google.quota import QuotaLedger
+from client.google.scoring import Scorer
 from client.google.search_engine import SearchEngine
 from client.plex.manager import PlexManager
 from client.tmdb.api import TMDBAPIRequester
+from services.artworks.deduplicator import ArtworksDeduplicator
+from services.artworks.pipeline import ArtworksPipeline
 from services.artworks.retriever import ArtworksRetriever
 from services.artworks.selector import ArtworksSelector
+from services.artworks.transcoder import ArtworksTranscoder
 from services.artworks.updater import ArtworksUpdater
 from services.artworks.uploader import ArtworksUploader
 from services.localizer.localizer import Localizer
 from services.metadata.updater import MetadataUpdater
 from services.provider.apple import AppleProvider
+from services.provider.itunes import ITunesProvider
 from services.provider.logo.tmdb import TMDBLogoProvider
 from services.scheduler.schedules import get_schedule_from_config
 from services.scheduler.task_scheduler import TaskSchedulerService
 from services.tasks.artworks_reverter_task import ArtworksReverterTask
 from services.tasks.missing_artworks_task import MissingArtworksTask
 from services.tasks.recently_added_task import RecentlyAddedTask
+from services.tasks.upload_outbox_task import UploadOutboxTask
 from storage.movies_cache import MoviesCache
+from storage.search_archive import SearchArchive
+from storage.search_cache import SearchCache
+from storage.thumbnail_cache import ThumbnailCache
+from storage.upload_fingerprints import UploadFingerprints
+from storage.upload_outbox import UploadOutbox
+from utils import image_transcode, perceptual_hash
 from utils.file_utils import load_json_file
 from utils.logger import setup_logging
+from utils.rate_governor import PLEX_POLICY, default_governor, get_host
+
+logger = logging.getLogger(__name__)
 
 
 class PlexConfig(TypedDict):
@@ -29,6 +51,11 @@ class PlexConfig(TypedDict):
     metadata_path: str
 
 
+class QuotaConfig(TypedDict):
+    daily_limit: int
+    reserved: NotRequired[dict[str, int]]
+
+
 class TMDBConfig(TypedDict):
     api_token: str
 
@@ -36,10 +63,19 @@ class TMDBConfig(TypedDict):
 class GoogleSearchConfig(TypedDict):
     api_key: str
     custom_search_id: str
+    archive_days: NotRequired[int]
+
+
+class AppleTVConfig(TypedDict):
+    storefront_api: NotRequired[bool]
+    utsk: NotRequired[str]
+    url_index: NotRequired[bool]
+    itunes: NotRequired[bool]
 
 
 class RetrieverConfig(TypedDict):
     countries: list[str]
+    prefetch_workers: NotRequired[int]
 
 
 class SelectorConfig(TypedDict):
@@ -52,11 +88,38 @@ class ReverterConfig(TypedDict):
     artworks_types: list[str]
 
 
+class PipelineConfig(TypedDict):
+    upload_workers: NotRequired[int]
+    retrieve_interval: NotRequired[float]
+    upload_interval: NotRequired[float]
+    queue_size: NotRequired[int]
+
+
+class DeduplicateConfig(TypedDict):
+    max_distance: NotRequired[int]
+    thumbnail_size: NotRequired[int]
+
+
+class TranscodeConfig(TypedDict):
+    max_sizes: NotRequired[dict[str, list[int]]]
+    quality: NotRequired[int]
+
+
+class UploadOutboxConfig(TypedDict):
+    retry_delay_seconds: NotRequired[int]
+    max_retry_delay_seconds: NotRequired[int]
+    max_attempts: NotRequired[int]
+
+
 class ArtworksConfig(TypedDict):
     retriever: RetrieverConfig
     selector: SelectorConfig
     reverter: ReverterConfig
     movies_sleep_interval: NotRequired[float]
+    pipeline: NotRequired[PipelineConfig]
+    deduplicate: NotRequired[DeduplicateConfig]
+    transcode: NotRequired[TranscodeConfig]
+    upload_outbox: NotRequired[UploadOutboxConfig]
 
 
 class MissingArtworksTaskConfig(TypedDict):
@@ -64,6 +127,15 @@ class MissingArtworksTaskConfig(TypedDict):
     recent_threshold_days: int
 
 
+class RateLimitConfig(TypedDict):
+    rate: NotRequired[float]
+    min_rate: NotRequired[float]
+    max_rate: NotRequired[float]
+    increase: NotRequired[float]
+    decrease: NotRequired[float]
+    latency_target_s: NotRequired[float]
+
+
 class ScheduleConfig(TypedDict):
     type: str
     params: tuple[int, ...]
@@ -83,7 +155,10 @@ class Config(TypedDict):
     plex: PlexConfig
     tmdb: TMDBConfig
     google: GoogleSearchConfig
+    quota: NotRequired[QuotaConfig]
+    apple_tv: NotRequired[AppleTVConfig]
     artworks: ArtworksConfig
+    rate_limits: NotRequired[dict[str, RateLimitConfig]]
     missing_artworks_task: MissingArtworksTaskConfig
     schedules: dict[str, ScheduleConfig]
     cache: CacheConfig
@@ -106,18 +181,53 @@ if __name__ == "__main__":
     setup_logging(log_config["path"], log_config["level"])
 
     plex_config = config["plex"]
+
+    # Every HTTP client paces its requests per host through this governor
+    default_governor.set_policy(get_host(plex_config["plex_url"]), PLEX_POLICY)
+    for host, settings in config.get("rate_limits", {}).items():
+        default_governor.configure(host, **settings)
+
     plex_manager = PlexManager(**plex_config)
 
     tmdb_config = config["tmdb"]
     tmdb_requester = TMDBAPIRequester(tmdb_config["api_token"])
 
+    cache_config = config["cache"]
+    cache_path = cache_config["cache_path"]
+    retention_days = cache_config.get("retention_days", 0)
+    retention_seconds = retention_days * 86400
+
+    # Apple TV pages are shared by search scoring, validation and extraction
+    page_cache = PageCache()
+
+    # Daily CSE budget shared by all tasks, persisted across restarts. Without
+    # it, only the per-run `search_quota` of the missing artworks task applies.
+    quota_config = config.get("quota")
+    quota_ledger = (
+        QuotaLedger(cache_path, "search_quota", **quota_config)
+        if quota_config is not None
+        else None
+    )
+
     google_config = config["google"]
+    # Raw CSE results kept for offline re-scoring, off unless a retention is set
+    archive_days = google_config.get("archive_days", 0)
+    archive = (
+        SearchArchive(cache_path, retention_days=archive_days) if archive_days else None
+    )
     search_engine = SearchEngine(
-        google_config["api_key"], google_config["custom_search_id"]
+        google_config["api_key"],
+        google_config["custom_search_id"],
+        scorer=Scorer(page_cache=page_cache),
+        cache=SearchCache(cache_path, "search_results"),
+        quota=quota_ledger,
+        planner=QueryPlanner(cache_path, "query_stats"),
+        archive=archive,
     )
 
     artworks_config = config["artworks"]
-    sleep_interval = artworks_config.get("movies_sleep_interval", 1.0)
+    # Optional extra pause between movies, on top of the per-host rate limits
+    sleep_interval = artworks_config.get("movies_sleep_interval", 0.0)
 
     missing_artworks_task_config = config["missing_artworks_task"]
     search_quota = missing_artworks_task_config["search_quota"]
@@ -128,29 +238,99 @@ if __name__ == "__main__":
 
     retriever_config = artworks_config["retriever"]
 
-    apple_provider = AppleProvider(search_engine)
+    apple_tv_config = config.get("apple_tv", {})
+    storefront_api = None
+    if apple_tv_config.get("storefront_api"):
+        utsk = apple_tv_config.get("utsk")
+        if utsk:
+            storefront_api = AppleTVAPIRequester(utsk)
+        else:
+            logger.warning("apple_tv.storefront_api ignored: apple_tv.utsk is not set")
+    # Built from sitemap dumps with tools/build_url_index.py
+    url_index = (
+        UrlIndex(cache_path, "apple_tv_urls")
+        if apple_tv_config.get("url_index")
+        else None
+    )
+    apple_provider = AppleProvider(
+        search_engine,
+        page_cache=page_cache,
+        storefront_api=storefront_api,
+        url_index=url_index,
+    )
+    # iTunes resolves Apple TV pages for free, CSE only runs on its misses
+    providers = (
+        [ITunesProvider(apple_provider), apple_provider]
+        if apple_tv_config.get("itunes", True)
+        else [apple_provider]
+    )
     localizer = Localizer(tmdb_requester)
     countries_priority = retriever_config["countries"]
     logo_provider = TMDBLogoProvider(tmdb_requester)
     artworks_retriever = ArtworksRetriever(
-        apple_provider,
+        providers,
         localizer,
         countries_priority,
         retrieve_interval=sleep_interval / 2,
         fallback_logo_provider=logo_provider,
+        prefetch_workers=retriever_config.get("prefetch_workers", 0),
+        image_prober=ImageProber(),
     )
 
-    artworks_uploader = ArtworksUploader(plex_manager, upload_interval=1.0)
+    # Shrinks artworks before upload, needs Pillow
+    transcode_config = artworks_config.get("transcode")
+    artworks_transcoder = None
+    if transcode_config is not None:
+        if not image_transcode.is_available():
+            logger.warning("artworks.transcode ignored: Pillow is not installed")
+        max_sizes = {
+            artwork_type: (width, height)
+            for artwork_type, (width, height) in transcode_config.get(
+                "max_sizes", {}
+            ).items()
+        }
+        artworks_transcoder = ArtworksTranscoder(
+            max_sizes,
+            quality=transcode_config.get("quality", 85),
+        )
+    # Failed uploads are retried by their own task, without searching again
+    outbox_config = artworks_config.get("upload_outbox")
+    upload_outbox = (
+        UploadOutbox(cache_path, **outbox_config) if outbox_config is not None else None
+    )
+    artworks_uploader = ArtworksUploader(
+        plex_manager,
+        fingerprints=UploadFingerprints(cache_path),
+        transcoder=artworks_transcoder,
+        outbox=upload_outbox,
+    )
+    # Compares candidates with the artworks Plex already shows, needs Pillow
+    deduplicate_config = artworks_config.get("deduplicate")
+    artworks_deduplicator = None
+    if deduplicate_config is not None:
+        if perceptual_hash.is_available():
+            artworks_deduplicator = ArtworksDeduplicator(
+                plex_manager, ThumbnailCache(cache_path), **deduplicate_config
+            )
+        else:
+            logger.warning("artworks.deduplicate ignored: Pillow is not installed")
     artworks_updater = ArtworksUpdater(
-        artworks_retriever, artworks_selector, artworks_uploader
+        artworks_retriever,
+        artworks_selector,
+        artworks_uploader,
+        governor=default_governor,
+        deduplicator=artworks_deduplicator,
     )
 
-    metadata_updater = MetadataUpdater(plex_manager, localizer)
+    # Overlaps retrieval and upload of consecutive movies when configured
+    pipeline_config = artworks_config.get("pipeline")
+    artworks_pipeline = (
+        ArtworksPipeline(artworks_updater, **pipeline_config)
+        if pipeline_config is not None
+        else None
+    )
 
-    cache_config = config["cache"]
-    cache_path = cache_config["cache_path"]
-    retention_days = cache_config.get("retention_days", 0)
-    retention_seconds = retention_days * 86400
+    metadata_updater = MetadataUpdater(plex_manager, localizer)
 
     recently_added_cache = MoviesCache(cache_path, "recently_added", retention_seconds)
     missing_artworks_cache = MoviesCache(cache_path, "missing_artworks")
@@ -162,6 +342,8 @@ if __name__ == "__main__":
         recently_added_cache,
         missing_artworks_cache,
         sleep_interval,
+        quota_ledger,
+        artworks_pipeline,
     )
 
     missing_artworks_task = MissingArtworksTask(
@@ -171,6 +353,8 @@ if __name__ == "__main__":
         sleep_interval,
         search_quota,
         recent_threshold_days,
+        quota_ledger,
+        artworks_pipeline,
     )
 
     reverter_config = artworks_config["reverter"]
@@ -194,5 +378,20 @@ if __name__ == "__main__":
             get_schedule_from_config(**schedules["artworks_reverter"]),
         ),
     ]
+    if upload_outbox is not None:
+        upload_outbox_task = UploadOutboxTask(
+            artworks_uploader, upload_outbox, missing_artworks_cache
+        )
+        # Every 15 minutes unless configured
+        outbox_schedule = schedules.get(
+            "upload_outbox", {"type": "every", "params": (900,)}
+        )
+        tasks.append(
+            (
+                "upload_outbox",
+                upload_outbox_task.run,
+                get_schedule_from_config(**outbox_schedule),
+            )
+        )
     scheduler = TaskSchedulerService(tasks)
     scheduler.start()
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
-from client.apple_tv.extract import get_apple_tv_artworks
+from client.apple_tv.attributes import get_country_url
+from client.apple_tv.extract import build_poster_resolver, get_apple_tv_artworks
 from models.target import Target
 from services.provider.base import Provider
 
 if TYPE_CHECKING:
+    from client.apple_tv.api import AppleTVAPIRequester
+    from client.apple_tv.pages import PageCache
+    from client.apple_tv.poster import PosterResolver
+    from client.apple_tv.url_index import UrlIndex
     from client.google.search_engine import SearchEngine
 
+logger = logging.getLogger(__name__)
+
 
 class AppleProvider(Provider):
     """Metadata source that combines iTunes and Apple TV data."""
@@ -17,8 +25,36 @@ class AppleProvider(Provider):
     def name(self) -> str:
         return "apple"
 
-    def __init__(self, search_engine: SearchEngine) -> None:
+    def __init__(
+        self,
+        search_engine: SearchEngine,
+        poster_resolver: PosterResolver | None = None,
+        page_cache: PageCache | None = None,
+        storefront_api: AppleTVAPIRequester | None = None,
+        url_index: UrlIndex | None = None,
+    ) -> None:
         self.search_engine = search_engine
+        self.poster_resolver = poster_resolver or build_poster_resolver()
+        self.page_cache = page_cache
+        self.storefront_api = storefront_api
+        self.url_index = url_index
+
+        # Apple TV page resolved by search for the current movie, reused in the
+        # other storefronts since the umc id is the same across countries.
+        self.resolved_url: str | None = None
+        self.resolved_search_count = 0
+        # Derived URLs that failed validation, not to be fetched again
+        self.failed_derived_urls: set[str] = set()
+
+        self.derived_count = 0
+        self.saved_search_count = 0
+        self.index_hit_count = 0
+        self.index_miss_count = 0
+
+    def begin_movie(self) -> None:
+        self.resolved_url = None
+        self.resolved_search_count = 0
+        self.failed_derived_urls = set()
 
     def get_artworks(
         self,
@@ -31,14 +67,107 @@ class AppleProvider(Provider):
 
         target = Target(title, directors, year, country, entity)
 
+        if derived := self.get_derived_artworks(target):
+            return *derived, 0
+
+        if indexed := self.get_indexed_artworks(target):
+            url, artworks = indexed
+            self.remember_resolved_url(url)
+            return *artworks, 0
+
         apple_tv_url, search_count = self.search_engine.query(target)
         if not apple_tv_url:
             return None, None, None, search_count
 
-        attributes, poster_url, background_url, logo_url = get_apple_tv_artworks(
-            apple_tv_url
-        )
-        if not self.search_engine.validate(apple_tv_url, attributes, target):
+        artworks = self.get_page_artworks(apple_tv_url, target)
+        if artworks is None:
             return None, None, None, search_count
 
-        return poster_url, background_url, logo_url, search_count
+        self.remember_resolved_url(apple_tv_url, search_count)
+        return *artworks, search_count
+
+    def remember_resolved_url(self, url: str, search_count: int = 0) -> None:
+        """Keep the first page resolved for this movie to derive other storefronts."""
+        if self.resolved_url is None:
+            self.resolved_url = url
+            self.resolved_search_count = search_count
+
+    def prefetch_page(self, url: str) -> None:
+        """Fetch a page into the shared page cache ahead of get_page_artworks."""
+        if self.page_cache is not None and self.storefront_api is None:
+            self.page_cache.get(url)
+
+    def get_derived_artworks(
+        self, target: Target
+    ) -> tuple[str | None, str | None, str | None] | None:
+        """Fetch the page resolved in another country directly in this storefront."""
+        if self.resolved_url is None:
+            return None
+
+        url = get_country_url(self.resolved_url, target.country)
+        if url is None or url == self.resolved_url or url in self.failed_derived_urls:
+            return None
+
+        artworks = self.get_page_artworks(url, target)
+        if artworks is None:
+            self.failed_derived_urls.add(url)
+            logger.debug(f"Derived URL {url} failed validation, falling back to search")
+            return None
+
+        self.derived_count += 1
+        self.saved_search_count += self.resolved_search_count
+        return artworks
+
+    def get_indexed_artworks(
+        self, target: Target
+    ) -> tuple[str, tuple[str | None, str | None, str | None]] | None:
+        """Resolve the target from the sitemap index, without any CSE query."""
+        if self.url_index is None:
+            return None
+
+        for url in self.url_index.resolve(target, self.search_engine.scorer):
+            if artworks := self.get_page_artworks(url, target):
+                self.index_hit_count += 1
+                return url, artworks
+
+        self.index_miss_count += 1
+        return None
+
+    def get_page_artworks(
+        self, url: str, target: Target
+    ) -> tuple[str | None, str | None, str | None] | None:
+        # One JSON lookup when available, the page scraping otherwise
+        page = self.storefront_api.get_artworks(url) if self.storefront_api else None
+        if page is None:
+            page = get_apple_tv_artworks(url, self.poster_resolver, self.page_cache)
+
+        attributes, poster_url, background_url, logo_url = page
+        if not self.search_engine.validate(url, attributes, target):
+            return None
+
+        return poster_url, background_url, logo_url
+
+    def log_stats(self) -> None:
+        if self.derived_count:
+            logger.info(
+                f"{self.derived_count} Apple TV page(s) derived from a resolved umc id "
+                f"(~{self.saved_search_count} CSE queries saved)"
+            )
+        self.derived_count = 0
+        self.saved_search_count = 0
+
+        if self.index_hit_count or self.index_miss_count:
+            logger.info(
+                f"Sitemap index: {self.index_hit_count} hit(s), "
+                f"{self.index_miss_count} miss(es) sent to CSE"
+            )
+        self.index_hit_count = 0
+        self.index_miss_count = 0
+
+        self.search_engine.log_stats()
+        self.poster_resolver.log_stats()
+        if self.page_cache:
+            self.page_cache.log_stats()
+
+    def save(self) -> None:
+        self.search_engine.save()
@@ -12,3 +12,24 @@ class Provider(ABC):
     def get_artworks(
         self, title: str, directors: list[str], year: int, country: str, entity: str
     ) -> tuple[str | None, str | None, str | None, int]: ...
+
+    def prefetch(
+        self, title: str, directors: list[str], year: int, country: str, entity: str
+    ) -> None:
+        """
+        Warm caches for a coming get_artworks call, from a worker thread. Must
+        not spend CSE quota nor change what get_artworks returns.
+        """
+        return None
+
+    def begin_movie(self) -> None:
+        """Forget any state kept across countries for the previous movie."""
+        return None
+
+    def log_stats(self) -> None:
+        """Log statistics accumulated since the last call, then reset them."""
+        return None
+
+    def save(self) -> None:
+        """Persist what was cached during the run."""
+        return None
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from client.itunes.extract import get_apple_tv_url, get_itunes_match
+from models.target import Target
+from services.provider.base import Provider
+
+if TYPE_CHECKING:
+    from services.provider.apple import AppleProvider
+
+logger = logging.getLogger(__name__)
+
+
+class ITunesProvider(Provider):
+    """
+    Zero-quota first stage: matches the movie with the free iTunes Search API and
+    follows its link to the Apple TV page, so no Google CSE query is needed.
+    Pages are read and validated by the Apple provider, hence the same name.
+    Storefronts derivable from the page already resolved for the movie are
+    read directly, without any iTunes lookup.
+    """
+
+    @property
+    def name(self) -> str:
+        return "apple"
+
+    def __init__(self, apple_provider: AppleProvider) -> None:
+        self.apple_provider = apple_provider
+
+        # Apple TV URLs looked up ahead by prefetch() for the current movie
+        self.prefetched_urls: dict[tuple, str | None] = {}
+
+        self.hit_count = 0
+        self.miss_count = 0
+
+    def begin_movie(self) -> None:
+        # A new dict, so late prefetches of the previous movie cannot leak in
+        self.prefetched_urls = {}
+
+    def prefetch(
+        self,
+        title: str,
+        directors: list[str],
+        year: int,
+        country: str,
+        entity: str,
+    ) -> None:
+        target = Target(title, directors, year, country, entity)
+        prefetched_urls = self.prefetched_urls
+
+        url = self.lookup_apple_tv_url(target)
+        if url:
+            self.apple_provider.prefetch_page(url)
+        prefetched_urls[self.get_key(target)] = url
+
+    def get_artworks(
+        self,
+        title: str,
+        directors: list[str],
+        year: int,
+        country: str,
+        entity: str,
+    ) -> tuple[str | None, str | None, str | None, int]:
+
+        target = Target(title, directors, year, country, entity)
+
+        # Once a storefront is resolved, the others derive from its umc id
+        if derived := self.apple_provider.get_derived_artworks(target):
+            return *derived, 0
+
+        url = self.get_apple_tv_url(target)
+        artworks = self.apple_provider.get_page_artworks(url, target) if url else None
+        if artworks is None:
+            self.miss_count += 1
+            return None, None, None, 0
+
+        self.hit_count += 1
+        self.apple_provider.remember_resolved_url(url)
+        return *artworks, 0
+
+    def get_apple_tv_url(self, target: Target) -> str | None:
+        key = self.get_key(target)
+        if key in self.prefetched_urls:
+            return self.prefetched_urls.pop(key)
+        return self.lookup_apple_tv_url(target)
+
+    def lookup_apple_tv_url(self, target: Target) -> str | None:
+        if target.entity != "movie":
+            return None
+
+        match = get_itunes_match(
+            target.title, target.directors, target.year, target.country
+        )
+        if not match or "trackViewUrl" not in match:
+            return None
+
+        return get_apple_tv_url(match["trackViewUrl"])
+
+    @staticmethod
+    def get_key(target: Target) -> tuple:
+        return (
+            target.title,
+            tuple(target.directors),
+            target.year,
+            target.country,
+            target.entity,
+        )
+
+    def log_stats(self) -> None:
+        if self.hit_count or self.miss_count:
+            logger.info(
+                f"iTunes: {self.hit_count} Apple TV page(s) resolved, "
+                f"{self.miss_count} left to the next provider"
+            )
+        self.hit_count = 0
+        self.miss_count = 0
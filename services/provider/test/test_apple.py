@@ -0,0 +1,134 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from models.target import Target
+from services.provider.apple import AppleProvider
+
+US_URL = "https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345"
+FR_URL = "https://tv.apple.com/fr/movie/the-matrix/umc.cmc.4xyz12345"
+
+
+class TestAppleProviderDerivedUrl(unittest.TestCase):
+    def setUp(self):
+        self.search_engine = MagicMock()
+        self.provider = AppleProvider(self.search_engine, poster_resolver=MagicMock())
+
+        patcher = patch("services.provider.apple.get_apple_tv_artworks")
+        self.get_apple_tv_artworks = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.get_apple_tv_artworks.side_effect = lambda url, *_: (
+            {"name": "The Matrix"},
+            f"{url}/poster",
+            f"{url}/background",
+            f"{url}/logo",
+        )
+
+    def get_artworks(self, country: str):
+        return self.provider.get_artworks(
+            "The Matrix", ["Lana Wachowski"], 1999, country, "movie"
+        )
+
+    def test_second_country_reuses_umc_id(self):
+        self.search_engine.query.return_value = (US_URL, 2)
+        self.search_engine.validate.return_value = True
+
+        self.provider.begin_movie()
+        us_artworks = self.get_artworks("us")
+        fr_artworks = self.get_artworks("fr")
+
+        self.assertEqual(us_artworks[0], f"{US_URL}/poster")
+        self.assertEqual(us_artworks[3], 2)
+        self.assertEqual(
+            fr_artworks,
+            (f"{FR_URL}/poster", f"{FR_URL}/background", f"{FR_URL}/logo", 0),
+        )
+        self.search_engine.query.assert_called_once()
+        self.assertEqual(self.provider.saved_search_count, 2)
+
+    def test_falls_back_to_search_when_derived_page_is_invalid(self):
+        other_fr_url = "https://tv.apple.com/fr/movie/matrix/umc.cmc.other"
+        self.search_engine.query.side_effect = [(US_URL, 2), (other_fr_url, 1)]
+        # US page valid, derived FR page invalid, searched FR page valid
+        self.search_engine.validate.side_effect = [True, False, True]
+
+        self.provider.begin_movie()
+        self.get_artworks("us")
+        fr_artworks = self.get_artworks("fr")
+
+        self.assertEqual(fr_artworks[0], f"{other_fr_url}/poster")
+        self.assertEqual(fr_artworks[3], 1)
+        self.assertEqual(self.search_engine.query.call_count, 2)
+        self.assertEqual(self.provider.saved_search_count, 0)
+
+        # The invalid derived page is not fetched again for this movie
+        self.assertIsNone(
+            self.provider.get_derived_artworks(
+                Target("The Matrix", ["Lana Wachowski"], 1999, "fr", "movie")
+            )
+        )
+        self.assertEqual(self.search_engine.validate.call_count, 3)
+
+    def test_begin_movie_forgets_resolved_url(self):
+        self.search_engine.query.return_value = (US_URL, 1)
+        self.search_engine.validate.return_value = True
+
+        self.provider.begin_movie()
+        self.get_artworks("us")
+        self.provider.begin_movie()
+        self.get_artworks("fr")
+
+        self.assertEqual(self.search_engine.query.call_count, 2)
+
+    def test_url_index_hit_skips_search(self):
+        self.provider.url_index = MagicMock()
+        self.provider.url_index.resolve.return_value = [US_URL]
+        self.search_engine.validate.return_value = True
+
+        self.provider.begin_movie()
+        artworks = self.get_artworks("us")
+
+        self.assertEqual(
+            artworks, (f"{US_URL}/poster", f"{US_URL}/background", f"{US_URL}/logo", 0)
+        )
+        self.search_engine.query.assert_not_called()
+        self.assertEqual(self.provider.resolved_url, US_URL)
+        self.assertEqual(self.provider.index_hit_count, 1)
+
+    def test_url_index_miss_falls_back_to_search(self):
+        self.provider.url_index = MagicMock()
+        self.provider.url_index.resolve.return_value = []
+        self.search_engine.query.return_value = (US_URL, 1)
+        self.search_engine.validate.return_value = True
+
+        artworks = self.get_artworks("us")
+
+        self.assertEqual(artworks[3], 1)
+        self.assertEqual(self.provider.index_miss_count, 1)
+
+    def test_storefront_api_replaces_page_scraping(self):
+        storefront_api = MagicMock()
+        storefront_api.get_artworks.return_value = ({}, "poster", "bg", "logo")
+        self.provider.storefront_api = storefront_api
+        self.search_engine.query.return_value = (US_URL, 1)
+        self.search_engine.validate.return_value = True
+
+        artworks = self.get_artworks("us")
+
+        self.assertEqual(artworks, ("poster", "bg", "logo", 1))
+        self.get_apple_tv_artworks.assert_not_called()
+
+    def test_storefront_api_falls_back_to_page_scraping(self):
+        storefront_api = MagicMock()
+        storefront_api.get_artworks.return_value = None
+        self.provider.storefront_api = storefront_api
+        self.search_engine.query.return_value = (US_URL, 1)
+        self.search_engine.validate.return_value = True
+
+        artworks = self.get_artworks("us")
+
+        self.assertEqual(artworks[0], f"{US_URL}/poster")
+        self.get_apple_tv_artworks.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
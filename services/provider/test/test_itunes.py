@@ -0,0 +1,87 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from services.provider.itunes import ITunesProvider
+
+US_URL = "https://tv.apple.com/us/movie/the-matrix/umc.cmc.4xyz12345"
+ITUNES_URL = "https://itunes.apple.com/us/movie/the-matrix/id271469518?uo=4"
+
+
+class TestITunesProvider(unittest.TestCase):
+    def setUp(self):
+        self.apple_provider = MagicMock()
+        self.apple_provider.get_page_artworks.return_value = ("poster", "bg", "logo")
+        self.apple_provider.get_derived_artworks.return_value = None
+        self.provider = ITunesProvider(self.apple_provider)
+
+        match_patcher = patch("services.provider.itunes.get_itunes_match")
+        self.get_itunes_match = match_patcher.start()
+        self.addCleanup(match_patcher.stop)
+        self.get_itunes_match.return_value = {"trackViewUrl": ITUNES_URL}
+
+        url_patcher = patch("services.provider.itunes.get_apple_tv_url")
+        self.get_apple_tv_url = url_patcher.start()
+        self.addCleanup(url_patcher.stop)
+        self.get_apple_tv_url.return_value = US_URL
+
+    def get_artworks(self, entity: str = "movie"):
+        return self.provider.get_artworks(
+            "The Matrix", ["Lana Wachowski"], 1999, "us", entity
+        )
+
+    def test_itunes_match_resolves_apple_tv_page(self):
+        artworks = self.get_artworks()
+
+        self.assertEqual(artworks, ("poster", "bg", "logo", 0))
+        self.get_apple_tv_url.assert_called_once_with(ITUNES_URL)
+        self.apple_provider.remember_resolved_url.assert_called_once_with(US_URL)
+        self.assertEqual(self.provider.hit_count, 1)
+
+    def test_derived_storefront_skips_itunes(self):
+        self.apple_provider.get_derived_artworks.return_value = ("p", "b", "l")
+
+        self.assertEqual(self.get_artworks(), ("p", "b", "l", 0))
+        self.get_itunes_match.assert_not_called()
+        self.apple_provider.get_page_artworks.assert_not_called()
+
+    def test_no_confident_match(self):
+        self.get_itunes_match.return_value = {}
+
+        artworks = self.get_artworks()
+
+        self.assertEqual(artworks, (None, None, None, 0))
+        self.apple_provider.get_page_artworks.assert_not_called()
+        self.assertEqual(self.provider.miss_count, 1)
+
+    def test_invalid_page_is_a_miss(self):
+        self.apple_provider.get_page_artworks.return_value = None
+
+        artworks = self.get_artworks()
+
+        self.assertEqual(artworks, (None, None, None, 0))
+        self.apple_provider.remember_resolved_url.assert_not_called()
+
+    def test_shows_are_left_to_the_next_provider(self):
+        self.assertEqual(self.get_artworks("show"), (None, None, None, 0))
+        self.get_itunes_match.assert_not_called()
+
+    def test_prefetched_url_is_used_once(self):
+        self.provider.prefetch("The Matrix", ["Lana Wachowski"], 1999, "us", "movie")
+        self.apple_provider.prefetch_page.assert_called_once_with(US_URL)
+
+        self.assertEqual(self.get_artworks(), ("poster", "bg", "logo", 0))
+        self.get_itunes_match.assert_called_once()
+
+        self.get_artworks()
+        self.assertEqual(self.get_itunes_match.call_count, 2)
+
+    def test_begin_movie_drops_prefetched_urls(self):
+        self.provider.prefetch("The Matrix", ["Lana Wachowski"], 1999, "us", "movie")
+        self.provider.begin_movie()
+
+        self.get_artworks()
+        self.assertEqual(self.get_itunes_match.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import TYPE_CHECKING
 
 from client.plex.image import get_last_upload_if_agent_selected
@@ -27,7 +26,6 @@ class ArtworksReverterTask:
             )
         self.plex_manager = plex_manager
         self.artworks_types = artworks_types
-        self.sleep_interval = 0.1  # seconds
 
     def run(self) -> None:
         movies = self.plex_manager.get_all_movies()
@@ -43,8 +41,8 @@ class ArtworksReverterTask:
 
     def process_artwork_type(self, movies: list[Movie], artwork_type: str) -> None:
         for movie in movies:
+            # Paced by the Plex client's rate governor
             self.process_image(movie, artwork_type)
-            time.sleep(self.sleep_interval)
 
     def process_image(self, movie: Movie, artwork_type: str) -> None:
         plex_movie_id = movie["plex_movie_id"]
@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import logging
 import time
+from functools import partial
 from typing import TYPE_CHECKING
 
+from client.google.quota import BACKLOG, MISSING_RECENT, quota_scope
+from services.artworks.pipeline import UpdateJob
+
 if TYPE_CHECKING:
+    from client.google.quota import QuotaLedger
     from client.plex.manager import PlexManager
+    from models.artworks import Artworks
     from models.movie import Movie
+    from services.artworks.pipeline import ArtworksPipeline
     from services.artworks.updater import ArtworksUpdater
     from storage.movies_cache import MoviesCache
 
@@ -21,6 +28,9 @@ class MissingArtworksTask:
     - Iterate over cached "missing artworks" movies
     - Retry artwork update using ArtworksUpdater
     - Remove from cache once complete
+
+    With a `pipeline`, uploads of a movie overlap the retrieval of the next ones
+    and the pipeline's own pacing replaces `sleep_interval`.
     """
 
     def __init__(
@@ -28,23 +38,51 @@ class MissingArtworksTask:
         plex_manager: PlexManager,
         artworks_updater: ArtworksUpdater,
         missing_artworks_cache: MoviesCache,
-        sleep_interval: float = 1.0,
+        sleep_interval: float = 0.0,
         search_quota: int = 100,
         recent_threshold_days: int = 7,
+        quota_ledger: QuotaLedger | None = None,
+        pipeline: ArtworksPipeline | None = None,
     ) -> None:
         self.plex_manager = plex_manager
         self.artworks_updater = artworks_updater
         self.sleep_interval = sleep_interval
         self.search_quota = search_quota
         self.recent_threshold_days = recent_threshold_days
+        self.quota_ledger = quota_ledger
+        self.pipeline = pipeline
 
         self.cache = missing_artworks_cache
 
-    def _process_movie(self, movie: Movie, now: float, to_remove: list[Movie]) -> int:
+    def _process_movie(
+        self, movie: Movie, now: float, to_remove: list[Movie]
+    ) -> tuple[int, bool]:
+        """Update a movie. Returns its CSE calls and whether it was deferred."""
         current_artworks = movie.get("artworks")
         status, new_artworks, search_count = self.artworks_updater.update(
             movie, current_artworks
         )
+        deferred = self._handle_result(
+            movie, status, new_artworks, search_count, now, to_remove
+        )
+
+        time.sleep(self.sleep_interval)
+        return search_count, deferred
+
+    def _handle_result(
+        self,
+        movie: Movie,
+        status: str,
+        new_artworks: Artworks,
+        search_count: int,
+        now: float,
+        to_remove: list[Movie],
+    ) -> bool:
+        """Record the outcome of an update. Returns whether the movie was deferred."""
+        # Left unchecked, so the movie keeps its place at the front of the backlog
+        if status == "quota_exhausted":
+            return True
+
         movie["last_checked_date"] = int(now)
         logger.debug(f"Search queries used for '{movie['title']}': {search_count}")
 
@@ -60,9 +98,112 @@ class MissingArtworksTask:
         elif status == "imperfect_artworks":
             movie["artworks"] = new_artworks
             logger.info(f"\u26a0 Incomplete artworks remain for {movie['title']}")
+        return False
 
-        time.sleep(self.sleep_interval)
-        return search_count
+    def get_quota_remaining(self, quota_used: int) -> int:
+        """Backlog budget left: per-run quota, capped by the shared daily ledger."""
+        remaining = self.search_quota - quota_used
+        if self.quota_ledger is not None:
+            remaining = min(remaining, self.quota_ledger.remaining(BACKLOG))
+        return remaining
+
+    def _run_sequential(
+        self,
+        recent: list[tuple[int, Movie]],
+        backlog: list[tuple[int, Movie]],
+        now: float,
+        to_remove: list[Movie],
+    ) -> tuple[int, int]:
+        """Update movies one after another. Returns CSE calls used and deferred count."""
+        quota_used = 0
+        deferred = 0
+        for plex_movie_id, movie in recent:
+            if not self.plex_manager.exists(plex_movie_id):
+                to_remove.append(movie)
+                continue
+
+            with quota_scope(self.quota_ledger, MISSING_RECENT):
+                search_count, refused = self._process_movie(movie, now, to_remove)
+            quota_used += search_count
+            deferred += refused
+
+        self._warn_recent_over_quota(quota_used)
+
+        for plex_movie_id, movie in backlog:
+            if not self.plex_manager.exists(plex_movie_id):
+                to_remove.append(movie)
+                continue
+
+            if self.get_quota_remaining(quota_used) <= 0:
+                deferred += 1
+                continue
+
+            with quota_scope(self.quota_ledger, BACKLOG):
+                search_count, refused = self._process_movie(movie, now, to_remove)
+            quota_used += search_count
+            deferred += refused
+
+        return quota_used, deferred
+
+    def _run_pipelined(
+        self,
+        recent: list[tuple[int, Movie]],
+        backlog: list[tuple[int, Movie]],
+        now: float,
+        to_remove: list[Movie],
+    ) -> tuple[int, int]:
+        """Same selection as _run_sequential, with retrieval and upload overlapped."""
+        pipeline = self.pipeline
+        deferred = 0
+        refused = 0
+
+        # Pulled by the retrieval stage, so quota checks see its search count
+        def jobs():
+            nonlocal deferred
+            for plex_movie_id, movie in recent:
+                if not self.plex_manager.exists(plex_movie_id):
+                    to_remove.append(movie)
+                    continue
+                yield UpdateJob(
+                    movie,
+                    movie.get("artworks"),
+                    partial(quota_scope, self.quota_ledger, MISSING_RECENT),
+                )
+
+            self._warn_recent_over_quota(pipeline.search_count)
+
+            for plex_movie_id, movie in backlog:
+                if not self.plex_manager.exists(plex_movie_id):
+                    to_remove.append(movie)
+                    continue
+
+                if self.get_quota_remaining(pipeline.search_count) <= 0:
+                    deferred += 1
+                    continue
+
+                yield UpdateJob(
+                    movie,
+                    movie.get("artworks"),
+                    partial(quota_scope, self.quota_ledger, BACKLOG),
+                )
+
+        for result in pipeline.run(jobs()):
+            refused += self._handle_result(
+                result.job.movie,
+                result.status,
+                result.artworks,
+                result.search_count,
+                now,
+                to_remove,
+            )
+        return pipeline.search_count, deferred + refused
+
+    def _warn_recent_over_quota(self, quota_used: int) -> None:
+        if quota_used > self.search_quota:
+            logger.warning(
+                f"Recent movies exceeded search quota "
+                f"({quota_used}/{self.search_quota} CSE calls used)"
+            )
 
     def run(self) -> None:
         self.cache.load()
@@ -81,47 +222,24 @@ class MissingArtworksTask:
         )
 
         to_remove = []
-        quota_used = 0
 
         logger.info(
             f"Missing artworks: {len(recent)} recent, {len(backlog)} backlog "
             f"(quota: {self.search_quota})"
         )
 
-        for plex_movie_id, movie in recent:
-            if not self.plex_manager.exists(plex_movie_id):
-                to_remove.append(movie)
-                continue
-
-            quota_used += self._process_movie(movie, now, to_remove)
-
-        if quota_used > self.search_quota:
-            logger.warning(
-                f"Recent movies exceeded search quota "
-                f"({quota_used}/{self.search_quota} CSE calls used)"
-            )
-
-        quota_remaining = self.search_quota - quota_used
-        deferred = 0
-
-        for plex_movie_id, movie in backlog:
-            if not self.plex_manager.exists(plex_movie_id):
-                to_remove.append(movie)
-                continue
-
-            if quota_remaining <= 0:
-                deferred += 1
-                continue
-
-            search_count = self._process_movie(movie, now, to_remove)
-            quota_used += search_count
-            quota_remaining -= search_count
+        if self.pipeline is None:
+            quota_used, deferred = self._run_sequential(recent, backlog, now, to_remove)
+        else:
+            quota_used, deferred = self._run_pipelined(recent, backlog, now, to_remove)
 
         if deferred:
             logger.info(
-                f"⏭ {deferred} backlog movie(s) deferred to next run "
+                f"⏭ {deferred} missing artworks movie(s) deferred to next run "
                 f"(quota exhausted: {quota_used}/{self.search_quota} CSE calls)"
             )
 
         self.cache.remove_all(to_remove)
         self.cache.save()
+        self.artworks_updater.save()
+        self.artworks_updater.log_stats()
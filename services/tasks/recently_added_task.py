@@ -2,11 +2,18 @@ from __future__ import annotations
 
 import logging
 import time
+from functools import partial
 from typing import TYPE_CHECKING
 
+from client.google.quota import RECENTLY_ADDED, quota_scope
+from services.artworks.pipeline import UpdateJob
+
 if TYPE_CHECKING:
+    from client.google.quota import QuotaLedger
     from client.plex.manager import PlexManager
+    from models.artworks import Artworks
     from models.movie import Movie
+    from services.artworks.pipeline import ArtworksPipeline
     from services.artworks.updater import ArtworksUpdater
     from services.metadata.updater import MetadataUpdater
     from storage.movies_cache import MoviesCache
@@ -22,6 +29,9 @@ class RecentlyAddedTask:
     - Retrieve newly added Plex movies
     - Use ArtworksUpdater to update their artworks
     - Manage its own cache to avoid reprocessing
+
+    With a `pipeline`, uploads of a movie overlap the retrieval of the next ones
+    and the pipeline's own pacing replaces `sleep_interval`.
     """
 
     def __init__(
@@ -31,7 +41,9 @@ class RecentlyAddedTask:
         metadata_updater: MetadataUpdater,
         recently_added_cache: MoviesCache,
         missing_artworks_cache: MoviesCache,
-        sleep_interval: float = 1.0,
+        sleep_interval: float = 0.0,
+        quota_ledger: QuotaLedger | None = None,
+        pipeline: ArtworksPipeline | None = None,
     ) -> None:
         self.plex_manager = plex_manager
         self.artworks_updater = artworks_updater
@@ -39,6 +51,8 @@ class RecentlyAddedTask:
         self.metadata_updater = metadata_updater
         self.recent_cache = recently_added_cache
         self.missing_cache = missing_artworks_cache
+        self.quota_ledger = quota_ledger
+        self.pipeline = pipeline
 
     def run(self) -> None:
         self.recent_cache.load()
@@ -49,43 +63,117 @@ class RecentlyAddedTask:
             logger.info("No recently added movies found.")
             return
 
-        for movie in recently_added_movies:
+        # Movies already handled are kept even if the run stops halfway
+        try:
+            if self.pipeline is None:
+                deferred = self._run_sequential(recently_added_movies)
+            else:
+                deferred = self._run_pipelined(recently_added_movies)
+
+            if deferred:
+                logger.info(
+                    f"⏭ {deferred} recently added movie(s) deferred to next run "
+                    f"(CSE quota exhausted)"
+                )
+
+            # Trim cache so only the most recent movies remain relevant
+            last_movie = recently_added_movies[-1]
+            self.recent_cache.clear(last_movie)
+        finally:
+            self.recent_cache.save()
+            self.missing_cache.save()
+            self.artworks_updater.save()
+            self.artworks_updater.log_stats()
+
+    def _run_sequential(self, movies: list[Movie]) -> int:
+        """Update movies one after another. Returns the deferred count."""
+        deferred = 0
+        for movie in movies:
             if movie in self.recent_cache:
                 continue
 
-            self.process_movie(movie)
+            # Not cached when deferred, so the movie is picked up on the next run
+            if self.is_quota_exhausted():
+                deferred += 1
+                continue
+
+            with quota_scope(self.quota_ledger, RECENTLY_ADDED):
+                if self.process_movie(movie):
+                    deferred += 1
 
             time.sleep(self.sleep_interval)
+        return deferred
+
+    def _run_pipelined(self, movies: list[Movie]) -> int:
+        """Same selection as _run_sequential, with retrieval and upload overlapped."""
+        deferred = 0
+        refused = 0
+        scope = partial(quota_scope, self.quota_ledger, RECENTLY_ADDED)
+        # Read here: the cache is updated by handle_result while jobs are pulled
+        new_movies = [movie for movie in movies if movie not in self.recent_cache]
+
+        # Pulled by the retrieval stage, so quota checks follow its searches
+        def jobs():
+            nonlocal deferred
+            for movie in new_movies:
+                if self.is_quota_exhausted():
+                    deferred += 1
+                    continue
+
+                if self.match_tmdb_id(movie):
+                    yield UpdateJob(movie, None, scope)
+
+        for result in self.pipeline.run(jobs()):
+            if self.handle_result(
+                result.job.movie, result.status, result.artworks, result.search_count
+            ):
+                refused += 1
+        return deferred + refused
+
+    def is_quota_exhausted(self) -> bool:
+        if self.quota_ledger is None:
+            return False
+        return self.quota_ledger.remaining(RECENTLY_ADDED) <= 0
+
+    def process_movie(self, movie: Movie) -> bool:
+        """Update a movie. Returns whether it was deferred to the next run."""
+        if not self.match_tmdb_id(movie):
+            return False
 
-        # Trim cache so only the most recent movies remain relevant
-        last_movie = recently_added_movies[-1]
-        self.recent_cache.clear(last_movie)
-
-        self.recent_cache.save()
-        self.missing_cache.save()
+        status, artworks, search_count = self.artworks_updater.update(movie, None)
+        return self.handle_result(movie, status, artworks, search_count)
 
-    def process_movie(self, movie: Movie) -> None:
+    def match_tmdb_id(self, movie: Movie) -> bool:
         tmdb_id = self.plex_manager.get_tmdb_id(movie["plex_movie_id"])
         if not tmdb_id:
             logger.warning(
                 f"Movie {movie['title']} is not matched in TMDB. Skipping it for now."
             )
-            return
+            return False
 
         movie["tmdb_id"] = tmdb_id
-        status, artworks, search_count = self.artworks_updater.update(movie, None)
+        return True
+
+    def handle_result(
+        self, movie: Movie, status: str, artworks: Artworks, search_count: int
+    ) -> bool:
+        """Record the outcome of an update. Returns whether the movie was deferred."""
         logger.debug(f"Search queries used for '{movie['title']}': {search_count}")
 
+        # Not cached, so the movie is searched again once the quota resets
+        if status == "quota_exhausted":
+            return True
+
         if status == "upload_failed":
             logger.warning(f"✗ Upload failed for {movie['title']}")
-            return
+            return False
 
         self.metadata_updater.update_release_date(movie)
         self.recent_cache.add(movie)
 
         if status == "success":
             logger.info(f"✓ Complete artworks found for {movie['title']}")
-            return
+            return False
 
         movie_with_artworks = movie.copy()
         movie_with_artworks["artworks"] = artworks
@@ -95,3 +183,4 @@ class RecentlyAddedTask:
             logger.info(f"⚠ No artworks found for {movie['title']}")
         elif status == "imperfect_artworks":
             logger.info(f"⚠ Incomplete artworks found for {movie['title']}")
+        return False
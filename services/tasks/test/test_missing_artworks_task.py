@@ -3,6 +3,7 @@ from __future__ import annotations
 import unittest
 from unittest.mock import MagicMock, Mock, call, patch
 
+from services.artworks.pipeline import ArtworksPipeline
 from services.tasks.missing_artworks_task import MissingArtworksTask
 
 # Fixed timestamps used across all tests
@@ -133,6 +134,7 @@ class TestMissingArtworksTaskStatusHandling(unittest.TestCase):
 
         cache.load.assert_called_once()
         cache.save.assert_called_once()
+        artworks_updater.save.assert_called_once()
 
 
 class TestMissingArtworksTaskQuota(unittest.TestCase):
@@ -262,6 +264,31 @@ class TestMissingArtworksTaskQuota(unittest.TestCase):
 
         self.assertEqual(movie["last_checked_date"], _NOW)
 
+    @patch("services.tasks.missing_artworks_task.time.sleep", return_value=None)
+    @patch("services.tasks.missing_artworks_task.time.time", return_value=float(_NOW))
+    def test_movie_refused_by_quota_is_not_checked(self, _mock_time, _mock_sleep):
+        """A movie cut short by the CSE quota keeps its place and its artworks."""
+        plex_manager = Mock()
+        artworks_updater = Mock()
+
+        artworks = {"poster": {"url": "p"}, "background": None, "logo": None}
+        movie = {"title": "Movie", "id": 1, "added_date": _OLD_DATE}
+        movie["artworks"] = artworks
+        cache = _make_cache({1: movie})
+        plex_manager.exists.return_value = True
+        artworks_updater.update.return_value = (
+            "quota_exhausted",
+            {"poster": None, "background": None, "logo": None},
+            0,
+        )
+
+        task = _make_task(plex_manager, artworks_updater, cache)
+        task.run()
+
+        self.assertNotIn("last_checked_date", movie)
+        self.assertEqual(movie["artworks"], artworks)
+        cache.remove_all.assert_called_once_with([])
+
     @patch("services.tasks.missing_artworks_task.time.sleep", return_value=None)
     @patch("services.tasks.missing_artworks_task.time.time", return_value=float(_NOW))
     def test_skipped_backlog_movie_last_checked_date_not_updated(
@@ -319,6 +346,75 @@ class TestMissingArtworksTaskQuota(unittest.TestCase):
         self.assertIn(1, removed_ids)  # nonexistent → removed
         self.assertNotIn(2, removed_ids)  # quota=0, not processed, not removed
 
+    @patch("services.tasks.missing_artworks_task.time.sleep", return_value=None)
+    @patch("services.tasks.missing_artworks_task.time.time", return_value=float(_NOW))
+    def test_backlog_capped_by_shared_quota_ledger(self, _mock_time, _mock_sleep):
+        """The shared daily ledger caps the backlog below the per-run quota."""
+        plex_manager = Mock()
+        artworks_updater = Mock()
+        quota_ledger = MagicMock()
+
+        cache = _make_cache(
+            {
+                1: {"title": "Recent", "id": 1, "added_date": _RECENT_DATE},
+                2: {"title": "Backlog 1", "id": 2, "added_date": _OLD_DATE},
+                3: {"title": "Backlog 2", "id": 3, "added_date": _OLD_DATE},
+            }
+        )
+        plex_manager.exists.return_value = True
+        artworks_updater.update.return_value = ("empty_artworks", None, 2)
+        # Daily ledger: budget for one backlog movie, then exhausted
+        quota_ledger.remaining.side_effect = [2, 0]
+
+        task = _make_task(plex_manager, artworks_updater, cache, search_quota=100)
+        task.quota_ledger = quota_ledger
+        task.run()
+
+        processed_ids = [
+            c.args[0]["id"] for c in artworks_updater.update.call_args_list
+        ]
+        self.assertEqual(processed_ids, [1, 2])
+        quota_ledger.use.assert_has_calls(
+            [call("missing_recent"), call("backlog")], any_order=True
+        )
+
+
+class TestMissingArtworksTaskPipeline(unittest.TestCase):
+    """Pipelined runs select, defer and remove movies like sequential ones."""
+
+    @patch("services.tasks.missing_artworks_task.time.time", return_value=float(_NOW))
+    def test_backlog_deferred_when_quota_exhausted(self, _mock_time):
+        plex_manager = Mock()
+        plex_manager.exists.return_value = True
+        artworks_updater = Mock()
+        artworks_updater.fetch.return_value = ({"poster": None}, 4)
+        artworks_updater.are_better.return_value = True
+        artworks_updater.uploader.upload.return_value = True
+        artworks_updater.get_status.return_value = "success"
+
+        cache = _make_cache(
+            {
+                1: {"title": "Backlog 1", "id": 1, "added_date": _OLD_DATE},
+                2: {"title": "Backlog 2", "id": 2, "added_date": _OLD_DATE},
+                3: {"title": "Backlog 3", "id": 3, "added_date": _OLD_DATE},
+            }
+        )
+        task = MissingArtworksTask(
+            plex_manager=plex_manager,
+            artworks_updater=artworks_updater,
+            missing_artworks_cache=cache,
+            search_quota=5,
+            recent_threshold_days=_RECENT_THRESHOLD_DAYS,
+            pipeline=ArtworksPipeline(artworks_updater),
+        )
+        task.run()
+
+        # Same as sequential: 5 → 1 → -3, the third movie is deferred
+        self.assertEqual(artworks_updater.fetch.call_count, 2)
+        removed_ids = sorted(m["id"] for m in cache.remove_all.call_args[0][0])
+        self.assertEqual(removed_ids, [1, 2])
+        artworks_updater.update.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -119,6 +119,7 @@ class TestRecentlyAddedTask(unittest.TestCase):
         missing_cache.load.assert_called_once()
         recent_cache.save.assert_called_once()
         missing_cache.save.assert_called_once()
+        artworks_updater.save.assert_called_once()
 
         # metadata updater should be called for matched movies only and not upload failed
         self.assertEqual(metadata_updater.update_release_date.call_count, 3)
@@ -131,6 +132,114 @@ class TestRecentlyAddedTask(unittest.TestCase):
             any_order=False,
         )
 
+    @patch("services.tasks.recently_added_task.time.sleep", return_value=None)
+    def test_run_defers_movies_when_quota_exhausted(self, _mock_sleep):
+        plex_manager = Mock()
+        artworks_updater = Mock()
+        quota_ledger = MagicMock()
+        recent_cache = MagicMock(
+            spec_set=["load", "save", "add", "clear", "__contains__"]
+        )
+        recent_cache.__contains__.return_value = False
+        missing_cache = MagicMock(spec_set=["load", "save", "add"])
+
+        recently_added_movies = [
+            {"title": "Movie 1", "plex_movie_id": 1},
+            {"title": "Movie 2", "plex_movie_id": 2},
+        ]
+        plex_manager.get_recently_added_movies.return_value = recently_added_movies
+        plex_manager.get_tmdb_id.return_value = "1111"
+        artworks_updater.update.return_value = ("success", ["artwork"], 2)
+        # Budget left for the first movie only
+        quota_ledger.remaining.side_effect = [2, 0]
+
+        task = RecentlyAddedTask(
+            plex_manager=plex_manager,
+            artworks_updater=artworks_updater,
+            metadata_updater=Mock(),
+            recently_added_cache=recent_cache,
+            missing_artworks_cache=missing_cache,
+            sleep_interval=0.0,
+            quota_ledger=quota_ledger,
+        )
+        task.run()
+
+        artworks_updater.update.assert_called_once_with(recently_added_movies[0], None)
+        quota_ledger.use.assert_called_once_with("recently_added")
+        # Deferred movie is not cached so it is retried on the next run
+        recent_cache.add.assert_called_once_with(recently_added_movies[0])
+
+    @patch("services.tasks.recently_added_task.time.sleep", return_value=None)
+    def test_run_defers_movie_refused_by_quota(self, _mock_sleep):
+        plex_manager = Mock()
+        artworks_updater = Mock()
+        recent_cache = MagicMock(
+            spec_set=["load", "save", "add", "clear", "__contains__"]
+        )
+        recent_cache.__contains__.return_value = False
+        missing_cache = MagicMock(spec_set=["load", "save", "add"])
+
+        movie = {"title": "Movie 1", "plex_movie_id": 1}
+        plex_manager.get_recently_added_movies.return_value = [movie]
+        plex_manager.get_tmdb_id.return_value = "1111"
+        # The ledger refused a call partway through the movie
+        artworks_updater.update.return_value = (
+            "quota_exhausted",
+            {"poster": None, "background": None, "logo": None},
+            0,
+        )
+
+        task = RecentlyAddedTask(
+            plex_manager=plex_manager,
+            artworks_updater=artworks_updater,
+            metadata_updater=Mock(),
+            recently_added_cache=recent_cache,
+            missing_artworks_cache=missing_cache,
+            sleep_interval=0.0,
+        )
+        task.run()
+
+        recent_cache.add.assert_not_called()
+        missing_cache.add.assert_not_called()
+
+    @patch("services.tasks.recently_added_task.time.sleep", return_value=None)
+    def test_caches_saved_when_run_fails(self, _mock_sleep):
+        plex_manager = Mock()
+        artworks_updater = Mock()
+        recent_cache = MagicMock(
+            spec_set=["load", "save", "add", "clear", "__contains__"]
+        )
+        recent_cache.__contains__.return_value = False
+        missing_cache = MagicMock(spec_set=["load", "save", "add"])
+
+        movies = [
+            {"title": "Movie 1", "plex_movie_id": 1},
+            {"title": "Movie 2", "plex_movie_id": 2},
+        ]
+        plex_manager.get_recently_added_movies.return_value = movies
+        plex_manager.get_tmdb_id.return_value = "1111"
+        artworks_updater.update.side_effect = [
+            ("success", ["artwork"], 2),
+            ConnectionError("plex down"),
+        ]
+
+        task = RecentlyAddedTask(
+            plex_manager=plex_manager,
+            artworks_updater=artworks_updater,
+            metadata_updater=Mock(),
+            recently_added_cache=recent_cache,
+            missing_artworks_cache=missing_cache,
+            sleep_interval=0.0,
+        )
+        with self.assertRaises(ConnectionError):
+            task.run()
+
+        recent_cache.add.assert_called_once_with(movies[0])
+        recent_cache.clear.assert_not_called()
+        recent_cache.save.assert_called_once()
+        missing_cache.save.assert_called_once()
+        artworks_updater.save.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
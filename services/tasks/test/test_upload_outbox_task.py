@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+from unittest.mock import Mock
+
+from services.tasks.upload_outbox_task import UploadOutboxTask
+from storage.movies_cache import MoviesCache
+from storage.upload_outbox import UploadOutbox
+
+
+class TestUploadOutboxTask(unittest.TestCase):
+    def setUp(self):
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.outbox = UploadOutbox(tmpdir.name, retry_delay_seconds=0, max_attempts=2)
+        self.missing_cache = MoviesCache(tmpdir.name, "missing_artworks")
+        self.uploader = Mock()
+        self.task = UploadOutboxTask(self.uploader, self.outbox, self.missing_cache)
+
+        for movie_id in (1, 2, 3):
+            movie = {"plex_movie_id": movie_id, "title": f"Movie {movie_id}"}
+            self.outbox.add(movie, "poster", {"url": f"https://example.com/{movie_id}"})
+
+    def test_delivered_jobs_are_removed(self):
+        self.uploader.upload_image.return_value = True
+
+        self.task.run()
+
+        self.assertEqual(self.uploader.upload_image.call_count, 3)
+        self.assertEqual(len(self.outbox), 0)
+        self.uploader.save.assert_called_once()
+
+    def test_stops_at_first_failure(self):
+        self.uploader.upload_image.side_effect = [True, False]
+
+        with self.assertLogs("services.tasks.upload_outbox_task") as logs:
+            self.task.run()
+
+        self.assertEqual(self.uploader.upload_image.call_count, 2)
+        self.assertEqual(len(self.outbox), 2)
+        self.assertIn("1 upload(s) delivered, 2 pending", logs.output[-1])
+
+    def test_given_up_movie_goes_back_to_missing_cache(self):
+        self.uploader.upload_image.return_value = False
+        self.outbox.discard(2, "poster")
+        self.outbox.discard(3, "poster")
+
+        self.task.run()
+        self.assertIsNone(self.missing_cache.get(1))
+        with self.assertLogs("services.tasks.upload_outbox_task", "WARNING"):
+            self.task.run()
+
+        self.assertEqual(len(self.outbox), 0)
+        self.missing_cache.load()
+        self.assertEqual(
+            self.missing_cache.get(1), {"plex_movie_id": 1, "title": "Movie 1"}
+        )
+
+    def test_given_up_artwork_is_cleared_in_missing_cache(self):
+        self.uploader.upload_image.return_value = False
+        artworks = {"poster": {"url": "https://example.com/1"}, "logo": None}
+        self.missing_cache.add({"plex_movie_id": 2, "artworks": artworks})
+        self.missing_cache.save()
+        self.outbox.discard(1, "poster")
+        self.outbox.discard(3, "poster")
+
+        self.task.run()
+        self.task.run()
+
+        self.missing_cache.load()
+        self.assertIsNone(self.missing_cache.get(2)["artworks"]["poster"])
+
+
+if __name__ == "__main__":
+    unittest.main()
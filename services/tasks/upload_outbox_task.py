@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from services.artworks.uploader import ArtworksUploader
+    from storage.movies_cache import MoviesCache
+    from storage.upload_outbox import OutboxJob, UploadOutbox
+
+logger = logging.getLogger(__name__)
+
+
+class UploadOutboxTask:
+    """
+    Task that retries the artwork uploads queued in the outbox.
+
+    Runs on its own schedule and only talks to Plex: the URLs to upload were
+    resolved when the jobs were queued, so retries cost no search quota.
+    A job given up after its last attempt puts its movie back in the missing
+    artworks cache, without the artwork Plex never received.
+    """
+
+    def __init__(
+        self,
+        artworks_uploader: ArtworksUploader,
+        upload_outbox: UploadOutbox,
+        missing_artworks_cache: MoviesCache,
+    ) -> None:
+        self.uploader = artworks_uploader
+        self.outbox = upload_outbox
+        self.missing_cache = missing_artworks_cache
+
+    def run(self) -> None:
+        jobs = self.outbox.get_due()
+        if not jobs:
+            return
+
+        delivered = 0
+        for job in jobs:
+            movie = job["movie"]
+            artwork_type = job["artwork_type"]
+            if self.uploader.upload_image(movie, artwork_type, job["image"]):
+                self.outbox.remove(job)
+                delivered += 1
+                continue
+
+            rescheduled = self.outbox.reschedule(job)
+            if not rescheduled and job["attempts"] >= self.outbox.max_attempts:
+                logger.warning(
+                    f"✗ Gave up uploading {artwork_type} for {movie['title']} "
+                    f"after {job['attempts']} attempt(s), searching it again later"
+                )
+                self.return_to_missing(job)
+            # Plex is most likely unavailable, leave the other jobs for later
+            break
+
+        self.uploader.save()
+
+        logger.info(
+            f"Upload outbox: {delivered} upload(s) delivered, "
+            f"{len(self.outbox)} pending"
+        )
+
+    def return_to_missing(self, job: OutboxJob) -> None:
+        """Mark the artwork of a given up job as missing, so it is searched again."""
+        self.missing_cache.load()
+        movie_id = job["movie"]["plex_movie_id"]
+        cached_movie = self.missing_cache.get(movie_id)
+        if cached_movie is None:
+            # Without current artworks, any artworks found are uploaded
+            self.missing_cache.add(job["movie"].copy())
+        elif cached_movie.get("artworks"):
+            cached_movie["artworks"][job["artwork_type"]] = None
+        self.missing_cache.save()
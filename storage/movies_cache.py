@@ -19,6 +19,9 @@ class MoviesCache:
         if id not in self.cache:
             self.cache.add(id, movie)
 
+    def get(self, id: int) -> Movie | None:
+        return self.cache.get(id)
+
     def remove(self, movie: Movie) -> None:
         id = self.get_id(movie)
         if id in self.cache:
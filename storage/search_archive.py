@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import gzip
+import json
+import time
+from collections.abc import Iterator
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from storage.search_cache import SearchCache
+
+if TYPE_CHECKING:
+    from models.target import Target
+
+
+class SearchArchive:
+    """
+    Append-only archive of raw Google CSE results, for offline re-scoring.
+
+    One gzipped JSON-lines file per UTC day, with two kinds of records:
+    - {"kind": "response", "query", "ts", "items"} for every CSE call answered
+    - {"kind": "outcome", "target", "url", "ts"} for every SearchEngine.query
+
+    With `retention_days`, the files of older days are deleted whenever a new
+    day file is started.
+    """
+
+    def __init__(
+        self, path: str, dirname: str = "search_archive", retention_days: int = 0
+    ) -> None:
+        self.dirpath = Path(path) / dirname
+        self.retention_days = retention_days
+        self.day = ""
+
+    def add_response(
+        self, query: str, items: list[dict], now: float | None = None
+    ) -> None:
+        self._append({"kind": "response", "query": query, "items": items}, now)
+
+    def add_outcome(
+        self, target: Target, url: str | None, now: float | None = None
+    ) -> None:
+        self._append({"kind": "outcome", "target": asdict(target), "url": url}, now)
+
+    def iter_records(self, since: str | None = None) -> Iterator[dict]:
+        """Records in chronological order, from the day `since` (YYYY-MM-DD) on."""
+        for filepath in sorted(self.dirpath.glob("*.jsonl.gz")):
+            if since and filepath.name[:10] < since:
+                continue
+            with gzip.open(filepath, "rt", encoding="utf-8") as file:
+                for line in file:
+                    yield json.loads(line)
+
+    def get_latest_responses(self, since: str | None = None) -> dict[str, list[dict]]:
+        return {
+            SearchCache.normalize_query(record["query"]): record["items"]
+            for record in self.iter_records(since)
+            if record["kind"] == "response"
+        }
+
+    def get_latest_outcomes(self, since: str | None = None) -> dict[tuple, dict]:
+        """Last outcome recorded per target."""
+        outcomes = {}
+        for record in self.iter_records(since):
+            if record["kind"] == "outcome":
+                target = record["target"]
+                key = (
+                    target["title"],
+                    target["year"],
+                    target["country"],
+                    target["entity"],
+                )
+                outcomes[key] = record
+        return outcomes
+
+    def _append(self, record: dict, now: float | None) -> None:
+        now = time.time() if now is None else now
+        day = datetime.fromtimestamp(now, tz=timezone.utc).strftime("%Y-%m-%d")
+        if day != self.day:
+            self.day = day
+            self.prune(now)
+
+        self.dirpath.mkdir(parents=True, exist_ok=True)
+        # Each append adds a gzip member, gzip.open reads them back as one stream
+        with gzip.open(
+            self.dirpath / f"{day}.jsonl.gz", "at", encoding="utf-8"
+        ) as file:
+            file.write(json.dumps({**record, "ts": now}, ensure_ascii=False) + "\n")
+
+    def prune(self, now: float | None = None) -> None:
+        """Delete the day files older than `retention_days`, if set."""
+        if not self.retention_days:
+            return
+
+        now = time.time() if now is None else now
+        oldest = datetime.fromtimestamp(
+            now - (self.retention_days - 1) * 86400, tz=timezone.utc
+        ).strftime("%Y-%m-%d")
+        for filepath in self.dirpath.glob("*.jsonl.gz"):
+            if filepath.name[:10] < oldest:
+                filepath.unlink(missing_ok=True)
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from utils.file_utils import load_json_file, save_json_file
+
+
+class SearchCache:
+    """
+    Disk-backed cache of raw Google CSE results, keyed by normalized query.
+    Entries are added in memory and written by save() at the end of a run.
+
+    Results with items are kept for `ttl_seconds`. Empty results are negative
+    entries: their TTL starts at `negative_ttl_seconds` and doubles each time the
+    query comes back empty again, up to `max_negative_ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        filename: str,
+        ttl_seconds: int = 7 * 86400,
+        negative_ttl_seconds: int = 86400,
+        max_negative_ttl_seconds: int = 30 * 86400,
+    ) -> None:
+        self.filepath = str(Path(path) / f"{filename}.json")
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_negative_ttl_seconds = max_negative_ttl_seconds
+        self.data: dict[str, dict] = {}
+        self.load()
+
+    @staticmethod
+    def normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    def get(self, query: str, now: float | None = None) -> list[dict] | None:
+        """Return the cached items of a query, or None if missing or expired."""
+        now = time.time() if now is None else now
+        entry = self.data.get(self.normalize_query(query))
+        if entry is None or entry["expires_at"] <= now:
+            return None
+        return entry["items"]
+
+    def add(self, query: str, items: list[dict], now: float | None = None) -> None:
+        now = time.time() if now is None else now
+        key = self.normalize_query(query)
+
+        misses = 0
+        ttl = self.ttl_seconds
+        if not items:
+            previous = self.data.get(key)
+            misses = previous["misses"] + 1 if previous else 1
+            backoff = self.negative_ttl_seconds * 2 ** (misses - 1)
+            ttl = min(backoff, self.max_negative_ttl_seconds)
+
+        self.data[key] = {"items": items, "expires_at": now + ttl, "misses": misses}
+
+    def load(self) -> None:
+        if not Path(self.filepath).exists():
+            self.data = {}
+            return
+
+        # Expired entries are kept a while so negative backoff survives expiry
+        keep_after = time.time() - self.max_negative_ttl_seconds
+        self.data = {
+            key: entry
+            for key, entry in load_json_file(self.filepath).items()
+            if entry["expires_at"] > keep_after
+        }
+
+    def save(self) -> None:
+        save_json_file(self.filepath, self.data)
+
+    def __contains__(self, query: str) -> bool:
+        return self.get(query) is not None
@@ -0,0 +1,87 @@
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from pathlib import Path
+
+from client.google.scoring import Scorer
+from client.google.search_engine import SearchEngine
+from client.google.test.test_search_engine import TARGET, URL, cse_item, cse_response
+from storage.search_archive import SearchArchive
+from tools.rescore_archive import rescore
+
+DAY = 86400
+QUERY = "site:tv.apple.com/us/movie The Matrix"
+
+
+class TestSearchArchive(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.archive = SearchArchive(self.tmp_dir.name)
+
+    def test_records_are_appended_per_day(self):
+        self.archive.add_response(QUERY, [{"link": "a"}], now=0)
+        self.archive.add_response(QUERY, [{"link": "b"}], now=1)
+        self.archive.add_outcome(TARGET, URL, now=DAY)
+
+        files = sorted(
+            p.name for p in Path(self.tmp_dir.name, "search_archive").iterdir()
+        )
+        records = list(self.archive.iter_records())
+
+        self.assertEqual(files, ["1970-01-01.jsonl.gz", "1970-01-02.jsonl.gz"])
+        self.assertEqual(
+            [r["kind"] for r in records], ["response", "response", "outcome"]
+        )
+        self.assertEqual(
+            list(self.archive.iter_records(since="1970-01-02")), records[2:]
+        )
+
+    def test_old_days_are_pruned(self):
+        archive = SearchArchive(self.tmp_dir.name, retention_days=2)
+        archive.add_response(QUERY, [{"link": "a"}], now=0)
+        archive.add_response(QUERY, [{"link": "b"}], now=DAY)
+        archive.add_response(QUERY, [{"link": "c"}], now=2 * DAY)
+
+        files = sorted(
+            p.name for p in Path(self.tmp_dir.name, "search_archive").iterdir()
+        )
+
+        self.assertEqual(files, ["1970-01-02.jsonl.gz", "1970-01-03.jsonl.gz"])
+
+    def test_latest_response_per_normalized_query(self):
+        self.archive.add_response(QUERY, [{"link": "a"}], now=0)
+        self.archive.add_response(QUERY.upper(), [{"link": "b"}], now=1)
+
+        responses = self.archive.get_latest_responses()
+
+        self.assertEqual(responses, {QUERY.lower(): [{"link": "b"}]})
+
+    def test_search_engine_archives_responses_and_outcomes(self):
+        session = MagicMock()
+        session.get.return_value = cse_response([cse_item()])
+        engine = SearchEngine(
+            "key", "cx", session=session, min_interval_s=0.0, archive=self.archive
+        )
+
+        engine.query(TARGET)
+
+        outcomes = self.archive.get_latest_outcomes()
+        self.assertEqual([o["url"] for o in outcomes.values()], [URL])
+        self.assertEqual(len(self.archive.get_latest_responses()), 1)
+
+    def test_rescore_reports_changed_outcomes(self):
+        # Title and director match, year unknown: 3.0 with the default scorer
+        item = cse_item(release_date="")
+        query = 'site:tv.apple.com/us/movie The Matrix "Lana Wachowski"'
+        self.archive.add_response(query, [item])
+        self.archive.add_outcome(TARGET, URL)
+
+        self.assertEqual(rescore(self.archive, Scorer()), [])
+
+        changes = rescore(self.archive, Scorer(title_threshold=1.01))
+        self.assertEqual(changes, [(TARGET, URL, None)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import tempfile
+import unittest
+
+from storage.search_cache import SearchCache
+
+DAY = 86400
+QUERY = "site:tv.apple.com/us/movie The Matrix"
+
+
+class TestSearchCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = SearchCache(self.tmp_dir.name, "search_results")
+
+    def test_query_is_normalized(self):
+        self.cache.add(QUERY, [{"link": "url"}], now=0)
+
+        items = self.cache.get("  SITE:tv.apple.com/us/movie   the matrix ", now=1)
+
+        self.assertEqual(items, [{"link": "url"}])
+
+    def test_positive_entry_expires(self):
+        self.cache.add(QUERY, [{"link": "url"}], now=0)
+
+        self.assertIsNotNone(self.cache.get(QUERY, now=7 * DAY - 1))
+        self.assertIsNone(self.cache.get(QUERY, now=7 * DAY))
+
+    def test_negative_entry_backoff(self):
+        self.cache.add(QUERY, [], now=0)
+        self.assertEqual(self.cache.get(QUERY, now=DAY - 1), [])
+        self.assertIsNone(self.cache.get(QUERY, now=DAY))
+
+        # Still empty after expiry: TTL doubles
+        self.cache.add(QUERY, [], now=DAY)
+        self.assertEqual(self.cache.get(QUERY, now=3 * DAY - 1), [])
+        self.assertIsNone(self.cache.get(QUERY, now=3 * DAY))
+
+        # Results found: back to the positive TTL, backoff reset
+        self.cache.add(QUERY, [{"link": "url"}], now=3 * DAY)
+        self.cache.add(QUERY, [], now=10 * DAY)
+        self.assertIsNone(self.cache.get(QUERY, now=11 * DAY))
+
+    def test_negative_backoff_is_capped(self):
+        for _ in range(10):
+            self.cache.add(QUERY, [], now=0)
+
+        self.assertIsNone(self.cache.get(QUERY, now=30 * DAY))
+
+    def test_persisted_on_save(self):
+        self.cache.add(QUERY, [{"link": "url"}])
+        self.assertNotIn(QUERY, SearchCache(self.tmp_dir.name, "search_results"))
+
+        self.cache.save()
+        reloaded = SearchCache(self.tmp_dir.name, "search_results")
+
+        self.assertIn(QUERY, reloaded)
+
+
+if __name__ == "__main__":
+    unittest.main()
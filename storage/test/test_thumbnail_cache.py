@@ -0,0 +1,37 @@
+import os
+import tempfile
+import time
+import unittest
+
+from storage.thumbnail_cache import ThumbnailCache
+
+
+class TestThumbnailCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.cache = ThumbnailCache(self.tmp_dir.name, max_age_days=7)
+
+    def test_hashed_thumbnails_are_pruned_on_save(self):
+        self.cache.add_thumbnail("a", b"a")
+        self.cache.add_thumbnail("b", b"b")
+        self.cache.add_hash("a", 1)
+
+        self.cache.save()
+
+        self.assertIsNone(self.cache.get_thumbnail("a"))
+        self.assertEqual(self.cache.get_thumbnail("b"), b"b")
+        self.assertEqual(ThumbnailCache(self.tmp_dir.name).get_hash("a"), 1)
+
+    def test_old_thumbnails_are_pruned_on_save(self):
+        self.cache.add_thumbnail("old", b"old")
+        old = time.time() - 8 * 86400
+        os.utime(self.cache.get_thumbnail_path("old"), (old, old))
+
+        self.cache.save()
+
+        self.assertIsNone(self.cache.get_thumbnail("old"))
+
+
+if __name__ == "__main__":
+    unittest.main()
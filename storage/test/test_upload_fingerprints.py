@@ -0,0 +1,39 @@
+import tempfile
+import unittest
+
+from storage.upload_fingerprints import UploadFingerprints
+
+
+class TestUploadFingerprints(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.fingerprints = UploadFingerprints(self.tmpdir.name)
+
+    def test_unknown_movie_or_type(self):
+        self.assertIsNone(self.fingerprints.get(1, "poster"))
+        self.fingerprints.set(1, "logo", self.make("logo"))
+        self.assertIsNone(self.fingerprints.get(1, "poster"))
+
+    def test_saved_on_save(self):
+        self.fingerprints.set(1, "poster", self.make("poster"))
+        self.fingerprints.set(1, "logo", self.make("logo"))
+        self.assertIsNone(UploadFingerprints(self.tmpdir.name).get(1, "poster"))
+
+        self.fingerprints.save()
+        reloaded = UploadFingerprints(self.tmpdir.name)
+        self.assertEqual(reloaded.get(1, "poster"), self.make("poster"))
+        self.assertEqual(reloaded.get(1, "logo"), self.make("logo"))
+
+    @staticmethod
+    def make(artwork_type: str) -> dict:
+        return {
+            "url": f"https://example.com/{artwork_type}.jpg",
+            "sha1": "abc",
+            "size": 3,
+            "key": f"/library/metadata/1/file?url=upload://{artwork_type}s/abc",
+        }
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+import tempfile
+import unittest
+
+from storage.upload_outbox import UploadOutbox
+
+MOVIE = {"plex_movie_id": 1, "title": "Test Movie"}
+
+
+def make_image(name: str) -> dict:
+    return {"url": f"https://example.com/{name}.jpg", "country": "us"}
+
+
+class TestUploadOutbox(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmpdir.cleanup)
+        self.outbox = UploadOutbox(
+            self.tmpdir.name,
+            retry_delay_seconds=10,
+            max_retry_delay_seconds=25,
+            max_attempts=3,
+        )
+
+    def test_jobs_are_due_after_delay_and_saved(self):
+        self.outbox.add(MOVIE, "poster", make_image("a"), now=100)
+
+        self.assertEqual(self.outbox.get_due(now=109), [])
+        reloaded = UploadOutbox(self.tmpdir.name)
+        [job] = reloaded.get_due(now=110)
+        self.assertEqual(job["image"], make_image("a"))
+        self.assertEqual(job["attempts"], 1)
+
+    def test_backoff_doubles_up_to_max_then_drops(self):
+        self.outbox.add(MOVIE, "poster", make_image("a"), now=0)
+
+        [job] = self.outbox.get_due(now=10)
+        self.assertTrue(self.outbox.reschedule(job, now=10))
+        self.assertEqual(self.outbox.get_due(now=29), [])
+
+        [job] = self.outbox.get_due(now=30)
+        self.assertTrue(self.outbox.reschedule(job, now=30))
+        # 40s capped at 25s
+        self.assertEqual(len(self.outbox.get_due(now=55)), 1)
+
+        [job] = self.outbox.get_due(now=55)
+        self.assertFalse(self.outbox.reschedule(job, now=55))
+        self.assertEqual(len(self.outbox), 0)
+
+    def test_newer_job_replaces_older(self):
+        self.outbox.add(MOVIE, "poster", make_image("a"), now=0)
+        [old_job] = self.outbox.get_due(now=10)
+        self.outbox.add(MOVIE, "poster", make_image("b"), now=0)
+
+        self.outbox.remove(old_job)
+        self.assertFalse(self.outbox.reschedule(old_job, now=10))
+
+        [job] = self.outbox.get_due(now=10)
+        self.assertEqual(job["image"], make_image("b"))
+        self.assertEqual(job["attempts"], 1)
+
+    def test_movie_artworks_are_not_queued(self):
+        movie = {**MOVIE, "artworks": {"poster": make_image("old")}}
+        self.outbox.add(movie, "poster", make_image("a"), now=0)
+
+        [job] = self.outbox.get_due(now=10)
+        self.assertEqual(job["movie"], MOVIE)
+
+    def test_discard(self):
+        self.outbox.add(MOVIE, "poster", make_image("a"), now=0)
+        self.outbox.add(MOVIE, "logo", make_image("b"), now=0)
+
+        self.outbox.discard(1, "poster")
+
+        self.assertEqual(
+            [job["artwork_type"] for job in self.outbox.get_due(now=10)], ["logo"]
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from utils.file_utils import load_json_file, save_json_file
+
+
+class ThumbnailCache:
+    """
+    Thumbnails and perceptual hashes of images, keyed by image URL (or Plex
+    image key). Thumbnails are files in `path/dirname`, hashes are stored
+    as hex strings in `path/dirname.json` by save(). A thumbnail is only kept
+    until its hash is saved, or `max_age_days` when it could not be hashed.
+    """
+
+    def __init__(
+        self, path: str, dirname: str = "thumbnails", max_age_days: int = 30
+    ) -> None:
+        self.directory = Path(path) / dirname
+        self.max_age_days = max_age_days
+        self.filepath = str(Path(path) / f"{dirname}.json")
+        self.hashes: dict[str, str] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        if Path(self.filepath).exists():
+            self.hashes = load_json_file(self.filepath)
+        else:
+            self.hashes = {}
+
+    def get_hash(self, url: str) -> int | None:
+        value = self.hashes.get(url)
+        return int(value, 16) if value is not None else None
+
+    def add_hash(self, url: str, value: int) -> None:
+        with self._lock:
+            self.hashes[url] = f"{value:016x}"
+
+    def save(self) -> None:
+        with self._lock:
+            save_json_file(self.filepath, self.hashes)
+            hashed = {self.get_thumbnail_path(url).name for url in self.hashes}
+        self.prune(hashed)
+
+    def prune(self, hashed: set[str]) -> None:
+        """Delete the thumbnails in `hashed` and those older than `max_age_days`."""
+        if not self.directory.exists():
+            return
+
+        oldest = time.time() - self.max_age_days * 86400
+        for filepath in self.directory.iterdir():
+            if filepath.name in hashed or filepath.stat().st_mtime < oldest:
+                filepath.unlink(missing_ok=True)
+
+    def get_thumbnail(self, url: str) -> bytes | None:
+        filepath = self.get_thumbnail_path(url)
+        return filepath.read_bytes() if filepath.exists() else None
+
+    def add_thumbnail(self, url: str, content: bytes) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.get_thumbnail_path(url).write_bytes(content)
+
+    def get_thumbnail_path(self, url: str) -> Path:
+        return self.directory / hashlib.sha1(url.encode()).hexdigest()
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+from typing import TypedDict
+
+from storage.cache import Cache
+
+
+class Fingerprint(TypedDict):
+    url: str
+    sha1: str | None
+    size: int | None
+    key: str
+
+
+class UploadFingerprints:
+    """
+    Last artwork uploaded per Plex movie and artwork type: its source URL, the
+    SHA-1 and size of its content when known, and the key Plex gave the upload.
+    Changes are kept in memory until save(), called at the end of a run.
+    """
+
+    def __init__(self, path: str, filename: str = "upload_fingerprints") -> None:
+        self.cache = Cache(path, filename)
+        self._lock = threading.Lock()
+
+    def get(self, movie_id: int, artwork_type: str) -> Fingerprint | None:
+        return (self.cache.get(movie_id) or {}).get(artwork_type)
+
+    def set(self, movie_id: int, artwork_type: str, fingerprint: Fingerprint) -> None:
+        with self._lock:
+            fingerprints = self.cache.get(movie_id) or {}
+            fingerprints[artwork_type] = fingerprint
+            self.cache.add(movie_id, fingerprints)
+
+    def save(self) -> None:
+        with self._lock:
+            self.cache.save()
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from utils.file_utils import load_json_file, save_json_file
+
+if TYPE_CHECKING:
+    from models.artworks import Image
+    from models.movie import Movie
+
+
+class OutboxJob(TypedDict):
+    movie: Movie
+    artwork_type: str
+    image: Image
+    attempts: int
+    next_attempt_at: float
+
+
+class UploadOutbox:
+    """
+    Disk-backed queue of artwork uploads that failed, one job per movie and
+    artwork type, so they are retried without searching the artworks again.
+
+    A job failing again waits `retry_delay_seconds`, doubled after every
+    attempt up to `max_retry_delay_seconds`, and is dropped after
+    `max_attempts` attempts, for its movie to be searched again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        filename: str = "upload_outbox",
+        retry_delay_seconds: int = 300,
+        max_retry_delay_seconds: int = 6 * 3600,
+        max_attempts: int = 10,
+    ) -> None:
+        self.filepath = str(Path(path) / f"{filename}.json")
+        self.retry_delay_seconds = retry_delay_seconds
+        self.max_retry_delay_seconds = max_retry_delay_seconds
+        self.max_attempts = max_attempts
+        self.jobs: dict[str, OutboxJob] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    @staticmethod
+    def get_key(movie_id: int, artwork_type: str) -> str:
+        return f"{movie_id}:{artwork_type}"
+
+    @classmethod
+    def get_job_key(cls, job: OutboxJob) -> str:
+        return cls.get_key(job["movie"]["plex_movie_id"], job["artwork_type"])
+
+    def add(
+        self,
+        movie: Movie,
+        artwork_type: str,
+        image: Image,
+        now: float | None = None,
+    ) -> None:
+        """Queue a failed upload, replacing any older job of the same artwork."""
+        now = time.time() if now is None else now
+        key = self.get_key(movie["plex_movie_id"], artwork_type)
+        with self._lock:
+            # Without its artworks: the caller keeps updating those
+            movie = {k: v for k, v in movie.items() if k != "artworks"}
+            self.jobs[key] = {
+                "movie": movie,
+                "artwork_type": artwork_type,
+                "image": image,
+                "attempts": 1,
+                "next_attempt_at": now + self.retry_delay_seconds,
+            }
+            self.save()
+
+    def discard(self, movie_id: int, artwork_type: str) -> None:
+        """Drop the job of an artwork, e.g. once a newer one was uploaded."""
+        key = self.get_key(movie_id, artwork_type)
+        with self._lock:
+            if self.jobs.pop(key, None) is not None:
+                self.save()
+
+    def remove(self, job: OutboxJob) -> None:
+        """Drop a job once delivered, unless a newer one replaced it meanwhile."""
+        key = self.get_job_key(job)
+        with self._lock:
+            if self.is_current(key, job):
+                del self.jobs[key]
+                self.save()
+
+    def get_due(self, now: float | None = None) -> list[OutboxJob]:
+        """Jobs whose next attempt is due, oldest schedule first."""
+        now = time.time() if now is None else now
+        with self._lock:
+            due = [
+                job.copy()
+                for job in self.jobs.values()
+                if job["next_attempt_at"] <= now
+            ]
+        return sorted(due, key=lambda job: job["next_attempt_at"])
+
+    def reschedule(self, job: OutboxJob, now: float | None = None) -> bool:
+        """Back off a job that failed again. Returns False if it is no longer queued."""
+        now = time.time() if now is None else now
+        key = self.get_job_key(job)
+        with self._lock:
+            if not self.is_current(key, job):
+                return False
+
+            current = self.jobs[key]
+            if current["attempts"] >= self.max_attempts:
+                del self.jobs[key]
+                self.save()
+                return False
+
+            delay = self.retry_delay_seconds * 2 ** current["attempts"]
+            current["attempts"] += 1
+            current["next_attempt_at"] = now + min(delay, self.max_retry_delay_seconds)
+            self.save()
+            return True
+
+    def is_current(self, key: str, job: OutboxJob) -> bool:
+        current = self.jobs.get(key)
+        return current is not None and current["image"] == job["image"]
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def load(self) -> None:
+        if Path(self.filepath).exists():
+            self.jobs = load_json_file(self.filepath)
+        else:
+            self.jobs = {}
+
+    def save(self) -> None:
+        save_json_file(self.filepath, self.jobs)
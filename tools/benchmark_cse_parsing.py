@@ -0,0 +1,96 @@
+import json
+import time
+from pathlib import Path
+
+from client.google.parser import get_cse_url, parse_item_from_cse, slim_cse_item
+from client.google.scoring import Scorer
+
+DEFAULT_RESPONSES_PATH = (
+    Path(__file__).parent.parent / "client/google/test/fixtures/cse_responses_full.json"
+)
+
+
+def load_responses(path: str | Path) -> list[dict]:
+    """Recorded raw CSE responses: a JSON list of {"target": {...}, "response": {...}}."""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [entry["response"] for entry in data]
+
+
+def get_payload_sizes(responses: list[dict]) -> tuple[int, int]:
+    """Bytes of the full responses and of the same results with `fields=`."""
+    full = sum(len(json.dumps(response)) for response in responses)
+    lean = sum(
+        len(json.dumps({"items": [slim_cse_item(item) for item in response["items"]]}))
+        for response in responses
+    )
+    return full, lean
+
+
+def parse_eager(scorer: Scorer, payload: str) -> list:
+    items = json.loads(payload).get("items") or []
+    return [
+        item
+        for item in map(parse_item_from_cse, items)
+        if scorer.is_candidate_url(item.url)
+    ]
+
+
+def parse_lazy(scorer: Scorer, payload: str) -> list:
+    items = json.loads(payload).get("items") or []
+    return [
+        parse_item_from_cse(raw)
+        for raw in items
+        if scorer.is_candidate_url(get_cse_url(raw))
+    ]
+
+
+def benchmark(responses: list[dict], rounds: int) -> dict[str, float]:
+    """
+    Items per second, JSON decoding included: full responses parsed eagerly
+    (before) against lean responses gated on their URL first (after).
+    """
+    scorer = Scorer()
+    full_payloads = [json.dumps(response) for response in responses]
+    lean_payloads = [
+        json.dumps({"items": [slim_cse_item(item) for item in response["items"]]})
+        for response in responses
+    ]
+    eager = [item for p in full_payloads for item in parse_eager(scorer, p)]
+    lazy = [item for p in lean_payloads for item in parse_lazy(scorer, p)]
+    if eager != lazy:
+        raise AssertionError("Lean lazy parsing differs from full eager parsing")
+
+    item_count = sum(len(response["items"]) for response in responses) * rounds
+    throughput = {}
+    for name, parse, payloads in (
+        ("eager_full", parse_eager, full_payloads),
+        ("lazy_lean", parse_lazy, lean_payloads),
+    ):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for payload in payloads:
+                parse(scorer, payload)
+        throughput[name] = item_count / (time.perf_counter() - start)
+    return throughput
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Measure CSE payload and parse time.")
+    parser.add_argument(
+        "--responses-path",
+        type=str,
+        default=str(DEFAULT_RESPONSES_PATH),
+        help="Recorded raw CSE responses (JSON)",
+    )
+    parser.add_argument("--rounds", type=int, default=500, help="Passes over the items")
+    args = parser.parse_args()
+
+    responses = load_responses(args.responses_path)
+    full, lean = get_payload_sizes(responses)
+    print(
+        f"payload: {full:,} bytes full, {lean:,} bytes with fields= ({lean / full:.0%})"
+    )
+    for name, items_per_s in benchmark(responses, args.rounds).items():
+        print(f"{name:>10}: {items_per_s:,.0f} items/s")
@@ -0,0 +1,97 @@
+import ast
+import time
+from pathlib import Path
+
+from client.itunes.match import compute_match_score, get_matching_movie
+from client.itunes.parser import get_attributes
+from tools.benchmark_similarity import MATCH_CORPUS_PATH
+
+
+def load_match_cases(
+    path: str | Path = MATCH_CORPUS_PATH,
+) -> list[tuple[list[dict], str, list[str], int]]:
+    """(candidates, title, directors, year) of every case in the test corpus."""
+    cases = []
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    for function in ast.walk(tree):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+
+        values = {}
+        for statement in function.body:
+            if isinstance(statement, ast.Assign) and isinstance(
+                statement.targets[0], ast.Name
+            ):
+                try:
+                    values[statement.targets[0].id] = ast.literal_eval(statement.value)
+                except ValueError:
+                    continue
+
+        if {"candidates", "title", "year"} <= values.keys():
+            cases.append(
+                (
+                    values["candidates"],
+                    values["title"],
+                    values.get("directors", []),
+                    values["year"],
+                )
+            )
+    return cases
+
+
+def get_matching_movie_loop(
+    candidates: list[dict],
+    target_title: str,
+    target_directors: list[str],
+    target_year: int,
+) -> dict:
+    """Previous implementation: every candidate scored on its own."""
+    best_match = {}
+    best_score = 0.0
+
+    for candidate in candidates:
+        title, director, year = get_attributes(candidate)
+
+        score = compute_match_score(
+            title, director, year, target_title, target_directors, target_year
+        )
+        if score > best_score:
+            best_score = score
+            best_match = candidate
+
+    return best_match if best_score > 1.0 else {}
+
+
+def benchmark(
+    cases: list[tuple[list[dict], str, list[str], int]], rounds: int
+) -> dict[str, float]:
+    """Candidates per second for the per-candidate loop and the batched matcher."""
+    for case in cases:
+        if get_matching_movie_loop(*case) != get_matching_movie(*case):
+            raise AssertionError(f"Batched matcher differs on {case[1]!r}")
+
+    candidate_count = sum(len(case[0]) for case in cases) * rounds
+    throughput = {}
+    for name, match in (
+        ("loop", get_matching_movie_loop),
+        ("batched", get_matching_movie),
+    ):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for case in cases:
+                match(*case)
+        throughput[name] = candidate_count / (time.perf_counter() - start)
+    return throughput
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark iTunes candidate matching.")
+    parser.add_argument("--rounds", type=int, default=200, help="Passes over the cases")
+    args = parser.parse_args()
+
+    cases = load_match_cases()
+    print(f"{len(cases)} cases, {sum(len(case[0]) for case in cases)} candidates")
+    for name, per_s in benchmark(cases, args.rounds).items():
+        print(f"{name:>8}: {per_s:,.0f} candidates/s")
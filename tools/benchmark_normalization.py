@@ -0,0 +1,93 @@
+import html
+import re
+import time
+import unicodedata
+from string import punctuation
+
+from client.google.utils import norm_text
+from tools.benchmark_scoring import DEFAULT_RESULTS_PATH, load_result_sets
+from tools.benchmark_similarity import MATCH_CORPUS_PATH
+from utils import normalization
+from utils.string_utils import are_match, is_included
+
+# --- previous implementations, kept as the reference ---
+
+
+def legacy_normalize(s: str) -> str:
+    s = "".join(
+        c for c in unicodedata.normalize("NFD", s) if unicodedata.category(c) != "Mn"
+    )
+    s = (
+        s.translate(str.maketrans("", "", punctuation))
+        .replace("’", "")
+        .replace("'", "")
+        .replace("`", "")
+        .replace(" ", "")
+    )
+    return s.lower().strip()
+
+
+def legacy_norm_text(s: str) -> str:
+    s = html.unescape((s or "").strip().lower())
+    s = "".join(
+        ch for ch in unicodedata.normalize("NFKD", s) if not unicodedata.combining(ch)
+    )
+    s = re.sub(r"[^\w\s]", " ", s, flags=re.UNICODE)
+    s = re.sub(r"\s+", " ", s).strip()
+    return s
+
+
+def legacy_are_match(s1: str, s2: str) -> bool:
+    return legacy_normalize(s1) == legacy_normalize(s2)
+
+
+def legacy_is_included(s1: str, s2: str) -> bool:
+    return legacy_normalize(s1) in legacy_normalize(s2)
+
+
+def load_texts() -> list[str]:
+    """Titles and directors from the iTunes match corpus and recorded CSE results."""
+    texts = re.findall(
+        r'"(?:trackName|artistName)": "([^"]+)"',
+        MATCH_CORPUS_PATH.read_text(encoding="utf-8"),
+    )
+    for target, items in load_result_sets(DEFAULT_RESULTS_PATH):
+        texts += [target.title, *target.directors]
+        texts += [
+            text for item in items for text in (item.title, item.director) if text
+        ]
+    return texts
+
+
+def benchmark(texts: list[str], rounds: int) -> dict[str, tuple[float, float]]:
+    """(legacy, current) calls per second for each function."""
+    pairs = list(zip(texts, texts[1:] + texts[:1]))
+    cases = {
+        "are_match": (legacy_are_match, are_match, pairs),
+        "is_included": (legacy_is_included, is_included, pairs),
+        "norm_text": (legacy_norm_text, norm_text, [(text,) for text in texts]),
+    }
+
+    results = {}
+    for name, (legacy, current, args_list) in cases.items():
+        timings = []
+        for func in (legacy, current):
+            normalization.clear_caches()
+            start = time.perf_counter()
+            for _ in range(rounds):
+                for args in args_list:
+                    func(*args)
+            timings.append(len(args_list) * rounds / (time.perf_counter() - start))
+        results[name] = (timings[0], timings[1])
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark text normalization.")
+    parser.add_argument("--rounds", type=int, default=100, help="Passes over the texts")
+    args = parser.parse_args()
+
+    for name, (legacy, current) in benchmark(load_texts(), args.rounds).items():
+        print(f"{name:>12}: {legacy:,.0f} -> {current:,.0f} calls/s")
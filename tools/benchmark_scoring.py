@@ -0,0 +1,87 @@
+import json
+import time
+from pathlib import Path
+
+from client.google.parser import ItemView, parse_item_from_cse
+from client.google.scoring import Scorer
+from models.target import Target
+
+DEFAULT_RESULTS_PATH = (
+    Path(__file__).parent.parent / "client/google/test/fixtures/cse_results.json"
+)
+
+
+def load_result_sets(path: str | Path) -> list[tuple[Target, list[ItemView]]]:
+    """
+    Load recorded CSE result sets: a JSON list of {"target": {...}, "items": [...]}
+    where items are raw CSE items. Items that would make the scorer fetch an
+    Apple TV page (US targets, Spanish results) are dropped to stay offline.
+    """
+    result_sets = []
+    for result_set in json.loads(Path(path).read_text(encoding="utf-8")):
+        target = Target(**result_set["target"])
+        items = [
+            item
+            for item in map(parse_item_from_cse, result_set["items"])
+            if not (target.country == "us" and item.lang == "es")
+        ]
+        result_sets.append((target, items))
+    return result_sets
+
+
+def score_per_item(
+    scorer: Scorer, result_sets: list[tuple[Target, list[ItemView]]]
+) -> list[float | None]:
+    return [
+        scorer.compute(item, target)
+        for target, items in result_sets
+        for item in items
+        if scorer.is_candidate_url(item.url)
+    ]
+
+
+def score_batched(
+    scorer: Scorer, result_sets: list[tuple[Target, list[ItemView]]]
+) -> list[float | None]:
+    scores = []
+    for target, items in result_sets:
+        candidates = (item for item in items if scorer.is_candidate_url(item.url))
+        prepared = scorer.prepare(target)
+        scores.extend(score for _, score in scorer.score_items(candidates, prepared))
+    return scores
+
+
+def benchmark(
+    result_sets: list[tuple[Target, list[ItemView]]], rounds: int
+) -> dict[str, float]:
+    """Return items scored per second for each scoring path."""
+    scorer = Scorer()
+    if score_per_item(scorer, result_sets) != score_batched(scorer, result_sets):
+        raise AssertionError("Batched scores differ from per-item scores")
+
+    item_count = sum(len(items) for _, items in result_sets) * rounds
+    throughput = {}
+    for name, score in (("per_item", score_per_item), ("batched", score_batched)):
+        start = time.perf_counter()
+        for _ in range(rounds):
+            score(scorer, result_sets)
+        throughput[name] = item_count / (time.perf_counter() - start)
+    return throughput
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark Google CSE item scoring.")
+    parser.add_argument(
+        "--results-path",
+        type=str,
+        default=str(DEFAULT_RESULTS_PATH),
+        help="Recorded CSE result sets (JSON)",
+    )
+    parser.add_argument("--rounds", type=int, default=200, help="Passes over the sets")
+    args = parser.parse_args()
+
+    result_sets = load_result_sets(args.results_path)
+    for name, items_per_s in benchmark(result_sets, args.rounds).items():
+        print(f"{name:>10}: {items_per_s:,.0f} items/s")
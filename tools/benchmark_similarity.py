@@ -0,0 +1,107 @@
+import ast
+import time
+from pathlib import Path
+
+from client.google.utils import norm_text
+from tools.benchmark_scoring import DEFAULT_RESULTS_PATH, load_result_sets
+from utils import similarity
+from utils.string_utils import normalize
+
+MATCH_CORPUS_PATH = Path(__file__).parent.parent / "client/itunes/test/test_match.py"
+THRESHOLDS = (0.5, 0.75, 0.9)
+
+
+def load_match_pairs(path: str | Path = MATCH_CORPUS_PATH) -> list[tuple[str, str]]:
+    """
+    Collect the (target, candidate) title and director pairs compared by
+    client.itunes.match from the literal corpus in its test module.
+    """
+    pairs = []
+    tree = ast.parse(Path(path).read_text(encoding="utf-8"))
+    for function in ast.walk(tree):
+        if not isinstance(function, ast.FunctionDef):
+            continue
+
+        values = {}
+        for statement in function.body:
+            if isinstance(statement, ast.Assign) and isinstance(
+                statement.targets[0], ast.Name
+            ):
+                try:
+                    values[statement.targets[0].id] = ast.literal_eval(statement.value)
+                except ValueError:
+                    continue
+
+        directors = values.get("directors", [])
+        for candidate in values.get("candidates", []):
+            pairs.append((values["title"], candidate["trackName"]))
+            for director in directors + ["".join(directors)]:
+                pairs.append((director, candidate["artistName"]))
+
+    return [(normalize(s1), normalize(s2)) for s1, s2 in pairs]
+
+
+def load_scoring_pairs(
+    path: str | Path = DEFAULT_RESULTS_PATH,
+) -> list[tuple[str, str]]:
+    pairs = []
+    for target, items in load_result_sets(path):
+        for item in items:
+            pairs.append((norm_text(target.title), norm_text(item.title or "")))
+            for director in target.directors:
+                pairs.append((norm_text(director), norm_text(item.director or "")))
+    return pairs
+
+
+def threshold_disagreements(
+    pairs: list[tuple[str, str]], engine: similarity.SimilarityFunc
+) -> list[tuple[str, str, float]]:
+    """Pairs where `engine` lands on the other side of a threshold than difflib."""
+    disagreements = []
+    for s1, s2 in pairs:
+        reference, value = similarity.difflib_ratio(s1, s2), engine(s1, s2)
+        for threshold in THRESHOLDS:
+            if (reference >= threshold) != (value >= threshold):
+                disagreements.append((s1, s2, threshold))
+    return disagreements
+
+
+def benchmark(
+    pairs: list[tuple[str, str]],
+    engines: dict[str, similarity.SimilarityFunc],
+    rounds: int,
+) -> dict[str, float]:
+    """Return comparisons per second for each engine."""
+    throughput = {}
+    for name, engine in engines.items():
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for s1, s2 in pairs:
+                engine(s1, s2)
+        throughput[name] = len(pairs) * rounds / (time.perf_counter() - start)
+    return throughput
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark similarity engines.")
+    parser.add_argument("--rounds", type=int, default=50, help="Passes over the pairs")
+    args = parser.parse_args()
+
+    engines = {
+        "difflib": similarity.difflib_ratio,
+        "bit_parallel": similarity._bit_parallel_indel_ratio,
+    }
+    if similarity.Indel is not None:
+        engines["rapidfuzz"] = similarity.Indel.normalized_similarity
+
+    pairs = load_match_pairs() + load_scoring_pairs()
+    for name, engine in engines.items():
+        disagreements = threshold_disagreements(pairs, engine)
+        print(f"{name:>12}: {len(disagreements)} threshold disagreements")
+        for s1, s2, threshold in disagreements:
+            print(f"{'':>14}{threshold}: {s1!r} vs {s2!r}")
+
+    for name, per_s in benchmark(pairs, engines, args.rounds).items():
+        print(f"{name:>12}: {per_s:,.0f} comparisons/s")
@@ -0,0 +1,38 @@
+import logging
+
+from client.apple_tv.sitemap import iter_sitemap_urls
+from client.apple_tv.url_index import UrlIndex
+
+logger = logging.getLogger(__name__)
+
+
+def build_url_index(cache_path: str, sitemap_paths: list[str]) -> UrlIndex:
+    """Merge the title URLs of sitemap files into the index kept in cache_path."""
+    url_index = UrlIndex(cache_path, "apple_tv_urls")
+    for sitemap_path in sitemap_paths:
+        added = url_index.add_urls(iter_sitemap_urls(sitemap_path))
+        logger.info(f"{sitemap_path}: {added} new URL(s)")
+    url_index.save()
+    logger.info(f"Apple TV URL index holds {len(url_index)} URL(s)")
+    return url_index
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from utils.logger import setup_logging
+
+    setup_logging()
+
+    parser = argparse.ArgumentParser(
+        description="Build the Apple TV URL index from sitemap dumps."
+    )
+    parser.add_argument(
+        "--cache-path", type=str, required=True, help="cache.cache_path from config"
+    )
+    parser.add_argument(
+        "sitemaps", nargs="+", help="Sitemap files (.xml or .xml.gz) on disk"
+    )
+    args = parser.parse_args()
+
+    build_url_index(args.cache_path, args.sitemaps)
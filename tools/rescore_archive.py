@@ -0,0 +1,104 @@
+import logging
+
+from client.google.query_planner import QueryPlanner
+from client.google.scoring import Scorer
+from client.google.search_engine import SearchEngine
+from models.target import Target
+from storage.search_archive import SearchArchive
+from storage.search_cache import SearchCache
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayPlanner(QueryPlanner):
+    """Always tries every form in the default order and learns nothing."""
+
+    def plan(self, bucket: str, forms: list[tuple[str, str]]) -> list[tuple[str, str]]:
+        return forms
+
+    def record(
+        self, bucket: str, tried: list[str], accepted: str | None, call_count: int
+    ) -> None:
+        return None
+
+
+class ReplaySearchEngine(SearchEngine):
+    """SearchEngine answering every CSE call from archived raw results."""
+
+    def __init__(self, responses: dict[str, list[dict]], scorer: Scorer) -> None:
+        super().__init__("offline", "offline", scorer=scorer, planner=ReplayPlanner())
+        self.responses = responses
+        self.missing_queries: list[str] = []
+
+    def _fetch(self, query: str, num: int = 10) -> list[dict] | None:
+        items = self.responses.get(SearchCache.normalize_query(query))
+        if items is None:
+            self.missing_queries.append(query)
+        return items
+
+
+def rescore(
+    archive: SearchArchive,
+    scorer: Scorer,
+    since: str | None = None,
+    search_cache: SearchCache | None = None,
+) -> list[tuple[Target, str | None, str | None]]:
+    """
+    Replay the last recorded query of every target through the current scoring
+    and return (target, recorded url, new url) for each outcome that changes.
+    Queries answered from the search cache before archiving started are read
+    from `search_cache` when given.
+    """
+    responses = archive.get_latest_responses(since)
+    if search_cache is not None:
+        for query, entry in search_cache.data.items():
+            responses.setdefault(query, entry["items"])
+
+    engine = ReplaySearchEngine(responses, scorer)
+    changes = []
+    for outcome in archive.get_latest_outcomes(since).values():
+        target = Target(**outcome["target"])
+        url, _ = engine.query(target)
+        if url != outcome["url"]:
+            changes.append((target, outcome["url"], url))
+
+    if engine.missing_queries:
+        logger.warning(
+            f"{len(engine.missing_queries)} archived queries without results "
+            "(replayed as failed calls)"
+        )
+    return changes
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from utils.logger import setup_logging
+
+    setup_logging()
+
+    parser = argparse.ArgumentParser(
+        description="Re-score archived CSE results with the current Scorer."
+    )
+    parser.add_argument(
+        "--cache-path", type=str, required=True, help="cache.cache_path from config"
+    )
+    parser.add_argument(
+        "--since", type=str, default=None, help="First archive day (YYYY-MM-DD)"
+    )
+    parser.add_argument(
+        "--title-threshold", type=float, default=0.75, help="Scorer title threshold"
+    )
+    args = parser.parse_args()
+
+    archive = SearchArchive(args.cache_path)
+    search_cache = SearchCache(args.cache_path, "search_results")
+    scorer = Scorer(title_threshold=args.title_threshold)
+
+    changes = rescore(archive, scorer, args.since, search_cache)
+    for target, old_url, new_url in changes:
+        print(
+            f"{target.title} ({target.year}, {target.country.upper()}): "
+            f"{old_url or 'no match'} -> {new_url or 'no match'}"
+        )
+    print(f"{len(changes)} outcome(s) would change")
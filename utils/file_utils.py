@@ -1,4 +1,5 @@
 import json
+import os
 
 
 def load_json_file(file_path: str) -> dict:
@@ -7,6 +8,12 @@ def load_json_file(file_path: str) -> dict:
         return data
 
 
-def save_json_file(file_path: str, data: dict) -> None:
-    with open(file_path, "w") as file:
-        json.dump(data, file, indent=4)
+def save_json_file(file_path: str, data: dict, compact: bool = False) -> None:
+    # Written next to the target then swapped in, so a crash never truncates it
+    tmp_path = f"{file_path}.tmp"
+    with open(tmp_path, "w") as file:
+        if compact:
+            json.dump(data, file, separators=(",", ":"))
+        else:
+            json.dump(data, file, indent=4)
+    os.replace(tmp_path, file_path)
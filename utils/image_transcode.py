@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+try:
+    from PIL import Image, UnidentifiedImageError
+except ImportError:  # optional dependency, images are uploaded as is without it
+    Image = None
+
+
+def is_available() -> bool:
+    return Image is not None
+
+
+def fit_size(
+    width: int, height: int, max_width: int, max_height: int
+) -> tuple[int, int]:
+    """Largest size with the same aspect ratio within max_width x max_height."""
+    scale = min(1.0, max_width / width, max_height / height)
+    return max(1, round(width * scale)), max(1, round(height * scale))
+
+
+def transcode(
+    content: bytes, max_width: int, max_height: int, quality: int
+) -> bytes | None:
+    """
+    Image shrunk to fit max_width x max_height and recompressed: JPEG at
+    `quality`, or optimized PNG for images with transparency (logos). None
+    when Pillow is not installed or the content is not an image.
+    """
+    if Image is None:
+        return None
+
+    try:
+        with Image.open(BytesIO(content)) as image:
+            size = fit_size(image.width, image.height, max_width, max_height)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or (
+                image.mode == "P" and "transparency" in image.info
+            )
+            image = image.convert("RGBA" if has_alpha else "RGB")
+            if size != image.size:
+                image = image.resize(size, Image.Resampling.LANCZOS)
+
+            buffer = BytesIO()
+            if has_alpha:
+                image.save(buffer, "PNG", optimize=True)
+            else:
+                image.save(buffer, "JPEG", quality=quality, optimize=True)
+            return buffer.getvalue()
+    except (UnidentifiedImageError, OSError):
+        return None
@@ -0,0 +1,61 @@
+import struct
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# JPEG start-of-frame markers carrying the image dimensions
+JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7}
+JPEG_SOF_MARKERS |= {0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def read_image_format(data: bytes) -> str | None:
+    """Format of a JPEG or PNG image from its signature, None for anything else."""
+    if data.startswith(PNG_SIGNATURE):
+        return "png"
+    if data.startswith(b"\xff\xd8"):
+        return "jpg"
+    return None
+
+
+def read_image_header(data: bytes) -> tuple[str, int, int] | None:
+    """
+    Read format, width and height from the first bytes of a JPEG or PNG image.
+    Returns None if the header is unknown or truncated.
+    """
+    image_format = read_image_format(data)
+    if image_format == "png":
+        return read_png_header(data)
+    if image_format == "jpg":
+        return read_jpeg_header(data)
+    return None
+
+
+def read_png_header(data: bytes) -> tuple[str, int, int] | None:
+    # Signature (8) + IHDR length (4) + "IHDR" (4) + width (4) + height (4)
+    if len(data) < 24 or data[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", data[16:24])
+    return "png", width, height
+
+
+def read_jpeg_header(data: bytes) -> tuple[str, int, int] | None:
+    index = 2
+    while index + 4 <= len(data):
+        if data[index] != 0xFF:
+            return None
+        marker = data[index + 1]
+        if marker == 0xFF:  # Fill byte
+            index += 1
+            continue
+        if marker in (0x01, *range(0xD0, 0xD9)):  # Markers without payload
+            index += 2
+            continue
+
+        (length,) = struct.unpack(">H", data[index + 2 : index + 4])
+        if marker in JPEG_SOF_MARKERS:
+            if index + 9 > len(data):
+                return None
+            height, width = struct.unpack(">HH", data[index + 5 : index + 9])
+            return "jpg", width, height
+        index += 2 + length
+
+    return None
@@ -0,0 +1,58 @@
+import html
+import re
+import unicodedata
+from functools import lru_cache
+from string import punctuation
+
+# Matchers normalize the same few titles and directors thousands of times a run
+CACHE_SIZE = 8192
+
+# Deleted by compact(): ASCII punctuation, typographic apostrophe and spaces
+COMPACT_TABLE = str.maketrans("", "", punctuation + "’ ")
+
+NON_WORD_RE = re.compile(r"[^\w\s]", flags=re.UNICODE)
+WHITESPACE_RE = re.compile(r"\s+")
+
+
+def remove_accents(text: str) -> str:
+    """Drop nonspacing marks after NFD decomposition."""
+    if text.isascii():
+        return text
+    normalized = unicodedata.normalize("NFD", text)
+    return "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+
+
+def strip_accents(text: str) -> str:
+    """Drop combining characters after NFKD decomposition."""
+    if text.isascii():
+        return text
+    return "".join(
+        ch
+        for ch in unicodedata.normalize("NFKD", text)
+        if not unicodedata.combining(ch)
+    )
+
+
+def remove_punctuation(text: str) -> str:
+    """Remove punctuation and spaces."""
+    return text.translate(COMPACT_TABLE)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compact(text: str) -> str:
+    """Accent-free, lowercase form without punctuation or spaces, for equality checks."""
+    return remove_punctuation(remove_accents(text)).lower().strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def words(text: str) -> str:
+    """Accent-free, lowercase words separated by single spaces, for similarity."""
+    text = html.unescape(text.strip().lower())
+    text = strip_accents(text)
+    text = NON_WORD_RE.sub(" ", text)
+    return WHITESPACE_RE.sub(" ", text).strip()
+
+
+def clear_caches() -> None:
+    compact.cache_clear()
+    words.cache_clear()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from io import BytesIO
+
+try:
+    from PIL import Image, UnidentifiedImageError
+except ImportError:  # optional dependency, images cannot be decoded without it
+    Image = None
+
+# Bits per row and column of the difference hash: 8 x 8 = 64 bits
+HASH_SIZE = 8
+
+
+def is_available() -> bool:
+    return Image is not None
+
+
+def decode_grayscale(content: bytes, width: int, height: int) -> list[int] | None:
+    """
+    Pixels of an image, row by row, in grayscale and resized to width x height.
+    Transparent parts (logos) are laid over white. None when Pillow is not
+    installed or the content is not an image.
+    """
+    if Image is None:
+        return None
+
+    try:
+        with Image.open(BytesIO(content)) as image:
+            image = image.convert("RGBA")
+            background = Image.new("RGBA", image.size, "white")
+            image = Image.alpha_composite(background, image).convert("L")
+            image = image.resize((width, height), Image.Resampling.LANCZOS)
+            return list(image.getdata())
+    except (UnidentifiedImageError, OSError):
+        return None
+
+
+def dhash(pixels: list[int], size: int = HASH_SIZE) -> int:
+    """
+    Difference hash of `size` rows of `size + 1` grayscale pixels: one bit per
+    pair of horizontal neighbours, set when brightness increases.
+    """
+    width = size + 1
+    if len(pixels) != width * size:
+        raise ValueError(f"Expected {width * size} pixels, got {len(pixels)}")
+
+    value = 0
+    for row in range(size):
+        offset = row * width
+        for col in range(size):
+            left = pixels[offset + col]
+            right = pixels[offset + col + 1]
+            value = (value << 1) | (left < right)
+    return value
+
+
+def image_dhash(content: bytes, size: int = HASH_SIZE) -> int | None:
+    pixels = decode_grayscale(content, size + 1, size)
+    return dhash(pixels, size) if pixels is not None else None
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
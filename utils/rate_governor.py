@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from requests import Response
+
+logger = logging.getLogger(__name__)
+
+# Responses meaning the host wants fewer requests
+CONGESTION_STATUSES = {429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    """AIMD settings of one host. Rates are in requests per second."""
+
+    rate: float = 4.0
+    min_rate: float = 0.2
+    max_rate: float = 20.0
+    increase: float = 0.1
+    decrease: float = 0.5
+    # Slower responses are treated as congestion too
+    latency_target_s: float = 10.0
+
+
+DEFAULT_POLICIES = {
+    # Custom Search allows 100 queries per minute
+    "www.googleapis.com": HostPolicy(rate=1.5, max_rate=1.5, latency_target_s=5.0),
+    # Apple pages used to be fetched one per second
+    "tv.apple.com": HostPolicy(rate=1.0, max_rate=4.0, latency_target_s=5.0),
+    "itunes.apple.com": HostPolicy(rate=1.0, max_rate=2.0, latency_target_s=5.0),
+    "api.themoviedb.org": HostPolicy(rate=10.0, max_rate=40.0, latency_target_s=5.0),
+}
+
+# The Plex host depends on the config. Uploads send whole images and Plex
+# fetches the ones given by URL, so a slow response is not congestion there
+PLEX_POLICY = HostPolicy(rate=4.0, max_rate=20.0, latency_target_s=120.0)
+
+
+def parse_retry_after(value: str | None, now: datetime | None = None) -> float | None:
+    """Seconds to wait from a Retry-After header (delay-seconds or HTTP-date)."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = now or datetime.now(timezone.utc)
+    return max(0.0, (retry_at - now).total_seconds())
+
+
+def get_host(url: str) -> str:
+    return urlsplit(url).netloc or url
+
+
+@dataclass
+class Slot:
+    """Outcome of one governed request, filled in by the caller."""
+
+    status: int | None = None
+    retry_after: float | None = None
+
+    def observe(self, response: Response) -> None:
+        self.status = response.status_code
+        if self.status in CONGESTION_STATUSES:
+            self.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+
+class HostLimiter:
+    """
+    Paces the requests to one host at `rate` per second, adjusted by AIMD:
+    + `increase` after each healthy response, × `decrease` after a 429, a 5xx,
+    a failed request or a response slower than `latency_target_s`.
+    """
+
+    def __init__(self, policy: HostPolicy) -> None:
+        self.policy = policy
+        self.rate = policy.rate
+        self.next_slot = 0.0
+        self._lock = threading.Lock()
+
+        self.request_count = 0
+        self.congestion_count = 0
+
+    def acquire(self) -> None:
+        """Wait for the next free slot. Concurrent callers get consecutive slots."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + 1.0 / self.rate
+            self.request_count += 1
+
+        if slot > now:
+            time.sleep(slot - now)
+
+    def record(
+        self, status: int | None, latency_s: float, retry_after: float | None = None
+    ) -> None:
+        policy = self.policy
+        congested = (
+            status is None
+            or status in CONGESTION_STATUSES
+            or latency_s > policy.latency_target_s
+        )
+        with self._lock:
+            if congested:
+                self.rate = max(policy.min_rate, self.rate * policy.decrease)
+                self.congestion_count += 1
+            else:
+                self.rate = min(policy.max_rate, self.rate + policy.increase)
+
+            if retry_after:
+                self.next_slot = max(self.next_slot, time.monotonic() + retry_after)
+
+
+class RateGovernor:
+    """
+    Per-host request pacing shared by every HTTP client, instead of fixed
+    sleeps. Hosts without a policy get the default one.
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, HostPolicy] | None = None,
+        default_policy: HostPolicy | None = None,
+    ) -> None:
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.default_policy = default_policy or HostPolicy()
+        self.limiters: dict[str, HostLimiter] = {}
+        self._lock = threading.Lock()
+
+    def set_policy(self, host: str, policy: HostPolicy) -> None:
+        """Replace the policy of a host, starting again from its rate."""
+        with self._lock:
+            self.policies[host] = policy
+            self.limiters.pop(host, None)
+
+    def configure(self, host: str, **settings: float) -> None:
+        """Override some settings of a host policy, starting again from its rate."""
+        with self._lock:
+            policy = self.policies.get(host, self.default_policy)
+            self.policies[host] = replace(policy, **settings)
+            self.limiters.pop(host, None)
+
+    def get_limiter(self, url: str) -> HostLimiter:
+        host = get_host(url)
+        with self._lock:
+            limiter = self.limiters.get(host)
+            if limiter is None:
+                policy = self.policies.get(host, self.default_policy)
+                limiter = self.limiters[host] = HostLimiter(policy)
+            return limiter
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[Slot]:
+        """
+        Wait for a slot on the host of `url`, then record how the request went.
+        Callers set the response status on the slot, with `observe()`. A slot
+        left without status, e.g. on a connection error, counts as congestion.
+        """
+        limiter = self.get_limiter(url)
+        limiter.acquire()
+        slot = Slot()
+        start = time.monotonic()
+        try:
+            yield slot
+        finally:
+            limiter.record(slot.status, time.monotonic() - start, slot.retry_after)
+
+    def log_stats(self) -> None:
+        """Log requests and current rate per host, then reset the counters."""
+        with self._lock:
+            limiters = list(self.limiters.items())
+
+        for host, limiter in limiters:
+            if limiter.request_count:
+                logger.info(
+                    f"{host}: {limiter.request_count} request(s), "
+                    f"{limiter.congestion_count} slowdown(s), "
+                    f"now {limiter.rate:.2f} req/s"
+                )
+            limiter.request_count = 0
+            limiter.congestion_count = 0
+
+
+# Shared by module-level clients and by classes not given their own governor
+default_governor = RateGovernor()
@@ -1,29 +1,29 @@
+from __future__ import annotations
+
 import logging
 
 import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util import Retry
+
+from utils.rate_governor import CONGESTION_STATUSES, RateGovernor, default_governor
 
 logger = logging.getLogger(__name__)
 
+# Attempts after the first one, on a congestion status or a connection error
+RETRY_COUNT = 3
 
-def get_request(url: str, params: dict = {}) -> requests.Response | None:
+
+def get_request(
+    url: str, params: dict = {}, governor: RateGovernor | None = None
+) -> requests.Response | None:
     """
     Make a GET request to the specified URL with retry logic.
+
+    Every attempt takes its own slot from the rate governor, so each failure
+    slows the host down and the retries are spaced by it, honoring Retry-After.
     """
+    governor = governor or default_governor
     session = requests.Session()
 
-    retry = Retry(
-        total=3,
-        backoff_factor=1,
-        status_forcelist=[500, 502, 503, 504],
-        allowed_methods=["GET", "POST"],
-    )
-
-    adapter = HTTPAdapter(max_retries=retry)
-    session.mount("http://", adapter)
-    session.mount("https://", adapter)
-
     headers = {
         "User-Agent": (
             "Mozilla/5.0 (Macintosh; Intel Mac OS X 13_3) "
@@ -31,10 +31,24 @@ def get_request(url: str, params: dict = {}) -> requests.Response | None:
             "Version/16.3 Safari/605.1.15"
         )
     }
-    try:
-        response = session.get(url, headers=headers, params=params)
-        response.raise_for_status()
-        return response
-    except requests.exceptions.HTTPError as e:
-        logger.error(f"{e}")
-        return None
+    for attempt in range(RETRY_COUNT + 1):
+        is_last = attempt == RETRY_COUNT
+        try:
+            with governor.slot(url) as slot:
+                response = session.get(url, headers=headers, params=params)
+                slot.observe(response)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            if is_last:
+                raise
+            continue
+
+        if response.status_code in CONGESTION_STATUSES and not is_last:
+            continue
+
+        try:
+            response.raise_for_status()
+            return response
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"{e}")
+            return None
+    return None
@@ -0,0 +1,70 @@
+from collections.abc import Callable
+from difflib import SequenceMatcher
+
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:  # optional dependency, the bit-parallel fallback is exact
+    Indel = None
+
+SimilarityFunc = Callable[[str, str], float]
+
+
+def difflib_ratio(s1: str, s2: str) -> float:
+    """Reference ratio: 2 * M / T with M the blocks matched by SequenceMatcher."""
+    return SequenceMatcher(None, s1, s2).ratio()
+
+
+def indel_ratio(s1: str, s2: str) -> float:
+    """
+    Normalized Indel similarity: 2 * LCS / T. Same scale as difflib_ratio and
+    never below it, since SequenceMatcher's greedy matches are a common
+    subsequence. Uses rapidfuzz when installed.
+    """
+    if Indel is not None:
+        return Indel.normalized_similarity(s1, s2)
+    return _bit_parallel_indel_ratio(s1, s2)
+
+
+def _bit_parallel_indel_ratio(s1: str, s2: str) -> float:
+    if not s1 and not s2:
+        return 1.0
+    if not s1 or not s2:
+        return 0.0
+
+    # Allison-Dix bit-parallel LCS: one big-int pass per character of s1
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    masks: dict[str, int] = {}
+    for i, ch in enumerate(s2):
+        masks[ch] = masks.get(ch, 0) | (1 << i)
+
+    full = (1 << len(s2)) - 1
+    v = full
+    for ch in s1:
+        u = v & masks.get(ch, 0)
+        v = ((v + u) | (v - u)) & full
+
+    lcs = len(s2) - v.bit_count()
+    return 2 * lcs / (len(s1) + len(s2))
+
+
+ENGINES: dict[str, SimilarityFunc] = {
+    "difflib": difflib_ratio,
+    "indel": indel_ratio,
+}
+
+_engine: SimilarityFunc = indel_ratio
+
+
+def set_similarity_engine(name: str) -> None:
+    global _engine
+    if name not in ENGINES:
+        raise ValueError(
+            f"Unknown similarity engine {name!r}, expected {list(ENGINES)}"
+        )
+    _engine = ENGINES[name]
+
+
+def ratio(s1: str, s2: str) -> float:
+    """Similarity in [0, 1] of two already normalized strings."""
+    return _engine(s1, s2)
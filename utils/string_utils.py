@@ -1,6 +1,5 @@
-import unicodedata
-from difflib import SequenceMatcher
-from string import punctuation
+from utils import normalization
+from utils.similarity import ratio
 
 
 def are_match(s1: str, s2: str) -> bool:
@@ -18,11 +17,11 @@ def is_included(s1: str, s2: str) -> bool:
 
 
 def get_similarity(s1: str, s2: str) -> float:
-    return SequenceMatcher(None, normalize(s1), normalize(s2)).ratio()
+    return ratio(normalize(s1), normalize(s2))
 
 
 def normalize(s: str) -> str:
-    return remove_punctuation(remove_accents(s)).lower().strip()
+    return normalization.compact(s)
 
 
 def soft_normalize(s: str) -> str:
@@ -30,13 +29,7 @@ def soft_normalize(s: str) -> str:
 
 
 def remove_punctuation(s: str) -> str:
-    return (
-        s.translate(str.maketrans("", "", punctuation))
-        .replace("’", "")
-        .replace("'", "")
-        .replace("`", "")
-        .replace(" ", "")
-    )
+    return normalization.remove_punctuation(s)
 
 
 def remove_special_characters(s: str) -> str:
@@ -44,5 +37,4 @@ def remove_special_characters(s: str) -> str:
 
 
 def remove_accents(text: str) -> str:
-    normalized = unicodedata.normalize("NFD", text)
-    return "".join(c for c in normalized if unicodedata.category(c) != "Mn")
+    return normalization.remove_accents(text)
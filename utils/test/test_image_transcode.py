@@ -0,0 +1,55 @@
+import unittest
+
+from utils import image_transcode
+from utils.image_transcode import fit_size
+
+
+class TestFitSize(unittest.TestCase):
+    def test_shrinks_to_limiting_side(self):
+        self.assertEqual(fit_size(4320, 3240, 1920, 1080), (1440, 1080))
+        self.assertEqual(fit_size(2000, 3000, 1000, 2000), (1000, 1500))
+
+    def test_never_enlarges(self):
+        self.assertEqual(fit_size(800, 600, 1920, 1080), (800, 600))
+
+
+@unittest.skipUnless(image_transcode.is_available(), "Pillow is not installed")
+class TestTranscode(unittest.TestCase):
+    @staticmethod
+    def encode(mode: str, size: tuple[int, int], format: str) -> bytes:
+        from io import BytesIO
+
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new(mode, size, "red").save(buffer, format)
+        return buffer.getvalue()
+
+    def test_jpeg_is_resized(self):
+        from io import BytesIO
+
+        from PIL import Image
+
+        content = self.encode("RGB", (4320, 3240), "JPEG")
+        transcoded = image_transcode.transcode(content, 1920, 1080, 80)
+
+        with Image.open(BytesIO(transcoded)) as image:
+            self.assertEqual((image.format, image.size), ("JPEG", (1440, 1080)))
+
+    def test_transparent_logo_stays_png(self):
+        from io import BytesIO
+
+        from PIL import Image
+
+        content = self.encode("RGBA", (1600, 620), "PNG")
+        transcoded = image_transcode.transcode(content, 800, 310, 80)
+
+        with Image.open(BytesIO(transcoded)) as image:
+            self.assertEqual((image.format, image.mode), ("PNG", "RGBA"))
+
+    def test_not_an_image(self):
+        self.assertIsNone(image_transcode.transcode(b"<html></html>", 10, 10, 80))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+
+from client.google.utils import norm_text
+from tools.benchmark_normalization import legacy_norm_text, legacy_normalize, load_texts
+from utils import normalization
+from utils.string_utils import normalize
+
+EDGE_CASES = [
+    "",
+    "  L’ombre d’Emily 2 ",
+    "Tom &amp; Jerry",
+    "Kill Bill:\tVolume 1",
+    "Amélie Poulain",
+    "Ｆｕｌｌｗｉｄｔｈ Title",
+    "Æon Flux — 2005",
+    "Spider-Man: Across the Spider-Verse",
+    "Fabrício Bittar",
+    "`Backtick` 'quote'",
+]
+
+
+class TestNormalization(unittest.TestCase):
+    def setUp(self):
+        normalization.clear_caches()
+
+    def test_normalize_matches_previous_implementation(self):
+        for text in EDGE_CASES + load_texts():
+            self.assertEqual(normalize(text), legacy_normalize(text), text)
+
+    def test_norm_text_matches_previous_implementation(self):
+        for text in EDGE_CASES + load_texts():
+            self.assertEqual(norm_text(text), legacy_norm_text(text), text)
+
+    def test_norm_text_accepts_none(self):
+        self.assertEqual(norm_text(None), "")
+
+    def test_memoization_is_bounded(self):
+        for i in range(normalization.CACHE_SIZE + 10):
+            normalization.words(f"title {i}")
+
+        info = normalization.words.cache_info()
+        self.assertEqual(info.currsize, normalization.CACHE_SIZE)
+
+        normalization.words("title 5000")
+        self.assertEqual(normalization.words.cache_info().hits, info.hits + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from utils import perceptual_hash
+from utils.perceptual_hash import dhash, hamming_distance
+
+
+def gradient(increasing: bool) -> list[int]:
+    row = list(range(0, 90, 10))
+    return (row if increasing else row[::-1]) * 8
+
+
+class TestDHash(unittest.TestCase):
+    def test_brightness_increases_everywhere(self):
+        self.assertEqual(dhash(gradient(True)), 2**64 - 1)
+
+    def test_brightness_decreases_everywhere(self):
+        self.assertEqual(dhash(gradient(False)), 0)
+
+    def test_uniform_shift_keeps_hash(self):
+        pixels = [(i * 37) % 256 for i in range(72)]
+        brighter = [min(255, p + 20) for p in pixels]
+        self.assertLessEqual(hamming_distance(dhash(pixels), dhash(brighter)), 8)
+
+    def test_wrong_pixel_count(self):
+        with self.assertRaises(ValueError):
+            dhash([0] * 64)
+
+    def test_hamming_distance(self):
+        self.assertEqual(hamming_distance(0b1011, 0b0001), 2)
+
+
+@unittest.skipUnless(perceptual_hash.is_available(), "Pillow is not installed")
+class TestImageDHash(unittest.TestCase):
+    def test_resized_image_has_close_hash(self):
+        from io import BytesIO
+
+        from PIL import Image
+
+        def encode(size: tuple[int, int]) -> bytes:
+            image = Image.linear_gradient("L").resize(size).convert("RGB")
+            buffer = BytesIO()
+            image.save(buffer, "JPEG")
+            return buffer.getvalue()
+
+        large = perceptual_hash.image_dhash(encode((400, 600)))
+        small = perceptual_hash.image_dhash(encode((40, 60)))
+        self.assertLessEqual(hamming_distance(large, small), 6)
+
+    def test_not_an_image(self):
+        self.assertIsNone(perceptual_hash.image_dhash(b"<html></html>"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+from utils.rate_governor import (
+    PLEX_POLICY,
+    HostLimiter,
+    HostPolicy,
+    RateGovernor,
+    get_host,
+)
+
+
+class TestHostLimiter(unittest.TestCase):
+    def setUp(self):
+        self.policy = HostPolicy(
+            rate=2.0, min_rate=0.5, max_rate=3.0, increase=0.5, decrease=0.5
+        )
+        self.limiter = HostLimiter(self.policy)
+
+    def test_additive_increase_up_to_max_rate(self):
+        for expected in (2.5, 3.0, 3.0):
+            self.limiter.record(200, 0.1)
+            self.assertEqual(self.limiter.rate, expected)
+
+    def test_multiplicative_decrease_down_to_min_rate(self):
+        for status, expected in ((429, 1.0), (503, 0.5), (None, 0.5)):
+            self.limiter.record(status, 0.1)
+            self.assertEqual(self.limiter.rate, expected)
+        self.assertEqual(self.limiter.congestion_count, 3)
+
+    def test_slow_response_is_congestion(self):
+        self.limiter.record(200, self.policy.latency_target_s + 1)
+        self.assertEqual(self.limiter.rate, 1.0)
+
+    def test_client_errors_do_not_slow_down(self):
+        self.limiter.record(404, 0.1)
+        self.assertEqual(self.limiter.rate, 2.5)
+
+    @patch("utils.rate_governor.time")
+    def test_acquire_spaces_requests_at_rate(self, time_mock):
+        time_mock.monotonic.return_value = 100.0
+
+        self.limiter.acquire()
+        time_mock.sleep.assert_not_called()
+
+        self.limiter.acquire()
+        time_mock.sleep.assert_called_once_with(0.5)
+
+    @patch("utils.rate_governor.time")
+    def test_retry_after_holds_next_slot(self, time_mock):
+        time_mock.monotonic.return_value = 100.0
+
+        self.limiter.record(429, 0.1, retry_after=5.0)
+        self.limiter.acquire()
+
+        time_mock.sleep.assert_called_once_with(5.0)
+
+
+class TestRateGovernor(unittest.TestCase):
+    def setUp(self):
+        unlimited = HostPolicy(rate=float("inf"), max_rate=float("inf"))
+        self.governor = RateGovernor(
+            {"api.example.com": HostPolicy(rate=1.0)}, default_policy=unlimited
+        )
+
+    def test_one_limiter_per_host(self):
+        limiter = self.governor.get_limiter("https://api.example.com/a?b=1")
+
+        self.assertIs(self.governor.get_limiter("https://api.example.com/c"), limiter)
+        self.assertEqual(limiter.policy.rate, 1.0)
+        self.assertEqual(
+            self.governor.get_limiter("http://other.example.com/").policy.rate,
+            float("inf"),
+        )
+
+    def test_slot_records_observed_response(self):
+        response = MagicMock(status_code=503, headers={"Retry-After": "2"})
+
+        with self.governor.slot("https://other.example.com/x") as slot:
+            slot.observe(response)
+
+        self.assertEqual((slot.status, slot.retry_after), (503, 2.0))
+        limiter = self.governor.get_limiter("https://other.example.com")
+        self.assertEqual(limiter.congestion_count, 1)
+
+    def test_failed_request_counts_as_congestion(self):
+        with self.assertRaises(ConnectionError):
+            with self.governor.slot("https://other.example.com/x"):
+                raise ConnectionError()
+
+        limiter = self.governor.get_limiter("https://other.example.com")
+        self.assertEqual(limiter.congestion_count, 1)
+
+    def test_configure_overrides_settings_and_restarts(self):
+        limiter = self.governor.get_limiter("https://api.example.com")
+        limiter.rate = 0.2
+
+        self.governor.configure("api.example.com", max_rate=2.0)
+
+        limiter = self.governor.get_limiter("https://api.example.com")
+        self.assertEqual((limiter.rate, limiter.policy.max_rate), (1.0, 2.0))
+
+    def test_plex_policy_ignores_slow_uploads(self):
+        self.governor.set_policy("plex.local:32400", PLEX_POLICY)
+
+        limiter = self.governor.get_limiter("http://plex.local:32400/library")
+        limiter.record(200, 30.0)
+
+        self.assertIs(limiter.policy, PLEX_POLICY)
+        self.assertEqual(limiter.congestion_count, 0)
+
+    def test_get_host(self):
+        self.assertEqual(get_host("https://tv.apple.com/us/movie/x"), "tv.apple.com")
+        self.assertEqual(get_host("tv.apple.com"), "tv.apple.com")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from utils.rate_governor import HostPolicy, RateGovernor
+from utils.requests_utils import RETRY_COUNT, get_request
+
+URL = "https://example.com/page"
+
+
+def make_response(status: int) -> MagicMock:
+    response = MagicMock(status_code=status, headers={})
+    if status >= 400:
+        response.raise_for_status.side_effect = requests.exceptions.HTTPError(status)
+    return response
+
+
+class TestGetRequest(unittest.TestCase):
+    def setUp(self):
+        self.governor = RateGovernor(
+            {}, HostPolicy(rate=float("inf"), max_rate=float("inf"))
+        )
+        patcher = patch("utils.requests_utils.requests.Session.get")
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_congestion_is_retried_in_new_slots(self):
+        self.get.side_effect = [make_response(503), make_response(200)]
+
+        response = get_request(URL, governor=self.governor)
+
+        self.assertEqual(response.status_code, 200)
+        limiter = self.governor.get_limiter(URL)
+        self.assertEqual(limiter.request_count, 2)
+        self.assertEqual(limiter.congestion_count, 1)
+
+    def test_gives_up_after_retries(self):
+        self.get.side_effect = [make_response(429)] * (RETRY_COUNT + 1)
+
+        with self.assertLogs("utils.requests_utils", "ERROR"):
+            self.assertIsNone(get_request(URL, governor=self.governor))
+        self.assertEqual(self.get.call_count, RETRY_COUNT + 1)
+
+    def test_client_error_is_not_retried(self):
+        self.get.return_value = make_response(404)
+
+        with self.assertLogs("utils.requests_utils", "ERROR"):
+            self.assertIsNone(get_request(URL, governor=self.governor))
+        self.get.assert_called_once()
+
+    def test_connection_error_raised_after_retries(self):
+        self.get.side_effect = requests.exceptions.ConnectionError("down")
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            get_request(URL, governor=self.governor)
+        self.assertEqual(self.get.call_count, RETRY_COUNT + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
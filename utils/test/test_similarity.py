@@ -0,0 +1,53 @@
+import random
+import unittest
+
+from utils import similarity
+from utils.similarity import (
+    _bit_parallel_indel_ratio,
+    difflib_ratio,
+    indel_ratio,
+    set_similarity_engine,
+)
+
+
+def lcs_length(s1: str, s2: str) -> int:
+    previous = [0] * (len(s2) + 1)
+    for ch1 in s1:
+        current = [0]
+        for j, ch2 in enumerate(s2):
+            current.append(
+                previous[j] + 1 if ch1 == ch2 else max(previous[j + 1], current[j])
+            )
+        previous = current
+    return previous[-1]
+
+
+class TestSimilarity(unittest.TestCase):
+    def test_bit_parallel_ratio_matches_lcs(self):
+        rng = random.Random(0)
+        for _ in range(500):
+            s1 = "".join(rng.choice("abcé ") for _ in range(rng.randint(1, 40)))
+            s2 = "".join(rng.choice("abcé ") for _ in range(rng.randint(1, 80)))
+            expected = 2 * lcs_length(s1, s2) / (len(s1) + len(s2))
+            self.assertAlmostEqual(_bit_parallel_indel_ratio(s1, s2), expected)
+
+    def test_indel_ratio_is_never_below_difflib(self):
+        pairs = [("sonic3lefilm", "soniclefilm3"), ("jonmchu", "jonchu"), ("", "air")]
+        for s1, s2 in pairs:
+            self.assertGreaterEqual(indel_ratio(s1, s2), difflib_ratio(s1, s2))
+
+    def test_empty_strings(self):
+        self.assertEqual(_bit_parallel_indel_ratio("", ""), 1.0)
+        self.assertEqual(_bit_parallel_indel_ratio("", "air"), 0.0)
+
+    def test_set_similarity_engine(self):
+        self.addCleanup(set_similarity_engine, "indel")
+
+        set_similarity_engine("difflib")
+        self.assertIs(similarity._engine, difflib_ratio)
+        with self.assertRaises(ValueError):
+            set_similarity_engine("jaro")
+
+
+if __name__ == "__main__":
+    unittest.main()